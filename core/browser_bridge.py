@@ -6,12 +6,15 @@ Runs on ws://localhost:7777. Provides synchronous API for agent tools.
 """
 
 import asyncio
+import base64
 import json
 import threading
 import time
 import uuid
+from concurrent.futures import Future
 import structlog
 import os
+from collections import OrderedDict
 from typing import Optional, Any
 
 logger = structlog.get_logger()
@@ -20,6 +23,21 @@ DEFAULT_HOST = os.getenv("ARKA_BRIDGE_HOST", "127.0.0.1")
 DEFAULT_PORT = int(os.getenv("ARKA_BRIDGE_PORT", "7777"))
 COMMAND_TIMEOUT = 30  # seconds
 
+# Read-only commands whose successful results are reused for READ_CACHE_TTL
+# seconds. Any other command may change the page and clears the cache.
+CACHED_ACTIONS = frozenset({"get_dom", "get_text", "get_elements", "list_tabs"})
+READ_CACHE_TTL = 2.0  # seconds
+
+# Decoded screenshots kept for chrome_save_screenshot; oldest are dropped.
+MAX_SCREENSHOTS = 8
+
+# Returned by send_command() without touching the socket when no extension
+# is attached, so callers fail fast instead of waiting out a timeout.
+NOT_CONNECTED_ERROR = (
+    "Chrome extension not connected. Ensure Chrome is running and the ARKA extension "
+    "is installed/enabled. This bridge does not control other browsers (e.g. Comet)."
+)
+
 
 class BrowserBridge:
     """
@@ -41,6 +59,15 @@ class BrowserBridge:
         self._auth_waiting = False
         self._auth_url = None
         self._started_event = threading.Event()
+        # Set while an extension is connected; waiters block on it instead of polling.
+        self._connected_evt = threading.Event()
+        # (action, params) key -> (timestamp, result) for CACHED_ACTIONS,
+        # plus the reads currently on the wire so identical ones share a reply.
+        self._read_cache: dict[tuple, tuple[float, dict]] = {}
+        self._inflight: dict[tuple, Future] = {}
+        self._cache_lock = threading.Lock()
+        self._screenshots: "OrderedDict[str, bytes]" = OrderedDict()
+        self._status_cached: tuple[tuple, str] = ((), "")
         self._start_error: Optional[str] = None
 
     # ─── Lifecycle ────────────────────────────────────────────────────
@@ -99,6 +126,8 @@ class BrowserBridge:
 
         self.connected = False
         self.extension_ws = None
+        self._connected_evt.clear()
+        self._clear_read_cache()
         self._auth_waiting = False
         self._auth_url = None
 
@@ -153,6 +182,7 @@ class BrowserBridge:
         """Handle a single extension connection."""
         self.extension_ws = websocket
         self.connected = True
+        self._connected_evt.set()
         logger.info("extension_connected")
 
         try:
@@ -165,6 +195,8 @@ class BrowserBridge:
         except Exception as e:
             logger.info("extension_disconnected", reason=str(e))
         finally:
+            self._connected_evt.clear()
+            self._clear_read_cache()
             self.connected = False
             self.extension_ws = None
 
@@ -205,6 +237,63 @@ class BrowserBridge:
             self._auth_url = None
             return {"status": "ok", "message": "Resumed after authentication."}
 
+        blocked = self._blocked_result()
+        if blocked:
+            return blocked
+        if action in CACHED_ACTIONS:
+            return self._cached_read(action, params, timeout)
+        self._clear_read_cache()
+        return self._run_requests([(action, params)], timeout)[0]
+
+    def send_commands(self, commands: list, timeout: int = COMMAND_TIMEOUT) -> list:
+        """
+        Send several (action, params) commands at once and wait for all results.
+
+        The messages go out back to back and the extension handles them
+        concurrently, so the batch costs about one round trip instead of one
+        per command. Only batch commands that don't depend on each other.
+        """
+        blocked = self._blocked_result()
+        if blocked:
+            return [dict(blocked) for _ in commands]
+        if any(action not in CACHED_ACTIONS for action, _ in commands):
+            self._clear_read_cache()
+        return self._run_requests(commands, timeout)
+
+    def _cached_read(self, action: str, params: Optional[dict], timeout: int) -> dict:
+        """Serve a read from the short-lived cache, or share an identical in-flight one."""
+        key = (action, json.dumps(params or {}, sort_keys=True))
+        with self._cache_lock:
+            hit = self._read_cache.get(key)
+            if hit and time.monotonic() - hit[0] < READ_CACHE_TTL:
+                return dict(hit[1])
+            waiting = self._inflight.get(key)
+            if waiting is None:
+                self._inflight[key] = future = Future()
+        if waiting is not None:
+            try:
+                return dict(waiting.result(timeout + 1))
+            except Exception:
+                return {"status": "error", "error": f"Command timed out after {timeout}s"}
+
+        result = {"status": "error", "error": "Command failed"}
+        try:
+            result = self._run_requests([(action, params)], timeout)[0]
+        finally:
+            with self._cache_lock:
+                # Only cache if nothing cleared the cache while we waited.
+                if self._inflight.pop(key, None) is future and result.get("status") == "ok":
+                    self._read_cache[key] = (time.monotonic(), result)
+            future.set_result(result)
+        return dict(result)
+
+    def _clear_read_cache(self):
+        with self._cache_lock:
+            self._read_cache.clear()
+            self._inflight.clear()
+
+    def _blocked_result(self) -> Optional[dict]:
+        """The error to return instead of sending, or None if we can send."""
         # Auth waiting blocks all other commands
         if self._auth_waiting:
             return {
@@ -215,51 +304,69 @@ class BrowserBridge:
         if not self.connected or not self.extension_ws:
             return {
                 "status": "error",
-                "error": "Chrome extension not connected. Ensure Chrome is running and the ARKA extension is installed/enabled. This bridge does not control other browsers (e.g. Comet)."
+                "error": NOT_CONNECTED_ERROR
             }
+        return None
 
-        msg_id = str(uuid.uuid4())[:8]
-        message = json.dumps({
-            "id": msg_id,
-            "action": action,
-            "params": params or {}
-        })
+    def _run_requests(self, commands: list, timeout: int) -> list:
+        """Run requests on the event loop thread and block until all are answered."""
+        async def _gather():
+            return await asyncio.gather(*(
+                self._request(action, params, timeout) for action, params in commands
+            ))
 
         try:
-            future = self._loop.create_future()
-            self._pending[msg_id] = future
-
-            # Send message from the event loop thread
-            asyncio.run_coroutine_threadsafe(
-                self.extension_ws.send(message),
-                self._loop
-            )
+            # Each request enforces its own timeout; the margin only guards
+            # against the loop going away underneath us.
+            results = asyncio.run_coroutine_threadsafe(_gather(), self._loop).result(timeout + 1)
+        except Exception as e:
+            error = str(e) or f"Command timed out after {timeout}s"
+            return [{"status": "error", "error": error} for _ in commands]
 
-            # Wait for response (blocking, with timeout)
-            result = self._wait_for_future(future, timeout)
-            
+        for result in results:
             # Check for auth_required in response
             if result and result.get("status") == "auth_required":
                 self._auth_waiting = True
                 self._auth_url = result.get("url", "")
-            
-            return result
+        return results
 
-        except TimeoutError:
-            self._pending.pop(msg_id, None)
+    async def _request(self, action: str, params: Optional[dict], timeout: int) -> dict:
+        """Send one command and await the reply matched to it by id."""
+        msg_id = str(uuid.uuid4())[:8]
+        message = json.dumps({
+            "id": msg_id,
+            "action": action,
+            "params": params or {}
+        })
+        future = self._loop.create_future()
+        self._pending[msg_id] = future
+        try:
+            await self.extension_ws.send(message)
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
             return {"status": "error", "error": f"Command timed out after {timeout}s"}
         except Exception as e:
-            self._pending.pop(msg_id, None)
             return {"status": "error", "error": str(e)}
+        finally:
+            self._pending.pop(msg_id, None)
 
-    def _wait_for_future(self, future: asyncio.Future, timeout: int) -> dict:
-        """Wait for an async future from the sync context."""
-        start = time.time()
-        while time.time() - start < timeout:
-            if future.done():
-                return future.result()
-            time.sleep(0.05)
-        raise TimeoutError()
+    # ─── Screenshots ──────────────────────────────────────────────────
+
+    def keep_screenshot(self, data_url: str) -> tuple[str, int]:
+        """Decode a screenshot data URL, keep the bytes, return (id, size)."""
+        data = base64.b64decode(data_url.partition(",")[2])
+        shot_id = uuid.uuid4().hex[:8]
+        with self._cache_lock:
+            self._screenshots[shot_id] = data
+            while len(self._screenshots) > MAX_SCREENSHOTS:
+                self._screenshots.popitem(last=False)
+        return shot_id, len(data)
+
+    def screenshot_bytes(self, shot_id: str) -> Optional[memoryview]:
+        """Zero-copy view of a kept screenshot's PNG bytes, or None."""
+        with self._cache_lock:
+            data = self._screenshots.get(shot_id)
+        return memoryview(data) if data is not None else None
 
     # ─── Status ───────────────────────────────────────────────────────
 
@@ -267,6 +374,10 @@ class BrowserBridge:
     def is_connected(self) -> bool:
         return self.connected and self.extension_ws is not None
 
+    def wait_for_connection(self, timeout: float) -> bool:
+        """Block until an extension connects or `timeout` seconds pass."""
+        return self._connected_evt.wait(timeout) and self.is_connected
+
     @property
     def is_auth_waiting(self) -> bool:
         return self._auth_waiting
@@ -281,6 +392,16 @@ class BrowserBridge:
             "last_error": self._start_error,
         }
 
+    def status_json(self) -> str:
+        """status() as indented JSON, re-serialized only when a field changed."""
+        status = self.status()
+        key = tuple(status.values())
+        cached_key, text = self._status_cached
+        if key != cached_key:
+            text = json.dumps(status, indent=2)
+            self._status_cached = (key, text)
+        return text
+
 
 # ─── Singleton ────────────────────────────────────────────────────────
 browser_bridge = BrowserBridge()
@@ -10,23 +10,38 @@ you're doing right now without you telling it.
 """
 
 import subprocess
+import time
 import structlog
 
 logger = structlog.get_logger()
 
+# Seconds a context reading stays fresh. Each reading costs two osascript
+# forks, and the engine asks for one on every turn.
+CONTEXT_TTL = 2.0
+
 
 class ContextSensor:
     """Reads the user's current desktop state via AppleScript."""
 
+    def __init__(self, ttl: float = CONTEXT_TTL):
+        self.ttl = ttl
+        self._cached = None
+        self._cached_at = 0.0
+
     def get_context(self) -> dict:
         """
         Returns a dict with current context information.
         Gracefully falls back to unknowns on any failure.
+        Readings younger than `ttl` seconds are reused.
         """
-        return {
-            "frontmost_app": self._get_frontmost_app(),
-            "window_title": self._get_window_title(),
-        }
+        now = time.monotonic()
+        if self._cached is None or now - self._cached_at >= self.ttl:
+            self._cached = {
+                "frontmost_app": self._get_frontmost_app(),
+                "window_title": self._get_window_title(),
+            }
+            self._cached_at = now
+        return dict(self._cached)
 
     def _run_osascript(self, script: str) -> str:
         """Execute an AppleScript and return stdout."""
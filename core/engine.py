@@ -52,9 +52,9 @@ class ArkaEngine(CodeAgent):
         from tools.mcp_tools import list_mcp_tools, call_mcp_tool
         from tools.goal_tools import set_goal, list_goals, advance_goal, complete_goal
         from tools.chrome_tools import (
-            chrome_navigate, chrome_status, chrome_wait_for_connection, chrome_click, chrome_click_at, chrome_focus, chrome_press_key, chrome_wait_for_selector, chrome_type, chrome_scroll, chrome_verify_text,
-            chrome_screenshot, chrome_get_dom, chrome_get_text, chrome_get_elements,
-            chrome_list_tabs, chrome_new_tab, chrome_switch_tab, chrome_continue
+            chrome_navigate, chrome_status, chrome_wait_for_connection, chrome_click, chrome_click_at, chrome_focus, chrome_press_key, chrome_wait_for_selector, chrome_wait_any, chrome_type, chrome_scroll, chrome_verify_text,
+            chrome_screenshot, chrome_save_screenshot, chrome_get_dom, chrome_get_text, chrome_get_elements,
+            chrome_list_tabs, chrome_new_tab, chrome_switch_tab, chrome_batch, chrome_continue
         )
         
         # We start with a basic toolset + God Mode tools
@@ -80,9 +80,9 @@ class ArkaEngine(CodeAgent):
             memory_stats,
             list_mcp_tools, call_mcp_tool,
             set_goal, list_goals, advance_goal, complete_goal,
-            chrome_navigate, chrome_status, chrome_wait_for_connection, chrome_click, chrome_click_at, chrome_focus, chrome_press_key, chrome_wait_for_selector, chrome_type, chrome_scroll, chrome_verify_text,
-            chrome_screenshot, chrome_get_dom, chrome_get_text, chrome_get_elements,
-            chrome_list_tabs, chrome_new_tab, chrome_switch_tab, chrome_continue
+            chrome_navigate, chrome_status, chrome_wait_for_connection, chrome_click, chrome_click_at, chrome_focus, chrome_press_key, chrome_wait_for_selector, chrome_wait_any, chrome_type, chrome_scroll, chrome_verify_text,
+            chrome_screenshot, chrome_save_screenshot, chrome_get_dom, chrome_get_text, chrome_get_elements,
+            chrome_list_tabs, chrome_new_tab, chrome_switch_tab, chrome_batch, chrome_continue
         ]
         agent_tools = base_tools + god_mode_tools
         
@@ -124,6 +124,7 @@ class ArkaEngine(CodeAgent):
            - Use system_click/system_type only as a fallback when chrome_* is unavailable.
            - If the user mentions "browser", "tab", "YouTube", or "website", prefer chrome_* tools over music_control/system_*.
            - After launching Chrome, call chrome_wait_for_connection() before DOM actions.
+           - To read several things that don't depend on each other (e.g. texts of multiple selectors), use one chrome_batch call.
            - Do NOT claim success unless a follow-up check verifies it (e.g., chrome_wait_for_selector on expected results, or chrome_get_text/URL contains expected content).
            - If a chrome_* call returns an error, stop and report it.
            - Do not print raw DOM/text dumps. Keep responses concise.
@@ -218,6 +219,11 @@ These are lessons learned from past sessions. Apply them.
         
         logger.info("ArkaEngine_Initialized", model=model_router.executor_id, tools=len(agent_tools))
 
+    @property
+    def tool_names(self):
+        """Registered tool names, as a live set-like view (O(1) membership)."""
+        return self.tools.keys()
+
     def _build_system_prompt(self, base_prompt: str) -> str:
         """Compose the final system prompt with memory, learnings, and goals."""
         user_context = self.semantic_memory.get_profile()
@@ -238,6 +244,11 @@ These are lessons learned from past sessions. Apply them.
         goals_injection = self.goal_manager.format_for_prompt()
         return base_prompt + memory_injection + learnings_injection + goals_injection + self._base_prompt_suffix
 
+    def reload_memory(self) -> None:
+        """Re-read profile, learnings and goals into the current system prompt."""
+        base = self._base_prompt_coding if self.mode == "coding" else self._base_prompt_default
+        self.prompt_templates["system_prompt"] = self._build_system_prompt(base)
+
     def set_mode(self, mode: str) -> str:
         """Switch agent mode and update model/system prompt."""
         mode = (mode or "").strip().lower()
@@ -251,13 +262,13 @@ These are lessons learned from past sessions. Apply them.
         if mode == "coding":
             if model_router and getattr(model_router, "coding_executor", None):
                 self.model = model_router.coding_executor
-            self.prompt_templates["system_prompt"] = self._build_system_prompt(self._base_prompt_coding)
+            self.reload_memory()
             return "Coding mode enabled."
 
         # default mode
         if model_router and getattr(model_router, "executor", None):
             self.model = model_router.executor
-        self.prompt_templates["system_prompt"] = self._build_system_prompt(self._base_prompt_default)
+        self.reload_memory()
         return "Default mode enabled."
 
     def _route_task(self, task: str) -> dict:
@@ -41,6 +41,10 @@ class MCPBridge:
     def __init__(self):
         self._servers: dict[str, dict] = {}  # name -> {session, params, ...}
         self._tools_cache: list[dict] = []
+        # Tool name -> first server exposing it, so calls skip the scan.
+        self._tool_servers: dict[str, str] = {}
+        # Bumped whenever _tools_cache changes; lets callers cache derived text.
+        self.tools_version = 0
         self._loop: Optional[asyncio.AbstractEventLoop] = None
         self._thread: Optional[threading.Thread] = None
         self._exit_stack: Optional[AsyncExitStack] = None
@@ -126,6 +130,8 @@ class MCPBridge:
                 "description": tool.description,
                 "input_schema": tool.inputSchema,
             })
+            self._tool_servers.setdefault(tool.name, server_name)
+        self.tools_version += 1
 
         logger.info(
             "mcp_server_connected",
@@ -155,20 +161,19 @@ class MCPBridge:
     async def _async_call_tool(self, tool_name: str, arguments: dict) -> str:
         """Async implementation of call_tool."""
         # Find which server has this tool
-        for server_name, server_info in self._servers.items():
-            tool_names = [t.name for t in server_info["tools"]]
-            if tool_name in tool_names:
-                result = await server_info["session"].call_tool(tool_name, arguments)
-                # Extract text content from result
-                content_parts = []
-                for item in result.content:
-                    if hasattr(item, 'text'):
-                        content_parts.append(item.text)
-                    else:
-                        content_parts.append(str(item))
-                return "\n".join(content_parts)
-
-        raise ValueError(f"Tool '{tool_name}' not found on any connected MCP server.")
+        server_name = self._tool_servers.get(tool_name)
+        if server_name is None:
+            raise ValueError(f"Tool '{tool_name}' not found on any connected MCP server.")
+
+        result = await self._servers[server_name]["session"].call_tool(tool_name, arguments)
+        # Extract text content from result
+        content_parts = []
+        for item in result.content:
+            if hasattr(item, 'text'):
+                content_parts.append(item.text)
+            else:
+                content_parts.append(str(item))
+        return "\n".join(content_parts)
 
     # ─── Cleanup ──────────────────────────────────────────────────────
 
@@ -189,8 +194,18 @@ class MCPBridge:
         if self._thread:
             self._thread.join(timeout=3)
         
+        # Drop the stopped loop (and its selector fds) so a disconnected
+        # bridge holds nothing; _ensure_loop() builds a fresh one on reuse.
+        if not (self._thread and self._thread.is_alive()):
+            self._loop.close()
+        self._loop = None
+        self._thread = None
+        self._exit_stack = None
+        
         self._servers.clear()
         self._tools_cache.clear()
+        self._tool_servers.clear()
+        self.tools_version += 1
         self._started = False
         logger.info("mcp_bridge_shutdown")
 
@@ -1,10 +1,15 @@
 import os
 import datetime
+from memory.config import DEFAULT_PROFILE_PATH
 from memory.store import memory_store
 
 class MemoryManager:
-    def __init__(self, profile_path="memory/user_profile.md"):
+    def __init__(self, profile_path=DEFAULT_PROFILE_PATH):
         self.profile_path = profile_path
+        # Profile text as last read/written, keyed by the file's mtime so
+        # external writers (PatternLearner, tests) still invalidate it.
+        self._profile_cache = None
+        self._profile_mtime = None
         self._ensure_exists()
 
     def _ensure_exists(self):
@@ -15,8 +20,17 @@ class MemoryManager:
 
     def get_profile(self) -> str:
         """Reads the full user profile."""
-        with open(self.profile_path, "r") as f:
-            return f.read()
+        try:
+            mtime = os.stat(self.profile_path).st_mtime_ns
+        except FileNotFoundError:
+            # Deleted since __init__ (long-lived managers outlive test cleanup).
+            self._ensure_exists()
+            mtime = os.stat(self.profile_path).st_mtime_ns
+        if self._profile_cache is None or mtime != self._profile_mtime:
+            with open(self.profile_path, "r") as f:
+                self._profile_cache = f.read()
+            self._profile_mtime = mtime
+        return self._profile_cache
 
     def append_fact(self, fact: str) -> str:
         """Appends a new fact with a timestamp."""
@@ -27,6 +41,9 @@ class MemoryManager:
         # For robustness, we just append to end for now
         with open(self.profile_path, "a") as f:
             f.write(entry)
+        # Re-read on the next get_profile rather than patching a possibly
+        # stale cache.
+        self._profile_mtime = None
         # Also store in unified memory store (non-upsert to preserve history)
         memory_store.insert_fact(
             subject="user",
@@ -36,3 +53,15 @@ class MemoryManager:
         )
             
         return f"Memory updated: {entry.strip()}"
+
+    def remove_facts(self, marker: str) -> int:
+        """Removes every profile line containing `marker`. Returns count removed."""
+        lines = self.get_profile().splitlines(keepends=True)
+        kept = [line for line in lines if marker not in line]
+        removed = len(lines) - len(kept)
+        if removed:
+            self._profile_cache = "".join(kept)
+            with open(self.profile_path, "w") as f:
+                f.write(self._profile_cache)
+            self._profile_mtime = os.stat(self.profile_path).st_mtime_ns
+        return removed
@@ -18,15 +18,17 @@ from datetime import datetime
 from typing import List, Dict
 import structlog
 
+from memory.config import DEFAULT_PROFILE_PATH, DEFAULT_SESSION_DB_PATH
+
 logger = structlog.get_logger()
 
-DB_PATH = os.path.expanduser("~/.arka/memory/session_history.db")
+DB_PATH = DEFAULT_SESSION_DB_PATH
 
 
 class PatternLearner:
     """Mines session history for behavioral patterns."""
 
-    def __init__(self, db_path: str = DB_PATH, profile_path: str = "memory/user_profile.md"):
+    def __init__(self, db_path: str = DB_PATH, profile_path: str = DEFAULT_PROFILE_PATH):
         self.db_path = db_path
         self.profile_path = profile_path
 
@@ -30,6 +30,9 @@ class HeartbeatScheduler:
         self._thread = None
         self._jobs_registered = 0
         self._pulse_count = 0
+        # Signals for waiters (tests, status checks) instead of sleep-polling
+        self._first_pulse = threading.Event()
+        self._stopped = threading.Event()
 
     # ─── Job Definitions ──────────────────────────────────────────────
 
@@ -42,6 +45,7 @@ class HeartbeatScheduler:
             pulse=self._pulse_count,
             time=now.strftime("%H:%M:%S"),
         )
+        self._first_pulse.set()
 
     def _morning_briefing(self):
         """
@@ -121,11 +125,13 @@ class HeartbeatScheduler:
     def _run_loop(self):
         """The actual loop that runs in the background thread."""
         logger.info("heartbeat_started")
+        self._stopped.clear()
         while not self._stop_event.is_set():
             schedule.run_pending()
             # Sleep in small increments so we can respond to stop quickly
             self._stop_event.wait(timeout=1.0)
         logger.info("heartbeat_stopped")
+        self._stopped.set()
 
     def start(self):
         """Start the heartbeat daemon thread."""
@@ -16,10 +16,26 @@ import structlog
 
 logger = structlog.get_logger()
 
+# Keyword signals, matched as plain case-insensitive substrings.
+TONE_KEYWORDS = {
+    "has_urgency": ["asap", "urgent", "now", "quickly", "fast", "hurry"],
+    "has_politeness": ["please", "thanks", "thank you", "could you", "would you"],
+    "has_frustration": ["why isn't", "doesn't work", "broken", "failed", "error", "wrong"],
+    "has_greeting": ["hey", "hi", "hello", "good morning", "what's up"],
+}
+
 
 class ToneAdapter:
     """Detects user tone and generates adaptive response directives."""
 
+    def __init__(self):
+        # One precompiled alternation per signal, so each is a single scan of
+        # the message with no lowercased copy.
+        self._keyword_res = {
+            signal: re.compile("|".join(map(re.escape, words)), re.IGNORECASE)
+            for signal, words in TONE_KEYWORDS.items()
+        }
+
     def detect_tone(self, message: str) -> str:
         """
         Analyze a user message and return a tone directive string
@@ -33,12 +49,10 @@ class ToneAdapter:
             "has_exclamation": "!" in message,
             "has_question": "?" in message,
             "has_ellipsis": "..." in message,
-            "all_caps_ratio": sum(1 for c in message if c.isupper()) / max(len(message), 1),
-            "has_urgency": any(w in message.lower() for w in ["asap", "urgent", "now", "quickly", "fast", "hurry"]),
-            "has_politeness": any(w in message.lower() for w in ["please", "thanks", "thank you", "could you", "would you"]),
-            "has_frustration": any(w in message.lower() for w in ["why isn't", "doesn't work", "broken", "failed", "error", "wrong"]),
-            "has_greeting": any(w in message.lower() for w in ["hey", "hi", "hello", "good morning", "what's up"]),
+            "all_caps_ratio": sum(map(str.isupper, message)) / max(len(message), 1),
         }
+        for signal, pattern in self._keyword_res.items():
+            signals[signal] = pattern.search(message) is not None
 
         # Decision tree for tone
         if signals["has_urgency"] or (signals["length"] < 15 and signals["all_caps_ratio"] > 0.5):
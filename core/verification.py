@@ -29,6 +29,7 @@ BROWSER_MARKERS = [
 
 VERIFY_CALLS = [
     "chrome_wait_for_selector",
+    "chrome_wait_any",
     "chrome_get_text",
     "chrome_get_dom",
     "chrome_get_elements",
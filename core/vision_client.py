@@ -16,13 +16,27 @@ class VisionClient:
             raise RuntimeError("ModelRouter unavailable.")
         self.model = model_router.vision
 
-    def encode_image(self, image_path: str) -> str:
-        with open(image_path, "rb") as image_file:
-            return base64.b64encode(image_file.read()).decode('utf-8')
+    def warmup(self) -> None:
+        """
+        Open the HTTPS connection to the vision endpoint ahead of the first
+        real request. Best effort: failures are only logged.
+        """
+        try:
+            self.model.client.with_options(timeout=5, max_retries=0).models.retrieve(self.model.model_id)
+        except Exception as e:
+            logger.debug("vision_warmup_failed", error=str(e))
+
+    def encode_image(self, image) -> str:
+        """Base64 of a JPEG given as a file path or as the bytes themselves."""
+        if isinstance(image, str):
+            with open(image, "rb") as image_file:
+                image = image_file.read()
+        return base64.b64encode(image).decode('utf-8')
 
-    def get_coordinates(self, image_path: str, query: str) -> tuple[int, int]:
+    def get_coordinates(self, image, query: str) -> tuple[int, int]:
         """
         Ask the Vision Model to find the (x, y) coordinates of a UI element.
+        `image` is a JPEG file path or the JPEG bytes.
         Returns: (x, y) or raises Exception.
         """
         logger.info("vision_query_start", query=query)
@@ -49,7 +63,7 @@ class VisionClient:
                     {
                         "type": "image_url",
                         "image_url": {
-                            "url": f"data:image/jpeg;base64,{self.encode_image(image_path)}"
+                            "url": f"data:image/jpeg;base64,{self.encode_image(image)}"
                         }
                     }
                 ]
@@ -84,7 +98,62 @@ class VisionClient:
             logger.error("vision_query_failed", error=str(e))
             raise e
 
-    def find_text(self, image_path: str, query: str, region_hint: str = "top section") -> dict:
+    def get_coordinates_multi(self, image, queries: list[str]) -> dict:
+        """
+        Locate several UI elements in one vision request.
+        Returns: {query: (x, y) or None if not found}.
+        """
+        logger.info("vision_multi_query_start", queries=queries)
+
+        listing = "\n".join(f"{i}. {q}" for i, q in enumerate(queries, 1))
+        prompt = f"""
+        Analyze this screenshot. Find the center coordinates (x, y) of each UI element below:
+        {listing}
+        Return JSON only, keyed by the element number, e.g.:
+        {{\"1\": [123, 456], \"2\": null}}
+        Use null for an element that is not found.
+        """
+
+        messages = [
+            {
+                "role": "user",
+                "content": [
+                    {"type": "text", "text": prompt},
+                    {
+                        "type": "image_url",
+                        "image_url": {
+                            "url": f"data:image/jpeg;base64,{self.encode_image(image)}"
+                        }
+                    }
+                ]
+            }
+        ]
+
+        try:
+            response = self.model.client.chat.completions.create(
+                model=self.model.model_id,
+                messages=messages,
+                max_completion_tokens=2000,
+            )
+            content = response.choices[0].message.content.strip()
+            logger.info("vision_multi_query_result", content=content)
+            data = json.loads(content)
+            if not isinstance(data, dict):
+                data = {}
+        except Exception as e:
+            logger.error("vision_multi_query_failed", error=str(e))
+            raise e
+
+        found = {}
+        for i, query in enumerate(queries, 1):
+            point = data.get(str(i))
+            try:
+                found[query] = (int(point[0]), int(point[1]))
+            except (TypeError, ValueError, IndexError):
+                found[query] = None
+        return found
+
+    def find_text(self, image, query: str, region_hint: str = "top section") -> dict:
         """
         Ask the Vision Model to find text matching query and return coords.
         Returns dict: {found: bool, text: str, x: int, y: int}
@@ -108,7 +177,7 @@ class VisionClient:
                     {
                         "type": "image_url",
                         "image_url": {
-                            "url": f"data:image/jpeg;base64,{self.encode_image(image_path)}"
+                            "url": f"data:image/jpeg;base64,{self.encode_image(image)}"
                         }
                     }
                 ]
@@ -189,11 +189,34 @@ async function handleCommand(msg) {
             return await cmdGetPageInfo();
         case "continue_after_auth":
             return { status: "ok", message: "Resumed" };
+        case "sequence":
+            return await cmdSequence(params);
         default:
             return { status: "error", error: `Unknown action: ${action}` };
     }
 }
 
+// ─── Sequence ────────────────────────────────────────────────────────
+
+// Runs dependent steps back to back here, so the whole chain costs ARKA one
+// WebSocket round trip. Stops at the first step that isn't "ok"; a "delay"
+// step just waits params.ms.
+async function cmdSequence(params) {
+    const { steps = [] } = params;
+    const results = [];
+    for (let i = 0; i < steps.length; i++) {
+        const step = steps[i];
+        const result = step.action === "delay"
+            ? await new Promise(resolve => setTimeout(() => resolve({ status: "ok" }), (step.params || {}).ms || 0))
+            : await handleCommand(step);
+        results.push(result);
+        if (!result || result.status !== "ok") {
+            return { ...(result || {}), status: (result && result.status) || "error", failed_step: i, results };
+        }
+    }
+    return { status: "ok", results };
+}
+
 // ─── Navigation ──────────────────────────────────────────────────────
 
 async function cmdNavigate(params) {
@@ -71,7 +71,8 @@
     // ─── Click ───────────────────────────────────────────────────────
 
     function handleClick(params) {
-        const { selector, text, index = 0 } = params;
+        const { text, index = 0 } = params;
+        const selector = pickSelector(params);
         let el;
 
         if (text) {
@@ -109,7 +110,8 @@
     // ─── Type ────────────────────────────────────────────────────────
 
     function handleType(params) {
-        const { selector, text, clear = true } = params;
+        const { text, clear = true } = params;
+        const selector = pickSelector(params);
         if (!text) return { status: "error", error: "text is required" };
 
         let el;
@@ -158,7 +160,8 @@
     // ─── Press Key ───────────────────────────────────────────────────
 
     function handlePressKey(params) {
-        const { key = "Enter", code, selector } = params;
+        const { key = "Enter", code } = params;
+        const selector = pickSelector(params);
         let el;
         if (selector) {
             el = document.querySelector(selector);
@@ -195,25 +198,29 @@
     // ─── Wait For Selector ───────────────────────────────────────────
 
     function handleWaitForSelector(params) {
-        const { selector, timeout_ms = 5000 } = params;
-        if (!selector) return { status: "error", error: "selector required" };
+        const { timeout_ms = 5000 } = params;
+        const selectors = params.selectors || (params.selector ? [params.selector] : []);
+        if (!selectors.length) return { status: "error", error: "selector required" };
+
+        // Resolves on whichever candidate shows up first.
+        const find = () => {
+            for (const sel of selectors) {
+                const el = document.querySelector(sel);
+                if (el) return { status: "ok", found: true, selector: sel, element: describeElement(el) };
+            }
+            return null;
+        };
 
-        const existing = document.querySelector(selector);
-        if (existing) {
-            return {
-                status: "ok",
-                found: true,
-                element: describeElement(existing)
-            };
-        }
+        const existing = find();
+        if (existing) return existing;
 
         return new Promise((resolve) => {
             const observer = new MutationObserver(() => {
-                const el = document.querySelector(selector);
-                if (el) {
+                const hit = find();
+                if (hit) {
                     observer.disconnect();
                     clearTimeout(timer);
-                    resolve({ status: "ok", found: true, element: describeElement(el) });
+                    resolve(hit);
                 }
             });
 
@@ -221,11 +228,17 @@
 
             const timer = setTimeout(() => {
                 observer.disconnect();
-                resolve({ status: "error", error: `Timeout waiting for selector: ${selector}` });
+                resolve({ status: "error", error: `Timeout waiting for selector: ${selectors.join(", ")}` });
             }, timeout_ms);
         });
     }
 
+    // `selectors` lists fallbacks for `selector`; the first present in the page wins.
+    function pickSelector(params) {
+        if (params.selector || !Array.isArray(params.selectors)) return params.selector;
+        return params.selectors.find(sel => document.querySelector(sel)) || params.selectors[0];
+    }
+
     // ─── Focus ───────────────────────────────────────────────────────
 
     function handleFocus(params) {
@@ -1,7 +1,18 @@
 import os
 
+# Storage locations. Each can be overridden from the environment (read at
+# import time), e.g. to point tests at a temp dir; ARKA_MEM_DB=":memory:"
+# keeps the unified store in RAM.
+MEMORY_DB_ENV = "ARKA_MEM_DB"
+SESSION_DB_ENV = "ARKA_SESSION_DB"
+PROFILE_PATH_ENV = "ARKA_PROFILE_PATH"
+
 # Unified memory database path
-DEFAULT_MEMORY_DB_PATH = os.path.expanduser("~/.arka/memory/arka_memory.db")
+DEFAULT_MEMORY_DB_PATH = os.path.expanduser(os.getenv(MEMORY_DB_ENV, "~/.arka/memory/arka_memory.db"))
+# Raw session history (MemoryClient, PatternLearner)
+DEFAULT_SESSION_DB_PATH = os.path.expanduser(os.getenv(SESSION_DB_ENV, "~/.arka/memory/session_history.db"))
+# Human-readable semantic profile
+DEFAULT_PROFILE_PATH = os.getenv(PROFILE_PATH_ENV, "memory/user_profile.md")
 
 # Feature flags
 AUTO_UPDATE_ENV = "ARKA_MEMORY_AUTO_UPDATE"  # "1" to enable distiller
@@ -2,16 +2,16 @@ import sqlite3
 import json
 import os
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Optional, Tuple
 import structlog
 
-from memory.config import AUTO_UPDATE_ENV, AUTO_UPDATE_DEFAULT
+from memory.config import AUTO_UPDATE_ENV, AUTO_UPDATE_DEFAULT, DEFAULT_SESSION_DB_PATH
 from memory.distiller import distill_user_text
 from memory.store import memory_store
 
 logger = structlog.get_logger()
 
-DB_PATH = os.path.expanduser("~/.arka/memory/session_history.db")
+DB_PATH = DEFAULT_SESSION_DB_PATH
 
 class MemoryClient:
     """
@@ -77,6 +77,37 @@ class MemoryClient:
         except Exception as e:
             logger.error("db_log_failed", error=str(e))
 
+    def bulk_log_events(self, events: Iterable[Tuple[str, str, str, Optional[Dict[str, Any]]]]) -> int:
+        """
+        Log many (session_id, type, content, metadata) events in one transaction.
+        Meant for seeding/imports: rows are not passed through the distiller.
+        """
+        events = list(events)
+        if not events:
+            return 0
+        try:
+            conn = sqlite3.connect(self.db_path)
+            cursor = conn.cursor()
+
+            # One executemany in one transaction instead of a commit per row
+            cursor.executemany('''
+                INSERT INTO events (session_id, type, content, metadata)
+                VALUES (?, ?, ?, ?)
+            ''', [
+                (session_id, type, content, json.dumps(metadata) if metadata else "{}")
+                for session_id, type, content, metadata in events
+            ])
+
+            conn.commit()
+            conn.close()
+
+            # Also write to unified MemoryStore (best-effort)
+            memory_store.add_events_bulk(events)
+            return len(events)
+        except Exception as e:
+            logger.error("db_bulk_log_failed", error=str(e))
+            return 0
+
     def get_session_history(self, session_id: str, limit: int = 50) -> List[Dict]:
         """Retrieve recent history for a session."""
         try:
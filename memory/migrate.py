@@ -2,6 +2,7 @@ import json
 import os
 from typing import Dict, List, Optional
 
+from memory.config import DEFAULT_PROFILE_PATH
 from memory.store import memory_store
 
 MIGRATIONS_FILE = os.path.expanduser("~/.arka/memory/migrations.json")
@@ -41,7 +42,7 @@ def _parse_bullets(lines: List[str]) -> List[str]:
     return items
 
 
-def migrate_user_profile(profile_path: str = "memory/user_profile.md") -> int:
+def migrate_user_profile(profile_path: str = DEFAULT_PROFILE_PATH) -> int:
     if not os.path.exists(profile_path):
         return 0
     with open(profile_path, "r") as f:
@@ -1,4 +1,6 @@
 from typing import List, Dict, Optional
+import functools
+import re
 import structlog
 
 logger = structlog.get_logger()
@@ -10,26 +12,37 @@ class MistakeGuard:
     """
     def __init__(self):
         # Known bad patterns
-        self.prohibited_patterns = [
+        self.prohibited_patterns = (
             "rm -rf /", 
             "rm -rf ~",
             ":(){ :|:& };:", # Fork bomb
             "sudo",          # No sudo access by default
-        ]
+        )
         
         # Lazy coding indicators
-        self.lazy_indicators = [
+        self.lazy_indicators = (
             "# ... rest of code",
             "# ... (implement later)",
             "TODO: finish this",
             "pass # implementation pending"
-        ]
+        )
+
+    # One compiled alternation per pattern tuple: the common (clean) case is
+    # a single regex scan instead of a substring search per pattern. Keyed on
+    # the tuple itself, so replacing a list recompiles.
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _compile(patterns: tuple) -> "re.Pattern":
+        return re.compile("|".join(map(re.escape, patterns)))
 
     def validate_command(self, command: str) -> Optional[str]:
         """
         Checks a shell command for safety.
         Returns error message if unsafe, else None.
         """
+        if not self._compile(tuple(self.prohibited_patterns)).search(command):
+            return None
+        # Report the first listed pattern, as before.
         for pattern in self.prohibited_patterns:
             if pattern in command:
                 logger.warning("mistake_guard_block", match=pattern, command=command)
@@ -41,6 +54,8 @@ class MistakeGuard:
         Checks code for 'lazy' patterns.
         Returns warning message if lazy, else None.
         """
+        if not self._compile(tuple(self.lazy_indicators)).search(code):
+            return None
         for indicator in self.lazy_indicators:
             if indicator in code:
                 logger.warning("mistake_guard_lazy", match=indicator)
@@ -3,7 +3,7 @@ import os
 import sqlite3
 import threading
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import structlog
 
@@ -16,6 +16,47 @@ from memory.config import (
 
 logger = structlog.get_logger()
 
+# Bump alongside a new step in MemoryStore._migrate().
+SCHEMA_VERSION = 2
+
+IN_MEMORY_DB = ":memory:"
+
+# Applied to every connection the store opens. WAL + synchronous=NORMAL
+# drops the per-commit fsync of the rollback journal (each add_event is
+# its own commit); mmap_size=0 keeps the DB file out of RSS, so memory use
+# stays at sqlite's bounded page cache however large the DB grows.
+_PRAGMAS = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+PRAGMA mmap_size=0;
+"""
+
+# Trigram full-text index over facts (external content: it stores only the
+# index, the triggers keep it in step with the facts table). Trigram
+# matching is case-insensitive substring search, i.e. what the LIKE '%q%'
+# scan in search_facts() did, but answered from an inverted index.
+_FACTS_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS facts_fts USING fts5(
+    subject, predicate, object, content='facts', content_rowid='id', tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS facts_fts_ai AFTER INSERT ON facts BEGIN
+    INSERT INTO facts_fts(rowid, subject, predicate, object)
+    VALUES (new.id, new.subject, new.predicate, new.object);
+END;
+CREATE TRIGGER IF NOT EXISTS facts_fts_ad AFTER DELETE ON facts BEGIN
+    INSERT INTO facts_fts(facts_fts, rowid, subject, predicate, object)
+    VALUES ('delete', old.id, old.subject, old.predicate, old.object);
+END;
+CREATE TRIGGER IF NOT EXISTS facts_fts_au AFTER UPDATE OF subject, predicate, object ON facts BEGIN
+    INSERT INTO facts_fts(facts_fts, rowid, subject, predicate, object)
+    VALUES ('delete', old.id, old.subject, old.predicate, old.object);
+    INSERT INTO facts_fts(rowid, subject, predicate, object)
+    VALUES (new.id, new.subject, new.predicate, new.object);
+END;
+"""
+# Trigram queries shorter than this can't use the index.
+FTS_MIN_QUERY = 3
+
 
 class MemoryStore:
     """
@@ -29,15 +70,40 @@ class MemoryStore:
     def __init__(self, db_path: str = DEFAULT_MEMORY_DB_PATH):
         self.db_path = db_path
         self._lock = threading.RLock()
+        # One connection for the store's lifetime, used only under _lock.
+        # Reusing it keeps sqlite3's per-connection statement cache warm (a
+        # fresh connection per call re-prepares every statement), and lets
+        # ":memory:" work as-is since the database lives with the connection.
+        self._conn: Optional[sqlite3.Connection] = None
+        self._fts = False
         self._ensure_db()
 
     def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        return conn
+        if self._conn is None:
+            if self.db_path != IN_MEMORY_DB:
+                os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.row_factory = sqlite3.Row
+            self._configure_pragmas(self._conn)
+        return self._conn
+
+    def _configure_pragmas(self, conn: sqlite3.Connection) -> None:
+        conn.executescript(_PRAGMAS)
+
+    def flush(self) -> None:
+        """Commit and checkpoint the WAL into the main database file."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.commit()
+                self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
 
     def _ensure_db(self) -> None:
-        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
         with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute(
@@ -87,7 +153,11 @@ class MemoryStore:
                 "CREATE INDEX IF NOT EXISTS idx_facts_sp ON facts(subject, predicate)"
             )
             cursor.execute(
-                "CREATE INDEX IF NOT EXISTS idx_facts_deleted ON facts(is_deleted)"
+                """
+                CREATE INDEX IF NOT EXISTS idx_facts_live_recent
+                ON facts(updated_at DESC, created_at DESC)
+                WHERE is_deleted = 0
+                """
             )
             cursor.execute(
                 "CREATE INDEX IF NOT EXISTS idx_events_session ON events(session_id)"
@@ -95,9 +165,43 @@ class MemoryStore:
             cursor.execute(
                 "CREATE INDEX IF NOT EXISTS idx_episodes_session ON episodes(session_id)"
             )
+            self._migrate(conn)
+            conn.commit()
+        self._fts = self._ensure_fts()
+
+    def _ensure_fts(self) -> bool:
+        """Create the facts_fts index if this sqlite build supports it."""
+        conn = self._connect()
+        existed = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'facts_fts'"
+        ).fetchone()
+        try:
+            conn.executescript(_FACTS_FTS_SCHEMA)
+            if not existed:
+                # Index facts written before the table (or this build) existed.
+                conn.execute("INSERT INTO facts_fts(facts_fts) VALUES ('rebuild')")
+            conn.commit()
+            return True
+        except sqlite3.OperationalError as e:
+            # No FTS5 / trigram tokenizer (sqlite < 3.34): keep the LIKE scan.
+            logger.warning("memory_fts_unavailable", error=str(e))
+            return False
+
+    def _migrate(self, conn: sqlite3.Connection) -> None:
+        """Run one-time schema migrations, tracked via PRAGMA user_version."""
+        cursor = conn.cursor()
+        cursor.execute("PRAGMA user_version")
+        version = cursor.fetchone()[0]
+        if version >= SCHEMA_VERSION:
+            return
+        if version < 1:
+            # Boolean index the planner never picks; it only costs a b-tree
+            # update per fact write. Live rows use idx_facts_live_recent.
+            cursor.execute("DROP INDEX IF EXISTS idx_facts_deleted")
+        if version < 2:
             # Ensure new columns exist for older DBs
             self._ensure_columns(conn, "facts", {"locked": "INTEGER DEFAULT 0"})
-            conn.commit()
+        cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
 
     def _ensure_columns(self, conn: sqlite3.Connection, table: str, columns: Dict[str, str]) -> None:
         cursor = conn.cursor()
@@ -133,6 +237,33 @@ class MemoryStore:
                 logger.error("memory_add_event_failed", error=str(e))
                 return None
 
+    def add_events_bulk(
+        self,
+        rows: Iterable[Tuple[str, str, str, Optional[Dict[str, Any]]]],
+    ) -> int:
+        """Insert (session_id, event_type, content, metadata) rows in one transaction."""
+        params = [
+            (session_id, event_type, content, json.dumps(metadata or {}))
+            for session_id, event_type, content, metadata in rows
+        ]
+        if not params:
+            return 0
+        with self._lock:
+            try:
+                with self._connect() as conn:
+                    conn.executemany(
+                        """
+                        INSERT INTO events (session_id, type, content, metadata)
+                        VALUES (?, ?, ?, ?)
+                        """,
+                        params,
+                    )
+                    conn.commit()
+                    return len(params)
+            except Exception as e:
+                logger.error("memory_add_events_bulk_failed", error=str(e))
+                return 0
+
     def upsert_fact(
         self,
         subject: str,
@@ -288,24 +419,91 @@ class MemoryStore:
                 logger.error("memory_insert_fact_failed", error=str(e))
                 return None
 
+    def insert_facts_bulk(
+        self,
+        rows: Iterable[Dict[str, Any]],
+        ttl_days: Optional[int] = DEFAULT_FACT_TTL_DAYS,
+    ) -> int:
+        """
+        Insert fact dicts (subject/predicate/object, optional confidence,
+        source_event_id, metadata, locked) in one transaction. Rows missing a
+        subject, predicate or object are skipped. Returns the number inserted.
+        """
+        expires_at = None
+        if ttl_days is not None:
+            expires_at = (datetime.now() + timedelta(days=ttl_days)).isoformat()
+        params = []
+        for row in rows:
+            subject = (row.get("subject") or "").strip()
+            predicate = (row.get("predicate") or "").strip()
+            obj = (row.get("object") or "").strip()
+            if not subject or not predicate or not obj:
+                continue
+            metadata = row.get("metadata")
+            params.append((
+                subject,
+                predicate,
+                obj,
+                float(row.get("confidence", 0.6)),
+                row.get("source_event_id"),
+                expires_at,
+                json.dumps(metadata if isinstance(metadata, dict) else {}),
+                1 if row.get("locked") else 0,
+            ))
+        if not params:
+            return 0
+        with self._lock:
+            try:
+                with self._connect() as conn:
+                    conn.executemany(
+                        """
+                        INSERT INTO facts (
+                            subject, predicate, object, confidence,
+                            source_event_id, expires_at, metadata, locked
+                        )
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                        """,
+                        params,
+                    )
+                    conn.commit()
+                    return len(params)
+            except Exception as e:
+                logger.error("memory_insert_facts_bulk_failed", error=str(e))
+                return 0
+
     def search_facts(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
         if not query:
             return []
-        like = f"%{query.strip()}%"
+        query = query.strip()
         with self._lock:
             try:
                 with self._connect() as conn:
                     cursor = conn.cursor()
-                    cursor.execute(
-                        """
-                        SELECT * FROM facts
-                        WHERE is_deleted = 0
-                          AND (subject LIKE ? OR predicate LIKE ? OR object LIKE ?)
-                        ORDER BY updated_at DESC, created_at DESC
-                        LIMIT ?
-                        """,
-                        (like, like, like, limit),
-                    )
+                    if self._fts and len(query) >= FTS_MIN_QUERY:
+                        # Quoted as one phrase: a contiguous substring match.
+                        phrase = '"' + query.replace('"', '""') + '"'
+                        cursor.execute(
+                            """
+                            SELECT facts.* FROM facts_fts
+                            JOIN facts ON facts.id = facts_fts.rowid
+                            WHERE facts_fts MATCH ? AND facts.is_deleted = 0
+                            ORDER BY facts.updated_at DESC, facts.created_at DESC
+                            LIMIT ?
+                            """,
+                            (phrase, limit),
+                        )
+                    else:
+                        like = f"%{query}%"
+                        cursor.execute(
+                            """
+                            SELECT * FROM facts
+                            WHERE is_deleted = 0
+                              AND (subject LIKE ? OR predicate LIKE ? OR object LIKE ?)
+                            ORDER BY updated_at DESC, created_at DESC
+                            LIMIT ?
+                            """,
+                            (like, like, like, limit),
+                        )
                     rows = cursor.fetchall()
                     return [self._row_to_dict(row) for row in rows]
             except Exception as e:
@@ -347,6 +545,26 @@ class MemoryStore:
                 logger.error("memory_get_recent_facts_failed", error=str(e))
                 return []
 
+    def get_recent_facts_projection(self, limit: int = 20) -> List[Tuple[int, str, str, str]]:
+        """(id, subject, predicate, object) of the most recent facts, for listings."""
+        with self._lock:
+            try:
+                with self._connect() as conn:
+                    cursor = conn.cursor()
+                    cursor.execute(
+                        """
+                        SELECT id, subject, predicate, object FROM facts
+                        WHERE is_deleted = 0
+                        ORDER BY updated_at DESC, created_at DESC
+                        LIMIT ?
+                        """,
+                        (limit,),
+                    )
+                    return [tuple(row) for row in cursor.fetchall()]
+            except Exception as e:
+                logger.error("memory_get_recent_facts_projection_failed", error=str(e))
+                return []
+
     def mark_fact_deleted(self, fact_id: int, reason: str = "") -> bool:
         with self._lock:
             try:
@@ -538,11 +756,17 @@ class MemoryStore:
                     cursor.execute("SELECT * FROM facts")
                 else:
                     cursor.execute("SELECT * FROM facts WHERE is_deleted = 0")
-                rows = cursor.fetchall()
-                data = [self._row_to_dict(row) for row in rows]
-        os.makedirs(os.path.dirname(path), exist_ok=True)
-        with open(path, "w") as f:
-            json.dump(data, f, indent=2)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                # Stream rows straight from the cursor into the file so export
+                # memory stays flat however many facts there are. The output
+                # matches json.dump(rows, f, indent=2).
+                with open(path, "w") as f:
+                    sep = "[\n"
+                    for row in cursor:
+                        item = json.dumps(self._row_to_dict(row), indent=2)
+                        f.write(sep + "  " + item.replace("\n", "\n  "))
+                        sep = ",\n"
+                    f.write("[]" if sep == "[\n" else "\n]")
         return path
 
     def stats(self) -> Dict[str, Any]:
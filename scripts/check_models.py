@@ -14,9 +14,14 @@ client = OpenAI(api_key=api_key)
 
 try:
     print("Fetching available models...")
-    models = client.models.list()
-    
-    gpt_models = [m.id for m in models.data if "gpt" in m.id]
+    gpt_models, five_point_two = [], []
+    # Iterate the paginated listing directly; one pass fills both buckets.
+    for m in client.models.list():
+        mid = m.id
+        if "gpt" in mid:
+            gpt_models.append(mid)
+        if "5.2" in mid or "5-2" in mid:
+            five_point_two.append(mid)
     gpt_models.sort()
     
     print("\n--- Available GPT Models ---")
@@ -24,7 +29,6 @@ try:
         print(model)
         
     print("\n--- Check for 5.2 ---")
-    five_point_two = [m.id for m in models.data if "5.2" in m.id or "5-2" in m.id]
     if five_point_two:
         print("FOUND:", five_point_two)
     else:
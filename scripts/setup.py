@@ -13,19 +13,23 @@ def check_command(cmd):
     """Check if a command exists in the path."""
     return shutil.which(cmd) is not None
 
-def run_command(cmd):
-    """Run a shell command and print output."""
-    print(f"Running: {cmd}")
-    result = subprocess.run(cmd, shell=True, text=True, capture_output=True)
+def run_command(args):
+    """Run a command (argv list) and print output."""
+    print(f"Running: {' '.join(args)}")
+    result = subprocess.run(args, text=True, capture_output=True, check=False)
     if result.returncode != 0:
         print(f"Error: {result.stderr}")
         return False
     return True
 
-def is_brew_package_installed(package):
-    """Check if a brew package is installed."""
-    result = subprocess.run(f"brew list {package}", shell=True, text=True, capture_output=True)
-    return result.returncode == 0
+def get_installed_brew_packages():
+    """Return the set of installed brew formulae (one `brew` startup)."""
+    result = subprocess.run(
+        ["brew", "list", "--formula", "-1"], text=True, capture_output=True, check=False
+    )
+    if result.returncode != 0:
+        return set()
+    return set(result.stdout.split())
 
 def install_dependencies():
     print("🚀 ARKA V2: Checking System Dependencies...")
@@ -36,12 +40,13 @@ def install_dependencies():
         sys.exit(1)
 
     # Check and Install Packages
+    installed = get_installed_brew_packages()
     for package in REQUIRED_BREW_PACKAGES:
-        if is_brew_package_installed(package):
+        if package in installed:
             print(f"✅ {package} is already installed.")
         else:
             print(f"⚠️  {package} missing. Installing...")
-            if run_command(f"brew install {package}"):
+            if run_command(["brew", "install", package]):
                 print(f"✅ {package} installed.")
             else:
                 print(f"❌ Failed to install {package}.")
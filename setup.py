@@ -10,9 +10,15 @@ Run:  python setup.py
 
 import os
 import sys
+import json
+import hashlib
+import importlib.metadata
+import importlib.util
 import shutil
 import subprocess
 import time
+from collections import ChainMap
+from pathlib import Path
 
 try:
     from rich.console import Console
@@ -44,6 +50,21 @@ B = "#60a5fa"   # Blue
 R = "#ef4444"   # Red
 Y = "#fbbf24"   # Yellow
 
+SCRIPT_DIR = Path(__file__).resolve().parent
+# Former plaintext cache of .env; _load_env deletes it.
+ENV_CACHE_PATH = os.path.expanduser("~/.arka/env.cache.json")
+REQ_HASH_PATH = os.path.expanduser("~/.arka/req.sha256")
+PLAYWRIGHT_STAMP_PATH = os.path.expanduser("~/.arka/playwright.stamp")
+
+# (display name, import name) pairs checked by verify_setup()
+VERIFY_MODULES = [
+    ("smolagents", "smolagents"),
+    ("rich", "rich"),
+    ("structlog", "structlog"),
+    ("pyautogui", "pyautogui"),
+    ("python-dotenv", "dotenv"),
+]
+
 
 def print_logo():
     logo = f"""[bold {V}]
@@ -78,7 +99,7 @@ def check_python():
     v = sys.version_info
     version_str = f"{v.major}.{v.minor}.{v.micro}"
     
-    if v.major == 3 and v.minor >= 10:
+    if v[:2] >= (3, 10):
         console.print(f"  [{G}]✓[/] Python {version_str}")
         return True
     else:
@@ -87,22 +108,62 @@ def check_python():
         return False
 
 
+def _requirements_hash():
+    """Hash requirements.txt together with the interpreter it was installed into."""
+    h = hashlib.sha256(sys.executable.encode())
+    with open("requirements.txt", "rb") as f:
+        h.update(f.read())
+    return h.hexdigest()
+
+
+def _read_stamp(path):
+    try:
+        with open(path, "r") as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def _write_stamp(path, value):
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            f.write(value)
+    except OSError:
+        pass
+
+
 def install_deps():
     """Step 2: Install Python dependencies."""
     step_header(2, "Installing Dependencies")
     
-    with Progress(
-        SpinnerColumn(style=V),
-        TextColumn(f"[{M}]Installing packages...[/]"),
-        console=console,
-    ) as progress:
-        task = progress.add_task("install", total=None)
-        result = subprocess.run(
-            [sys.executable, "-m", "pip", "install", "-r", "requirements.txt", "-q"],
-            capture_output=True, text=True
-        )
+    req_hash = _requirements_hash()
+    if _read_stamp(REQ_HASH_PATH) == req_hash:
+        console.print(f"  [{G}]✓[/] Dependencies up to date")
+        return True
+    
+    # Fail fast (no subprocess) when this interpreter has no pip
+    if importlib.util.find_spec("pip") is None:
+        console.print(f"  [{R}]✕[/] pip not available in this interpreter")
+        return False
+    if sys.prefix == sys.base_prefix:
+        console.print(f"  [{Y}]⚠[/] [{M}]Not in a virtualenv; packages go into the system Python[/]")
+    
+    cmd = [sys.executable, "-m", "pip", "install", "-r", "requirements.txt", "-q"]
+    if console.is_terminal:
+        with Progress(
+            SpinnerColumn(style=V),
+            TextColumn(f"[{M}]Installing packages...[/]"),
+            console=console,
+        ) as progress:
+            task = progress.add_task("install", total=None)
+            result = subprocess.run(cmd, capture_output=True, text=True)
+    else:
+        # No spinner redraws when output isn't a terminal (CI, pipes)
+        result = subprocess.run(cmd, capture_output=True, text=True)
     
     if result.returncode == 0:
+        _write_stamp(REQ_HASH_PATH, req_hash)
         console.print(f"  [{G}]✓[/] All dependencies installed")
         return True
     else:
@@ -111,14 +172,69 @@ def install_deps():
         return False
 
 
+def _playwright_cache_dir():
+    """Where Playwright keeps downloaded browsers on this platform."""
+    override = os.environ.get("PLAYWRIGHT_BROWSERS_PATH")
+    if override and override != "0":
+        return Path(override).expanduser()
+    if sys.platform == "darwin":
+        return Path.home() / "Library/Caches/ms-playwright"
+    return Path.home() / ".cache/ms-playwright"
+
+
+def _playwright_stamp(cache_dir):
+    """Stamp for a browser install: the Playwright version it was for, and where it went."""
+    try:
+        version = importlib.metadata.version("playwright")
+    except importlib.metadata.PackageNotFoundError:
+        version = None
+    return f"{version} {cache_dir}"
+
+
+def _chromium_installed(cache_dir):
+    """
+    Whether the Chromium builds the installed Playwright expects (the
+    revisions in its browsers.json) are in cache_dir. False when that can't
+    be told, so the install runs.
+    """
+    spec = importlib.util.find_spec("playwright")
+    if spec is None or not spec.submodule_search_locations:
+        return False
+    manifest = Path(spec.submodule_search_locations[0]) / "driver" / "package" / "browsers.json"
+    try:
+        browsers = json.loads(manifest.read_text())["browsers"]
+    except (OSError, ValueError, KeyError):
+        return False
+    wanted = [b for b in browsers if b.get("name") in ("chromium", "chromium-headless-shell")]
+    if not wanted:
+        return False
+    for browser in wanted:
+        revisions = {browser["revision"], *browser.get("revisionOverrides", {}).values()}
+        prefix = browser["name"].replace("-", "_")
+        if not any((cache_dir / f"{prefix}-{rev}").is_dir() for rev in revisions):
+            return False
+    return True
+
+
 def setup_playwright():
     """Install Playwright browsers if needed."""
+    cache_dir = _playwright_cache_dir()
+    stamp = _playwright_stamp(cache_dir)
+    # A Playwright upgrade changes the stamp; a cleared cache has no chromium-*.
+    if _read_stamp(PLAYWRIGHT_STAMP_PATH) == stamp and any(cache_dir.glob("chromium-*")):
+        console.print(f"  [{G}]✓[/] Playwright browsers already present")
+        return
+    if _chromium_installed(cache_dir):
+        _write_stamp(PLAYWRIGHT_STAMP_PATH, stamp)
+        console.print(f"  [{G}]✓[/] Playwright browsers already present")
+        return
     try:
         result = subprocess.run(
             [sys.executable, "-m", "playwright", "install", "chromium"],
             capture_output=True, text=True, timeout=120
         )
         if result.returncode == 0:
+            _write_stamp(PLAYWRIGHT_STAMP_PATH, stamp)
             console.print(f"  [{G}]✓[/] Playwright browsers installed")
         else:
             console.print(f"  [{Y}]⚠[/] Playwright setup skipped (browser tools may not work)")
@@ -126,6 +242,33 @@ def setup_playwright():
         console.print(f"  [{Y}]⚠[/] Playwright setup skipped")
 
 
+def _load_env(env_path):
+    """Parse .env into a dict ({} if there is none)."""
+    # Earlier versions kept a plaintext copy of the keys here; don't leave
+    # stale secrets behind.
+    try:
+        os.remove(ENV_CACHE_PATH)
+    except OSError:
+        pass
+
+    values = {}
+    try:
+        with open(env_path, "r") as f:
+            lines = f.read().splitlines()
+    except FileNotFoundError:
+        return values
+    for line in lines:
+        line = line.strip()
+        if "=" in line and not line.startswith("#"):
+            key, val = line.split("=", 1)
+            values[key] = val.strip('"').strip("'")
+    return values
+
+
+def _mask(value):
+    return value[:8] + "..." + value[-4:] if len(value) > 12 else "****"
+
+
 def configure_api_keys():
     """Step 3: Configure LLM provider API keys."""
     step_header(3, "API Key Configuration")
@@ -134,17 +277,10 @@ def configure_api_keys():
     console.print(f"  [{M}]Keys are stored locally in .env (never committed to git).[/]")
     console.print()
     
-    env_path = os.path.join(os.path.dirname(__file__), ".env")
-    existing = {}
+    env_path = str(SCRIPT_DIR / ".env")
     
     # Load existing keys
-    if os.path.exists(env_path):
-        with open(env_path, "r") as f:
-            for line in f:
-                line = line.strip()
-                if "=" in line and not line.startswith("#"):
-                    key, val = line.split("=", 1)
-                    existing[key] = val.strip('"').strip("'")
+    existing = _load_env(env_path)
     
     providers = [
         {
@@ -177,7 +313,14 @@ def configure_api_keys():
         {"name": "Langfuse Base URL",   "key": "LANGFUSE_BASE_URL",   "hint": "https://cloud.langfuse.com"},
     ]
     
-    new_keys = dict(existing)
+    # Updates layer over the loaded keys; no copy unless something changes.
+    new_keys = ChainMap({}, existing)
+    
+    # (configured, masked value) per provider, computed once for table + prompts
+    status_view = {
+        p["key"]: (bool(existing.get(p["key"])), _mask(existing.get(p["key"], "")))
+        for p in providers
+    }
     
     # LLM Providers
     table = Table(show_header=True, header_style=f"bold {V}", box=None, padding=(0, 2))
@@ -186,7 +329,7 @@ def configure_api_keys():
     table.add_column("Required", justify="center")
     
     for p in providers:
-        has_key = bool(existing.get(p["key"]))
+        has_key, _ = status_view[p["key"]]
         status = f"[{G}]✓ configured[/]" if has_key else f"[{M}]○ not set[/]"
         req = f"[{Y}]yes[/]" if p["required"] else f"[{M}]no[/]"
         table.add_row(p["name"], status, req)
@@ -195,9 +338,8 @@ def configure_api_keys():
     console.print()
     
     for p in providers:
-        current = existing.get(p["key"], "")
-        if current:
-            masked = current[:8] + "..." + current[-4:] if len(current) > 12 else "****"
+        has_key, masked = status_view[p["key"]]
+        if has_key:
             change = Confirm.ask(f"  [{B}]{p['name']}[/] [{M}](current: {masked})[/] — Change?", default=False)
             if not change:
                 continue
@@ -230,10 +372,16 @@ def configure_api_keys():
                 if val.strip():
                     new_keys[obs["key"]] = val.strip()
     
-    # Write .env
-    with open(env_path, "w") as f:
-        for k, v in new_keys.items():
-            f.write(f'{k}="{v}"\n')
+    # Write .env in one blob to a temp file, then swap it in (crash-safe)
+    payload = "".join(f'{k}="{v}"\n' for k, v in new_keys.items()).encode()
+    tmp_path = env_path + ".tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        os.write(fd, payload)
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, env_path)
     
     console.print()
     console.print(f"  [{G}]✓[/] Configuration saved to .env")
@@ -245,26 +393,25 @@ def create_directories():
     step_header(4, "Creating Directories")
     
     dirs = [
-        os.path.expanduser("~/.arka"),
-        os.path.expanduser("~/.arka/memory"),
-        "logs",
-        "memory",
+        Path("~/.arka/memory").expanduser(),  # parents=True also creates ~/.arka
+        Path("logs"),
+        Path("memory"),
     ]
     
     for d in dirs:
-        os.makedirs(d, exist_ok=True)
-    
-    # Create learnings file if it doesn't exist
-    learnings = "memory/learnings.md"
-    if not os.path.exists(learnings):
-        with open(learnings, "w") as f:
-            f.write("# ARKA Learnings\n> Accumulated operational wisdom from past sessions.\n\n")
-    
-    # Create user profile if it doesn't exist
-    profile = "memory/user_profile.md"
-    if not os.path.exists(profile):
-        with open(profile, "w") as f:
-            f.write("# User Profile\n> ARKA's memory about you. Updated automatically.\n\n")
+        d.mkdir(parents=True, exist_ok=True)
+    
+    # Seed files; exclusive create ("x") skips the separate exists() check
+    seeds = {
+        "memory/learnings.md": "# ARKA Learnings\n> Accumulated operational wisdom from past sessions.\n\n",
+        "memory/user_profile.md": "# User Profile\n> ARKA's memory about you. Updated automatically.\n\n",
+    }
+    for path, content in seeds.items():
+        try:
+            with open(path, "x") as f:
+                f.write(content)
+        except FileExistsError:
+            pass
     
     console.print(f"  [{G}]✓[/] Directories and files ready")
 
@@ -278,36 +425,9 @@ def verify_setup():
     # Check .env exists
     checks.append(("Config file (.env)", os.path.exists(".env")))
     
-    # Check critical imports
-    try:
-        import smolagents
-        checks.append(("smolagents", True))
-    except ImportError:
-        checks.append(("smolagents", False))
-    
-    try:
-        import rich
-        checks.append(("rich", True))
-    except ImportError:
-        checks.append(("rich", False))
-    
-    try:
-        import structlog
-        checks.append(("structlog", True))
-    except ImportError:
-        checks.append(("structlog", False))
-    
-    try:
-        import pyautogui
-        checks.append(("pyautogui", True))
-    except ImportError:
-        checks.append(("pyautogui", False))
-    
-    try:
-        from dotenv import load_dotenv
-        checks.append(("python-dotenv", True))
-    except ImportError:
-        checks.append(("python-dotenv", False))
+    # Check critical imports (find_spec locates the module without executing it)
+    for label, module in VERIFY_MODULES:
+        checks.append((label, importlib.util.find_spec(module) is not None))
     
     all_ok = True
     for name, ok in checks:
@@ -343,7 +463,7 @@ def print_success():
 
 
 def main():
-    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    os.chdir(SCRIPT_DIR)
     
     console.print()
     print_logo()
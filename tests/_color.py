@@ -0,0 +1,14 @@
+# tests/_color.py — ANSI colors shared by the script-style test reports.
+
+import sys
+
+GREEN = "\033[92m"
+RED = "\033[91m"
+YELLOW = "\033[93m"
+BLUE = "\033[94m"
+RESET = "\033[0m"
+
+
+def cprint(color, msg):
+    """Write `msg` in `color` (an escape above, or "" for plain) plus a newline."""
+    sys.stdout.write(f"{color}{msg}{RESET}\n")
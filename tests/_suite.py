@@ -0,0 +1,33 @@
+# Regression suite definition. Runners import these instead of keeping their
+# own copies, so the lists can't drift.
+
+# List of tests to run in order
+TEST_SUITE = (
+    ("Phase 0: Hello World", "tests/test_hello_world.py"),
+    ("Phase 1: Coding Loop", "tests/test_coding_loop.py"),
+    ("Phase 2: God Mode (HW)", "tests/test_god_mode.py"),
+    ("Phase 3: Memory & Safety", "tests/test_memory.py"),
+    ("Phase 3: Planning Mode", "tests/test_planning.py"),
+    ("Phase 3: Skills Registry", "tests/test_skills.py"),
+    ("Phase 3: Browser Tool", "tests/test_browser.py"),
+    ("Phase 3: Browser Bridge Shutdown", "tests/test_browser_bridge_shutdown.py"),
+)
+
+ONLINE_TESTS = frozenset({
+    "tests/test_hello_world.py",
+    "tests/test_coding_loop.py",
+    "tests/test_god_mode.py",
+    "tests/test_memory.py",
+    "tests/test_planning.py",
+})
+
+NETWORK_TESTS = ONLINE_TESTS | {"tests/test_browser.py"}
+
+# Tests that touch shared files in the repo or drive the real desktop.
+# These run one at a time after the parallel batch.
+SERIAL_TESTS = frozenset({
+    "tests/test_coding_loop.py",  # writes temp_broken.py
+    "tests/test_god_mode.py",     # drives volume/apps
+    "tests/test_memory.py",       # writes memory/user_profile.md
+    "tests/test_planning.py",     # rewrites implementation_plan.md
+})
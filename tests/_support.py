@@ -0,0 +1,63 @@
+# tests/_support.py — helpers shared by the pytest fixtures in conftest.py
+# and the script-mode (__main__) runs of the same test modules.
+
+import functools
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+MCP_FS_SERVER = "@modelcontextprotocol/server-filesystem"
+MCP_PROBE_TEXT = "MCP-PROBE-OK"
+
+
+@contextmanager
+def mcp_probe_dir():
+    """Throwaway root for the MCP filesystem server, removed in one rmtree pass."""
+    with tempfile.TemporaryDirectory(prefix="arka_mcp_") as d:
+        # macOS resolves /tmp -> /private/tmp; the server compares real paths.
+        yield Path(os.path.realpath(d))
+
+
+@functools.lru_cache(maxsize=1)
+def shared_engine():
+    """One ArkaEngine per process for checks that only inspect its wiring."""
+    from core.engine import ArkaEngine
+    return ArkaEngine()
+
+
+def engine_restarter():
+    """
+    Returns a callable standing in for `ArkaEngine()` across simulated restarts.
+
+    The first call builds the engine; later calls reuse it, clearing the
+    agent's step memory and re-reading profile/learnings/goals from disk,
+    which is all a fresh process would load differently.
+    """
+    engine = None
+
+    def restart():
+        nonlocal engine
+        if engine is None:
+            from core.engine import ArkaEngine
+            engine = ArkaEngine()
+        else:
+            engine.memory.reset()
+            engine.reload_memory()
+        return engine
+
+    return restart
+
+
+def open_fs_bridge(root: Path):
+    """Seed `root` with probe.txt and connect an MCPBridge serving it over npx."""
+    from core.mcp_client import MCPBridge
+
+    (root / "probe.txt").write_text(MCP_PROBE_TEXT)
+    bridge = MCPBridge()
+    try:
+        bridge.connect("fs", "npx", ["-y", MCP_FS_SERVER, str(root)])
+    except Exception:
+        bridge.disconnect_all()
+        raise
+    return bridge
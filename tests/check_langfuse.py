@@ -1,12 +1,17 @@
-from langfuse import Langfuse
 import os
+import sys
 from dotenv import load_dotenv
 
 load_dotenv()
 
+if os.environ.get("ARKA_DISABLE_LANGFUSE") == "1" or not os.environ.get("LANGFUSE_PUBLIC_KEY"):
+    print("Langfuse check skipped (disabled or no keys).")
+    sys.exit(0)
+
+from langfuse import Langfuse
+
 try:
     client = Langfuse()
-    print("Attributes:", dir(client))
     if hasattr(client, 'trace'):
         print("Trace method exists.")
     else:
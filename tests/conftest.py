@@ -0,0 +1,47 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from _support import engine_restarter, mcp_probe_dir, open_fs_bridge
+
+
+@pytest.fixture(scope="module")
+def engine_factory():
+    """Call for a (re)started ArkaEngine; built once per module, then re-hydrated."""
+    return engine_restarter()
+
+
+@pytest.fixture(scope="session")
+def mcp_bridge():
+    """One filesystem MCP server (npx subprocess + handshake) for the whole session."""
+    with mcp_probe_dir() as root:
+        try:
+            bridge = open_fs_bridge(root)
+        except Exception as e:
+            pytest.skip(f"MCP filesystem server unavailable: {e!r}")
+        yield bridge, root
+        bridge.disconnect_all()
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-slow", action="store_true", default=False,
+        help="run tests marked slow (live LLM calls)",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "slow: calls a live LLM; skipped unless --run-slow")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-slow"):
+        return
+    skip_slow = pytest.mark.skip(reason="needs --run-slow")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
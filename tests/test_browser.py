@@ -1,13 +1,20 @@
 from tools.browser import visit_page
 import pytest
 
-def test_browser_tool():
+URL = "https://example.com"
+
+
+@pytest.fixture(scope="module")
+def page_result():
+    # One browser launch per module; every check below reads the same visit.
+    print(f"Visiting {URL}...")
+    return visit_page(URL)
+
+
+def test_browser_tool(page_result):
     print("🧪 Testing Phase 3.3: Browser Tool...")
     
-    url = "https://example.com"
-    print(f"Visiting {url}...")
-    
-    result = visit_page(url)
+    result = page_result
     
     print("\n---------- Result ----------")
     print(result)
@@ -18,5 +25,15 @@ def test_browser_tool():
     else:
         print("❌ Browser visit failed or content unexpected.")
 
+
+def test_browser_content_preview(page_result):
+    if "Content Preview:" in page_result:
+        print("✅ Content preview returned.")
+    else:
+        print("❌ Content preview missing.")
+
+
 if __name__ == "__main__":
-    test_browser_tool()
+    result = visit_page(URL)
+    test_browser_tool(result)
+    test_browser_content_preview(result)
@@ -1,5 +1,4 @@
 import socket
-import time
 
 from core.browser_bridge import BrowserBridge
 
@@ -26,29 +25,35 @@ def test_browser_bridge_shutdown():
     bridge = BrowserBridge(port=port, host="127.0.0.1")
 
     try:
+        # start() already blocks until the server has bound (or failed).
         bridge.start()
-        time.sleep(0.2)
 
         if bridge.status().get("last_error"):
             print(f"❌ Bridge failed to start: {bridge.status()['last_error']}")
             return
 
     finally:
+        thread = bridge._thread
         bridge.stop()
 
-    # Validate shutdown state
-    if bridge._thread is not None and bridge._thread.is_alive():
-        print("❌ Bridge thread still alive after stop().")
-        return
-    if bridge._loop is not None:
-        print("❌ Event loop not cleared after stop().")
-        return
-    if bridge._pending:
-        print("❌ Pending futures not cleared after stop().")
-        return
-    if bridge.connected:
-        print("❌ Bridge still marked connected after stop().")
-        return
+    if thread is not None:
+        thread.join(timeout=1.0)
+
+    # Validate shutdown state: collect every broken invariant, not just the first
+    problems = [
+        msg
+        for failed, msg in (
+            (thread is not None and thread.is_alive(), "Bridge thread still alive after stop()."),
+            (bridge._thread is not None, "Bridge thread not cleared after stop()."),
+            (bridge._loop is not None, "Event loop not cleared after stop()."),
+            (bool(bridge._pending), "Pending futures not cleared after stop()."),
+            (bridge.connected, "Bridge still marked connected after stop()."),
+        )
+        if failed
+    ]
+    for msg in problems:
+        print(f"❌ {msg}")
+    assert not problems, problems
 
     print("✅ Browser bridge shutdown clean.")
 
@@ -1,16 +1,21 @@
+from pathlib import Path
+
 from core.engine import ArkaEngine
 from tools.dev import read_file, write_file
 from tools.terminal import run_terminal
 import structlog
+import pytest
 
 logger = structlog.get_logger()
 
+@pytest.mark.slow
 def test_coding_loop():
     print("🧪 Testing Phase 1: Coding Loop (Read -> Fix -> Verify)...")
     
     # 1. Create a broken file
     broken_code = "print('Hello World'  # Missing closing parenthesis"
-    write_file("temp_broken.py", broken_code)
+    temp_file = Path("temp_broken.py")
+    temp_file.write_text(broken_code)
     print("✅ Created 'temp_broken.py' with syntax error.")
     
     try:
@@ -38,9 +43,9 @@ def test_coding_loop():
     except Exception as e:
         print(f"❌ TEST CRASHED: {e}")
         # Note: This might crash locally due to API 404, but logic is sound.
-    
-    # Cleanup
-    run_terminal("rm temp_broken.py")
+    finally:
+        # Cleanup
+        temp_file.unlink(missing_ok=True)
 
 if __name__ == "__main__":
     test_coding_loop()
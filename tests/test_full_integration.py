@@ -15,261 +15,412 @@ Subsystems tested:
   8. LLM Execution: Simple task with cross-verification
   9. LLM Execution: Memory recall with cross-verification
   10. LLM Execution: Tool usage (todo) with cross-verification
+
+Each subsystem is its own test_* function. Run it as a script for the
+full report; under pytest they are collected individually and the LLM
+checks (8-10) only run with --run-slow.
 """
 
-import sys, os, time, json, datetime
+import sys, os, re, time, json, datetime, tempfile, gc, itertools, threading
+from concurrent.futures import ThreadPoolExecutor
 sys.path.insert(0, os.getcwd())
 
+import pytest
+
+from _color import BLUE, GREEN, RED, RESET, YELLOW
+from _support import MCP_PROBE_TEXT, mcp_probe_dir, open_fs_bridge
+
 # ─── Color helpers ────────────────────────────────────────────────────
-GREEN = "\033[92m"
-RED = "\033[91m"
-YELLOW = "\033[93m"
-BLUE = "\033[94m"
-RESET = "\033[0m"
+
+# Prebuilt so logging a check is a lookup, not fresh escape-code formatting
+ICON_OK = f"{GREEN}✅{RESET}"
+ICON_FAIL = f"{RED}❌{RESET}"
+SECTION_RULE = f"{BLUE}{'─'*60}{RESET}"
+SUMMARY_RULE = f"{BLUE}{'═'*60}{RESET}"
 
 results = {}
 
+# Session ids only need to be unique per run, not random.
+_session_ids = itertools.count()
+
+# Per-thread report buffer, set while a section runs on a worker thread so
+# concurrent sections don't interleave their output (see _run_buffered).
+_report = threading.local()
+
+def _emit(text):
+    lines = getattr(_report, "lines", None)
+    if lines is None:
+        sys.stdout.write(text + "\n")
+    else:
+        lines.append(text)
+
+def _results():
+    return getattr(_report, "results", results)
+
 def log_test(name, passed, detail=""):
-    results[name] = passed
-    icon = f"{GREEN}✅{RESET}" if passed else f"{RED}❌{RESET}"
-    print(f"  {icon} {name}" + (f" — {detail}" if detail else ""))
+    _results()[name] = passed
+    _emit(f"  {ICON_OK if passed else ICON_FAIL} {name}" + (f" — {detail}" if detail else ""))
 
 def section(title):
-    print(f"\n{BLUE}{'─'*60}{RESET}")
-    print(f"{BLUE}  {title}{RESET}")
-    print(f"{BLUE}{'─'*60}{RESET}")
+    _emit(f"\n{SECTION_RULE}\n{BLUE}  {title}{RESET}\n{SECTION_RULE}")
 
+# LLM replies are matched on whole integer tokens (so "39730" is not "3973"),
+# after dropping any ANSI styling the agent's console output carried.
+_ANSI_RE = re.compile(r"\x1b\[[0-9;]*m")
+_INT_RE = re.compile(r"-?\d+")
 
-def run_all_tests():
-    # ══════════════════════════════════════════════════════════════════
-    # 1. ENGINE INITIALIZATION
-    # ══════════════════════════════════════════════════════════════════
+def _ints(reply):
+    return set(_INT_RE.findall(_ANSI_RE.sub("", str(reply))))
+
+def assert_logged(*names):
+    failed = [name for name in names if not _results().get(name)]
+    assert not failed, f"Failed: {failed}"
+
+
+# ─── Fixtures (pytest only; script mode builds these in run_all_tests) ──
+
+@pytest.fixture(scope="module")
+def engine(tmp_path_factory):
+    from core.engine import ArkaEngine
+    from core.memory import MemoryManager
+
+    engine = ArkaEngine()
+    # Recall facts go to a throwaway profile, not memory/user_profile.md
+    profile = tmp_path_factory.mktemp("profile") / "user_profile.md"
+    engine.semantic_memory = MemoryManager(profile_path=str(profile))
+    engine.reload_memory()
+    yield engine
+
+    # Release the model client, tools and prompts before the next module
+    del engine
+    gc.collect()
+
+
+@pytest.fixture
+def mem(tmp_path):
+    from core.memory import MemoryManager
+    return MemoryManager(profile_path=str(tmp_path / "user_profile.md"))
+
+
+@pytest.fixture
+def session_db(tmp_path, monkeypatch):
+    import memory.db
+    from memory.store import MemoryStore
+
+    # Mirrored events land in a RAM store instead of the real unified DB
+    monkeypatch.setattr(memory.db, "memory_store", MemoryStore(db_path=":memory:"))
+    return memory.db.MemoryClient(db_path=str(tmp_path / "session_history.db"))
+
+
+# ══════════════════════════════════════════════════════════════════════
+# 1. ENGINE INITIALIZATION
+# ══════════════════════════════════════════════════════════════════════
+def test_engine_init(engine):
     section("1. ENGINE INITIALIZATION")
-    try:
-        from core.engine import ArkaEngine
-        engine = ArkaEngine()
-        tool_names = [t.name for t in engine.tools.values()] if hasattr(engine, 'tools') else []
-        tool_count = len(tool_names)
-        log_test("Engine init", True, f"{tool_count} tools loaded")
-        
-        # Cross-verify: check specific tools exist
-        expected_tools = ["music_control", "remember_fact", "list_mcp_tools", "call_mcp_tool", 
-                          "web_search", "visit_page", "todo_add", "system_click"]
-        missing = [t for t in expected_tools if t not in tool_names]
-        log_test("Critical tools present", len(missing) == 0, 
-                 f"Missing: {missing}" if missing else f"All {len(expected_tools)} critical tools found")
-    except Exception as e:
-        log_test("Engine init", False, str(e))
-        print(f"{RED}FATAL: Engine failed to initialize. Aborting remaining tests.{RESET}")
-        return
+    tool_names = engine.tool_names
+    tool_count = len(tool_names)
+    log_test("Engine init", True, f"{tool_count} tools loaded")
 
-    # ══════════════════════════════════════════════════════════════════
-    # 2. SEMANTIC MEMORY
-    # ══════════════════════════════════════════════════════════════════
+    # Cross-verify: check specific tools exist
+    expected_tools = ["music_control", "remember_fact", "list_mcp_tools", "call_mcp_tool",
+                      "web_search", "visit_page", "todo_add", "system_click"]
+    missing = sorted(set(expected_tools) - tool_names)
+    log_test("Critical tools present", len(missing) == 0,
+             f"Missing: {missing}" if missing else f"All {len(expected_tools)} critical tools found")
+    assert_logged("Critical tools present")
+
+
+# ══════════════════════════════════════════════════════════════════════
+# 2. SEMANTIC MEMORY
+# ══════════════════════════════════════════════════════════════════════
+def test_semantic_memory(mem):
     section("2. SEMANTIC MEMORY")
-    try:
-        from core.memory import MemoryManager
-        mem = MemoryManager()
-        
-        # Read profile
-        profile = mem.get_profile()
-        log_test("Memory read", len(profile) > 0, f"{len(profile)} chars loaded")
-        
-        # Append a test fact
-        marker = f"IntegTest-{int(time.time())}"
-        result = mem.append_fact(f"Test marker: {marker}")
-        log_test("Memory append", marker in result, result.strip())
-        
-        # Cross-verify: re-read and check marker exists
-        profile_after = mem.get_profile()
-        log_test("Memory persistence", marker in profile_after, "Marker found in re-read")
-        
-        # Clean up: remove our test line
-        with open(mem.profile_path, "r") as f:
-            lines = f.readlines()
-        with open(mem.profile_path, "w") as f:
-            for line in lines:
-                if marker not in line:
-                    f.write(line)
-    except Exception as e:
-        log_test("Memory system", False, str(e))
+    # Read profile
+    profile = mem.get_profile()
+    log_test("Memory read", len(profile) > 0, f"{len(profile)} chars loaded")
 
-    # ══════════════════════════════════════════════════════════════════
-    # 3. MISTAKEGUARD (Safety)
-    # ══════════════════════════════════════════════════════════════════
+    # Append a test fact
+    marker = f"IntegTest-{int(time.time())}"
+    result = mem.append_fact(f"Test marker: {marker}")
+    log_test("Memory append", marker in result, result.strip())
+
+    # Cross-verify: profile (cached, revalidated against the file's mtime)
+    profile_after = mem.get_profile()
+    log_test("Memory persistence", marker in profile_after, "Marker found in profile")
+
+    # Rewrites the (temp) profile without our test line
+    removed = mem.remove_facts(marker)
+    log_test("Memory remove", removed == 1 and marker not in mem.get_profile(), f"{removed} line(s) removed")
+    assert_logged("Memory read", "Memory append", "Memory persistence", "Memory remove")
+
+
+# ══════════════════════════════════════════════════════════════════════
+# 3. MISTAKEGUARD (Safety)
+# ══════════════════════════════════════════════════════════════════════
+GUARD_COMMANDS = [
+    # (check name, command, should_block)
+    ("Block rm -rf /", "rm -rf /", True),
+    ("Block sudo", "sudo apt install something", True),
+    ("Allow safe cmd", "ls -la", False),
+]
+
+GUARD_CODE = [
+    # (check name, code, is_lazy)
+    ("Detect lazy code", "def foo():\n    # ... rest of code\n    pass", True),
+    ("Allow good code", "def foo():\n    return 42", False),
+]
+
+
+@pytest.mark.parametrize("name,command,should_block", GUARD_COMMANDS)
+def test_guard_command(name, command, should_block):
+    from memory.mistakes import mistake_guard
+
+    verdict = mistake_guard.validate_command(command)
+    log_test(name, (verdict is not None) == should_block, verdict or f"No block on '{command}'")
+    assert_logged(name)
+
+
+@pytest.mark.parametrize("name,code,is_lazy", GUARD_CODE)
+def test_guard_code(name, code, is_lazy):
+    from memory.mistakes import mistake_guard
+
+    verdict = mistake_guard.validate_code(code)
+    log_test(name, (verdict is not None) == is_lazy, verdict or "No warning")
+    assert_logged(name)
+
+
+def _mistake_guard_script():
     section("3. MISTAKEGUARD (Safety)")
-    try:
-        from memory.mistakes import mistake_guard
-        
-        # Should block dangerous commands
-        blocked = mistake_guard.validate_command("rm -rf /")
-        log_test("Block rm -rf /", blocked is not None, blocked)
-        
-        blocked2 = mistake_guard.validate_command("sudo apt install something")
-        log_test("Block sudo", blocked2 is not None, blocked2)
-        
-        # Should allow safe commands
-        safe = mistake_guard.validate_command("ls -la")
-        log_test("Allow safe cmd", safe is None, "No block on 'ls -la'")
-        
-        # Lazy code detection
-        lazy = mistake_guard.validate_code("def foo():\n    # ... rest of code\n    pass")
-        log_test("Detect lazy code", lazy is not None, lazy)
-        
-        good_code = mistake_guard.validate_code("def foo():\n    return 42")
-        log_test("Allow good code", good_code is None, "No warning")
-    except Exception as e:
-        log_test("MistakeGuard", False, str(e))
+    for case in GUARD_COMMANDS:
+        _run_check(case[0], test_guard_command, *case)
+    for case in GUARD_CODE:
+        _run_check(case[0], test_guard_code, *case)
 
-    # ══════════════════════════════════════════════════════════════════
-    # 4. SQLITE SESSION DB
-    # ══════════════════════════════════════════════════════════════════
+
+# ══════════════════════════════════════════════════════════════════════
+# 4. SQLITE SESSION DB
+# ══════════════════════════════════════════════════════════════════════
+def test_session_db(session_db):
     section("4. SQLITE SESSION DB")
-    try:
-        from memory.db import memory_client
-        import uuid
-        
-        test_session = f"test-{uuid.uuid4()}"
-        memory_client.log_event(test_session, "test_event", "Integration test entry")
-        
-        # Cross-verify: retrieve the event
-        history = memory_client.get_session_history(test_session)
-        log_test("DB log + retrieve", len(history) > 0 and history[0]["content"] == "Integration test entry",
-                 f"Retrieved {len(history)} event(s)")
-    except Exception as e:
-        log_test("Session DB", False, str(e))
+    import sqlite3
 
-    # ══════════════════════════════════════════════════════════════════
-    # 5. SKILL REGISTRY
-    # ══════════════════════════════════════════════════════════════════
+    test_session = f"test-{os.getpid()}-{next(_session_ids)}"
+    session_db.log_event(test_session, "test_event", "Integration test entry")
+
+    # Cross-verify: retrieve the event
+    history = session_db.get_session_history(test_session)
+    log_test("DB log + retrieve", len(history) > 0 and history[0]["content"] == "Integration test entry",
+             f"Retrieved {len(history)} event(s)")
+
+    # Bulk seeding: one transaction for many rows
+    bulk_session = f"{test_session}-bulk"
+    rows = [(bulk_session, "test_event", f"Bulk entry {i}", None) for i in range(100)]
+    logged = session_db.bulk_log_events(rows)
+    with sqlite3.connect(session_db.db_path) as conn:
+        count = conn.execute(
+            "SELECT COUNT(*) FROM events WHERE session_id = ?", (bulk_session,)
+        ).fetchone()[0]
+    log_test("DB bulk log", logged == 100 and count == 100, f"Logged {logged}, counted {count}")
+    assert_logged("DB log + retrieve", "DB bulk log")
+
+
+# ══════════════════════════════════════════════════════════════════════
+# 5. SKILL REGISTRY
+# ══════════════════════════════════════════════════════════════════════
+SKILL_CASES = [
+    # (check name, input, substrings the reply must contain)
+    ("/help command", "/help", ["/commit", "/status"]),
+    ("Unknown skill handling", "/nonexistent", ["Unknown skill"]),
+]
+
+
+@pytest.mark.parametrize("name,command,expected", SKILL_CASES)
+def test_skill(name, command, expected):
+    from core.skills import skill_registry
+
+    reply = skill_registry.execute_skill(command)
+    log_test(name, all(part in reply for part in expected), reply)
+    assert_logged(name)
+
+
+def _skill_registry_script():
     section("5. SKILL REGISTRY")
-    try:
-        from core.skills import skill_registry
-        
-        # /help should list skills
-        help_result = skill_registry.execute_skill("/help")
-        log_test("/help command", "/commit" in help_result and "/status" in help_result, help_result)
-        
-        # Unknown skill
-        unknown = skill_registry.execute_skill("/nonexistent")
-        log_test("Unknown skill handling", "Unknown skill" in unknown, unknown)
-    except Exception as e:
-        log_test("Skill Registry", False, str(e))
+    for case in SKILL_CASES:
+        _run_check(case[0], test_skill, *case)
 
-    # ══════════════════════════════════════════════════════════════════
-    # 6. HEARTBEAT SCHEDULER
-    # ══════════════════════════════════════════════════════════════════
+
+# ══════════════════════════════════════════════════════════════════════
+# 6. HEARTBEAT SCHEDULER
+# ══════════════════════════════════════════════════════════════════════
+def test_heartbeat_scheduler():
     section("6. HEARTBEAT SCHEDULER")
-    try:
-        import schedule as schedule_lib
-        from core.scheduler import HeartbeatScheduler
-        
-        hb = HeartbeatScheduler()
-        schedule_lib.clear()
-        schedule_lib.every(1).seconds.do(hb._pulse)
-        hb._jobs_registered = 1
-        
-        import threading
-        hb._stop_event.clear()
-        hb._thread = threading.Thread(target=hb._run_loop, name="Test-HB", daemon=True)
-        hb._thread.start()
-        
-        log_test("Heartbeat start", hb.is_alive, "Thread alive")
-        
-        time.sleep(2)
-        log_test("Heartbeat pulse", hb._pulse_count > 0, f"Pulse count: {hb._pulse_count}")
-        
-        hb.stop()
-        time.sleep(0.5)
-        log_test("Heartbeat stop", not hb.is_alive, "Thread stopped")
-    except Exception as e:
-        log_test("Heartbeat", False, str(e))
+    from core.scheduler import HeartbeatScheduler
 
-    # ══════════════════════════════════════════════════════════════════
-    # 7. MCP BRIDGE
-    # ══════════════════════════════════════════════════════════════════
+    hb = HeartbeatScheduler()
+
+    # Pulse logic, synchronously (no thread or clock involved)
+    hb._pulse()
+    hb._pulse()
+    log_test("Heartbeat pulse", hb._pulse_count == 2 and hb._first_pulse.is_set(),
+             f"Pulse count: {hb._pulse_count}")
+
+    # Thread lifecycle; the timed loop itself is covered by tests/test_heartbeat.py
+    hb.start()
+    log_test("Heartbeat start", hb.is_alive, "Thread alive")
+
+    hb.stop()  # also clears the default jobs start() registered
+    stopped = hb._stopped.wait(timeout=1.0)
+    log_test("Heartbeat stop", stopped and not hb.is_alive, "Thread stopped")
+    assert_logged("Heartbeat pulse", "Heartbeat start", "Heartbeat stop")
+
+
+# ══════════════════════════════════════════════════════════════════════
+# 7. MCP BRIDGE
+# ══════════════════════════════════════════════════════════════════════
+def test_mcp_bridge(mcp_bridge):
+    # Shares the session's npx server with tests/test_mcp.py under pytest.
     section("7. MCP BRIDGE")
-    try:
-        from core.mcp_client import MCPBridge
-        
-        test_dir = os.path.realpath("/tmp/arka_integ_test")
-        os.makedirs(test_dir, exist_ok=True)
-        with open(os.path.join(test_dir, "probe.txt"), "w") as f:
-            f.write("MCP-PROBE-OK")
-        
-        bridge = MCPBridge()
-        bridge.connect("fs-test", "npx", ["-y", "@modelcontextprotocol/server-filesystem", test_dir])
-        
-        tools = bridge.list_tools()
-        log_test("MCP connect + list", len(tools) > 0, f"{len(tools)} tools from fs-test")
-        
-        content = bridge.call_tool("read_file", {"path": os.path.join(test_dir, "probe.txt")})
-        log_test("MCP call_tool (cross-verify)", "MCP-PROBE-OK" in content, f"Got: {content[:40]}")
-        
-        bridge.disconnect_all()
-        log_test("MCP disconnect", not bridge.status["running"], "Clean shutdown")
-        
-        # Cleanup
-        os.remove(os.path.join(test_dir, "probe.txt"))
-        os.rmdir(test_dir)
-    except Exception as e:
-        log_test("MCP Bridge", False, str(e))
+    bridge, root = mcp_bridge
+    tools = bridge.list_tools()
+    log_test("MCP connect + list", len(tools) > 0, f"{len(tools)} tools from fs")
 
-    # ══════════════════════════════════════════════════════════════════
-    # 8. LLM EXECUTION: Simple Math (Cross-Verify)
-    # ══════════════════════════════════════════════════════════════════
+    content = bridge.call_tool("read_file", {"path": str(root / "probe.txt")})
+    log_test("MCP call_tool (cross-verify)", MCP_PROBE_TEXT in content, f"Got: {content[:40]}")
+    assert_logged("MCP connect + list", "MCP call_tool (cross-verify)")
+
+
+def _mcp_bridge_script():
+    # Script mode: own server in a temp dir, plus an explicit disconnect check.
+    with mcp_probe_dir() as root:
+        try:
+            bridge = open_fs_bridge(root)
+        except Exception:
+            section("7. MCP BRIDGE")  # test_mcp_bridge() never got to print it
+            raise
+        try:
+            test_mcp_bridge((bridge, root))
+        finally:
+            bridge.disconnect_all()
+            log_test("MCP disconnect", not bridge.status["running"], "Clean shutdown")
+    del bridge
+    gc.collect()
+
+
+# ══════════════════════════════════════════════════════════════════════
+# 8. LLM EXECUTION: Simple Math (Cross-Verify)
+# ══════════════════════════════════════════════════════════════════════
+@pytest.mark.slow
+def test_llm_math(engine):
     section("8. LLM EXECUTION: Simple Task")
-    try:
-        result = engine.run("What is 137 * 29? Reply with ONLY the number, nothing else.")
-        # Cross-verify: 137 * 29 = 3973
-        correct = "3973" in str(result)
-        log_test("LLM math (cross-verify)", correct, f"Agent said: {result}, expected: 3973")
-    except Exception as e:
-        log_test("LLM simple task", False, str(e))
+    result = engine.run("What is 137 * 29? Reply with ONLY the number, nothing else.")
+    # Cross-verify: 137 * 29 = 3973
+    correct = "3973" in _ints(result)
+    log_test("LLM math (cross-verify)", correct, f"Agent said: {result}, expected: 3973")
+    assert correct, result
 
-    # ══════════════════════════════════════════════════════════════════
-    # 9. LLM EXECUTION: Memory Recall (Cross-Verify)
-    # ══════════════════════════════════════════════════════════════════
+
+# ══════════════════════════════════════════════════════════════════════
+# 9. LLM EXECUTION: Memory Recall (Cross-Verify)
+# ══════════════════════════════════════════════════════════════════════
+@pytest.mark.slow
+def test_llm_memory(engine):
     section("9. LLM EXECUTION: Memory Recall")
+    # Add a known fact first
+    engine.semantic_memory.append_fact("The user's favorite number is 7734.")
+
+    # Reuse the engine; just rebuild its prompt to pick up the new fact
+    engine.reload_memory()
+    result = engine.run("What is my favorite number? Reply with ONLY the number.")
+
+    # Cross-verify
+    correct = "7734" in _ints(result)
+    log_test("LLM memory recall (cross-verify)", correct, f"Agent said: {result}, expected: 7734")
+    assert correct, result
+
+
+# ══════════════════════════════════════════════════════════════════════
+# 10. LLM EXECUTION: Tool Usage - TODO (Cross-Verify)
+# ══════════════════════════════════════════════════════════════════════
+@pytest.mark.slow
+def test_llm_tool_use(engine):
+    section("10. LLM EXECUTION: Tool Usage (todo_add)")
+    result = engine.run("Add a todo item: 'Fix integration test bugs'. Reply with the confirmation.")
+
+    # Cross-verify by checking the todo list directly. todo_add updates the
+    # in-memory list; only reread the file if the task isn't there.
+    from tools.todo import manager as todo_manager
+    found = todo_manager.contains("Fix integration test bugs")
+    if not found:
+        todo_manager._load()  # reload from disk
+        found = todo_manager.contains("Fix integration test bugs")
+    log_test("LLM tool use (cross-verify)", found,
+             f"Agent said: {str(result)[:80]}... | Todo list has {len(todo_manager.todos)} items, target found: {found}")
+    # Keep the (shared) todo list out of a failure traceback's locals
+    del todo_manager
+    assert found, str(result)[:200]
+
+
+def _run_check(name, check, *args):
+    """Script mode: run a pytest-style check without stopping the report."""
     try:
-        # Add a known fact first
-        mem.append_fact("The user's favorite number is 7734.")
-        
-        # Re-init engine to pick up the new fact
-        engine2 = ArkaEngine()
-        result2 = engine2.run("What is my favorite number? Reply with ONLY the number.")
-        
-        # Cross-verify
-        correct2 = "7734" in str(result2)
-        log_test("LLM memory recall (cross-verify)", correct2, f"Agent said: {result2}, expected: 7734")
-        
-        # Cleanup
-        with open(mem.profile_path, "r") as f:
-            lines = f.readlines()
-        with open(mem.profile_path, "w") as f:
-            for line in lines:
-                if "7734" not in line:
-                    f.write(line)
+        check(*args)
+    except AssertionError:
+        pass  # already recorded by log_test
     except Exception as e:
-        log_test("LLM memory recall", False, str(e))
+        log_test(name, False, str(e))
 
-    # ══════════════════════════════════════════════════════════════════
-    # 10. LLM EXECUTION: Tool Usage - TODO (Cross-Verify)
-    # ══════════════════════════════════════════════════════════════════
-    section("10. LLM EXECUTION: Tool Usage (todo_add)")
+
+def _run_buffered(name, check, *args):
+    """_run_check() with output and results captured; returns (lines, results)."""
+    _report.lines, _report.results = [], {}
     try:
-        result3 = engine.run("Add a todo item: 'Fix integration test bugs'. Reply with the confirmation.")
-        
-        # Cross-verify by checking the todo list directly
-        # The TodoManager saves to disk, so reload from file for true cross-verification
-        from tools.todo import manager as todo_manager
-        todo_manager._load()  # reload from disk
-        all_todos = todo_manager.todos  # correct attribute name
-        found = any("Fix integration test bugs" in t.get("task", "") for t in all_todos)
-        log_test("LLM tool use (cross-verify)", found, 
-                 f"Agent said: {str(result3)[:80]}... | Todo list has {len(all_todos)} items, target found: {found}")
+        _run_check(name, check, *args)
+        return _report.lines, _report.results
+    finally:
+        del _report.lines, _report.results
+
+
+def run_all_tests():
+    try:
+        from core.engine import ArkaEngine
+        engine = ArkaEngine()
     except Exception as e:
-        log_test("LLM tool use", False, str(e))
+        section("1. ENGINE INITIALIZATION")
+        log_test("Engine init", False, str(e))
+        print(f"{RED}FATAL: Engine failed to initialize. Aborting remaining tests.{RESET}")
+        return
+    _run_check("Engine init", test_engine_init, engine)
+
+    # The profile and DB paths come from the environment set in __main__.
+    from core.memory import MemoryManager
+    from memory.db import memory_client
+
+    # Sections 2-5 and 7 are independent: run them concurrently so the npx
+    # spawn overlaps the file and DB work. The heartbeat (6) owns the global
+    # `schedule` jobs, so it runs on this thread meanwhile. Reports are
+    # printed afterwards in section order.
+    independent = [
+        ("Memory system", test_semantic_memory, MemoryManager()),
+        ("MistakeGuard", _mistake_guard_script),
+        ("Session DB", test_session_db, memory_client),
+        ("Skill Registry", _skill_registry_script),
+        ("MCP Bridge", _mcp_bridge_script),
+    ]
+    with ThreadPoolExecutor(max_workers=len(independent)) as pool:
+        futures = [pool.submit(_run_buffered, *job) for job in independent]
+        heartbeat = _run_buffered("Heartbeat", test_heartbeat_scheduler)
+        reports = [f.result() for f in futures]
+    reports.insert(4, heartbeat)
+    for lines, section_results in reports:
+        sys.stdout.write("\n".join(lines) + "\n")
+        results.update(section_results)
+
+    _run_check("LLM simple task", test_llm_math, engine)
+    _run_check("LLM memory recall", test_llm_memory, engine)
+    _run_check("LLM tool use", test_llm_tool_use, engine)
+
+    del engine
+    gc.collect()
 
     # ══════════════════════════════════════════════════════════════════
     # SUMMARY
@@ -277,22 +428,26 @@ def run_all_tests():
     section("FINAL REPORT")
     passed = sum(1 for v in results.values() if v)
     total = len(results)
-    
-    for name, ok in results.items():
-        icon = f"{GREEN}✅{RESET}" if ok else f"{RED}❌{RESET}"
-        print(f"  {icon} {name}")
-    
-    print(f"\n{BLUE}{'═'*60}{RESET}")
+
+    sys.stdout.write("".join(f"  {ICON_OK if ok else ICON_FAIL} {name}\n" for name, ok in results.items()))
+
+    print(f"\n{SUMMARY_RULE}")
     if passed == total:
         print(f"  {GREEN}🎉 ALL {total}/{total} TESTS PASSED!{RESET}")
     else:
         failed = total - passed
         print(f"  {YELLOW}⚠️  {passed}/{total} PASSED, {failed} FAILED{RESET}")
-    print(f"{BLUE}{'═'*60}{RESET}")
-    
+    print(SUMMARY_RULE)
+
     if passed < total:
         sys.exit(1)
 
 
 if __name__ == "__main__":
-    run_all_tests()
+    # Point the profile and memory DBs at throwaway locations before any
+    # memory module is imported (their paths are read at import time).
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["ARKA_PROFILE_PATH"] = os.path.join(tmp, "user_profile.md")
+        os.environ["ARKA_MEM_DB"] = ":memory:"
+        os.environ["ARKA_SESSION_DB"] = os.path.join(tmp, "session_history.db")
+        run_all_tests()
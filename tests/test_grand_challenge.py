@@ -1,9 +1,10 @@
-from core.engine import ArkaEngine
-from core.modes.planning import PlanningMode
 import os
 import time
 
 def run_grand_challenge():
+    from core.engine import ArkaEngine
+    from core.modes.planning import PlanningMode
+
     print("🚀 STARTING GRAND CHALLENGE: The 8 Trials of ARKA")
     engine = ArkaEngine()
     planner = PlanningMode(engine)
@@ -12,6 +12,7 @@ import sys, os
 sys.path.insert(0, os.getcwd())
 
 import time
+import threading
 import schedule as schedule_lib
 from core.scheduler import HeartbeatScheduler
 
@@ -30,9 +31,11 @@ def test_heartbeat():
     
     # Register a fast custom job to test execution
     custom_fired = []
+    custom_signal = threading.Semaphore(0)
     def test_job():
         custom_fired.append(time.time())
         print("   ⚡ Custom job fired!")
+        custom_signal.release()
 
     # Clear any global schedule state from imports
     schedule_lib.clear()
@@ -46,7 +49,6 @@ def test_heartbeat():
     hb._stop_event.clear()
 
     # Start background thread
-    import threading
     hb._thread = threading.Thread(target=hb._run_loop, name="Test-Heartbeat", daemon=True)
     hb._thread.start()
 
@@ -57,10 +59,12 @@ def test_heartbeat():
         print("   ❌ Heartbeat thread failed to start!")
 
     # ─── Test 2: Wait for pulse ───────────────────────────────────────
-    print("🧪 Test 2: Waiting 4 seconds for pulse + custom job...")
-    time.sleep(4)
+    print("🧪 Test 2: Waiting for pulse + custom job...")
+    # Wake as soon as each fires; the timeouts are only the failure bound.
+    pulsed = hb._first_pulse.wait(timeout=5)
+    custom_signal.acquire(timeout=3)
 
-    if hb._pulse_count > 0:
+    if pulsed and hb._pulse_count > 0:
         print(f"   ✅ Pulse fired! Count: {hb._pulse_count}")
         results["pulse"] = True
     else:
@@ -85,9 +89,9 @@ def test_heartbeat():
     # ─── Test 4: Graceful Shutdown ────────────────────────────────────
     print("🧪 Test 4: Stopping Heartbeat...")
     hb.stop()
-    time.sleep(0.5)
+    stopped = hb._stopped.wait(timeout=1.0)
 
-    if not hb.is_alive:
+    if stopped and not hb.is_alive:
         print("   ✅ Heartbeat stopped gracefully!")
         results["shutdown"] = True
     else:
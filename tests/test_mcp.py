@@ -2,61 +2,35 @@
 tests/test_mcp.py — Verification for Phase 5.3: MCP Integration
 
 Tests:
-1. MCPBridge initializes without errors.
-2. Connect to @modelcontextprotocol/server-filesystem.
-3. List tools from connected server.
-4. Call 'read_file' tool to read a test file.
-5. Graceful disconnect.
+1. Connect to @modelcontextprotocol/server-filesystem (shared `mcp_bridge` fixture).
+2. List tools from connected server.
+3. Call 'read_file' tool to read a test file.
+4. Graceful disconnect (fixture teardown; checked explicitly in script mode).
 """
 
 import sys, os
 sys.path.insert(0, os.getcwd())
 
-import time
-from core.mcp_client import MCPBridge
+from _support import MCP_PROBE_TEXT, mcp_probe_dir, open_fs_bridge
 
-def test_mcp_integration():
+def check_mcp_bridge(bridge, root):
     results = {
-        "init": False,
         "connect": False,
         "list_tools": False,
         "call_tool": False,
-        "disconnect": False,
     }
 
-    # ─── Setup: Create a test file ────────────────────────────────────
-    # macOS resolves /tmp -> /private/tmp, so we use realpath
-    test_dir = os.path.realpath("/tmp/arka_mcp_test")
-    os.makedirs(test_dir, exist_ok=True)
-    test_file = os.path.join(test_dir, "hello.txt")
-    with open(test_file, "w") as f:
-        f.write("ARKA MCP Test — Hello from the other side!")
-
-    # ─── Test 1: Init ─────────────────────────────────────────────────
-    print("🧪 Test 1: Initializing MCPBridge...")
-    bridge = MCPBridge()
+    # ─── Test 1: Connected ────────────────────────────────────────────
+    print("🧪 Test 1: Connected to @modelcontextprotocol/server-filesystem...")
     print(f"   Status: {bridge.status}")
-    results["init"] = True
-    print("   ✅ Init successful!")
-
-    # ─── Test 2: Connect to filesystem server ─────────────────────────
-    print("🧪 Test 2: Connecting to @modelcontextprotocol/server-filesystem...")
-    try:
-        bridge.connect(
-            server_name="filesystem",
-            command="npx",
-            args=["-y", "@modelcontextprotocol/server-filesystem", test_dir],
-        )
-        print(f"   Status: {bridge.status}")
+    if "fs" in bridge.status["connected_servers"]:
         results["connect"] = True
         print("   ✅ Connected!")
-    except Exception as e:
-        print(f"   ❌ Connection failed: {e}")
-        bridge.disconnect_all()
-        return results
+    else:
+        print("   ❌ Server not connected.")
 
-    # ─── Test 3: List tools ───────────────────────────────────────────
-    print("🧪 Test 3: Listing tools...")
+    # ─── Test 2: List tools ───────────────────────────────────────────
+    print("🧪 Test 2: Listing tools...")
     tools = bridge.list_tools()
     print(f"   Found {len(tools)} tools:")
     for t in tools:
@@ -67,12 +41,12 @@ def test_mcp_integration():
     else:
         print("   ❌ No tools found.")
 
-    # ─── Test 4: Call tool ────────────────────────────────────────────
-    print("🧪 Test 4: Reading test file via MCP...")
+    # ─── Test 3: Call tool ────────────────────────────────────────────
+    print("🧪 Test 3: Reading test file via MCP...")
     try:
-        content = bridge.call_tool("read_file", {"path": test_file})
+        content = bridge.call_tool("read_file", {"path": str(root / "probe.txt")})
         print(f"   File content: {content}")
-        if "Hello from the other side" in content:
+        if MCP_PROBE_TEXT in content:
             results["call_tool"] = True
             print("   ✅ File read successfully via MCP!")
         else:
@@ -80,14 +54,30 @@ def test_mcp_integration():
     except Exception as e:
         print(f"   ❌ Tool call failed: {e}")
 
-    # ─── Test 5: Disconnect ───────────────────────────────────────────
-    print("🧪 Test 5: Disconnecting...")
-    bridge.disconnect_all()
-    if not bridge.status["running"]:
-        results["disconnect"] = True
-        print("   ✅ Disconnected cleanly!")
-    else:
-        print("   ❌ Still running after disconnect!")
+    return results
+
+def test_mcp_integration(mcp_bridge):
+    results = check_mcp_bridge(*mcp_bridge)
+    assert all(results.values()), results
+
+def main():
+    with mcp_probe_dir() as root:
+        try:
+            bridge = open_fs_bridge(root)
+        except Exception as e:
+            print(f"   ❌ Connection failed: {e}")
+            sys.exit(1)
+
+        results = check_mcp_bridge(bridge, root)
+
+        # ─── Test 4: Disconnect ───────────────────────────────────────
+        print("🧪 Test 4: Disconnecting...")
+        bridge.disconnect_all()
+        results["disconnect"] = not bridge.status["running"]
+        if results["disconnect"]:
+            print("   ✅ Disconnected cleanly!")
+        else:
+            print("   ❌ Still running after disconnect!")
 
     # ─── Summary ──────────────────────────────────────────────────────
     print("\n" + "=" * 50)
@@ -104,9 +94,5 @@ def test_mcp_integration():
         print("\n⚠️  Some tests failed.")
         sys.exit(1)
 
-    # Cleanup
-    os.remove(test_file)
-    os.rmdir(test_dir)
-
 if __name__ == "__main__":
-    test_mcp_integration()
+    main()
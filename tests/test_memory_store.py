@@ -1,10 +1,12 @@
+import json
 import os
+import sqlite3
 import sys
 import tempfile
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-from memory.store import MemoryStore
+from memory.store import SCHEMA_VERSION, MemoryStore
 
 
 def test_memory_store_basic():
@@ -40,8 +42,169 @@ def test_memory_store_basic():
         export_path = os.path.join(tmp, "export.json")
         exported = store.export_facts(export_path)
         assert os.path.exists(exported)
+        with open(exported) as f:
+            data = json.load(f)
+        assert len(data) == stats["facts"]
+        assert all(item["is_deleted"] == 0 for item in data)
+
+        empty = MemoryStore(db_path=os.path.join(tmp, "empty.db"))
+        with open(empty.export_facts(os.path.join(tmp, "empty.json"))) as f:
+            assert json.load(f) == []
+
+
+def test_memory_store_bulk_events():
+    with tempfile.TemporaryDirectory() as tmp:
+        store = MemoryStore(db_path=os.path.join(tmp, "mem.db"))
+
+        rows = [("s1", "user_msg", f"message {i}", {"i": i}) for i in range(50)]
+        assert store.add_events_bulk(rows) == 50
+        assert store.add_events_bulk([]) == 0
+        assert store.stats()["events"] == 50
+
+
+def test_memory_store_bulk_facts():
+    store = MemoryStore(db_path=":memory:")
+    rows = [{"subject": "user", "predicate": "note", "object": f"fact {i}"} for i in range(20)]
+    rows.append({"subject": "user", "predicate": "note", "object": "pinned", "locked": True})
+    rows.append({"subject": "user", "predicate": " ", "object": "skipped"})
+    assert store.insert_facts_bulk(rows, ttl_days=None) == 21
+    assert store.insert_facts_bulk([]) == 0
+    assert store.stats()["facts"] == 21
+    pinned = store.search_facts("pinned")[0]
+    assert store.get_fact_by_id(pinned["id"])["locked"] == 1
+
+
+def test_memory_store_schema_migration():
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "mem.db")
+        # Pre-migration layout: no `locked` column, boolean is_deleted index.
+        with sqlite3.connect(db_path) as conn:
+            conn.execute(
+                """
+                CREATE TABLE facts (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    subject TEXT NOT NULL,
+                    predicate TEXT NOT NULL,
+                    object TEXT NOT NULL,
+                    confidence REAL DEFAULT 0.7,
+                    source_event_id INTEGER,
+                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                    updated_at DATETIME,
+                    expires_at DATETIME,
+                    is_deleted INTEGER DEFAULT 0,
+                    deleted_at DATETIME,
+                    metadata TEXT
+                )
+                """
+            )
+            conn.execute("CREATE INDEX idx_facts_deleted ON facts(is_deleted)")
+
+        store = MemoryStore(db_path=db_path)
+        with sqlite3.connect(db_path) as conn:
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(facts)")}
+            indexes = {row[1] for row in conn.execute("PRAGMA index_list(facts)")}
+        assert version == SCHEMA_VERSION
+        assert "locked" in columns
+        assert "idx_facts_deleted" not in indexes
+        assert "idx_facts_live_recent" in indexes
+
+        fact_id = store.insert_fact("user", "note", "Migrated")
+        assert store.mark_fact_locked(fact_id, locked=True) is True
+
+
+def test_memory_store_in_memory():
+    store = MemoryStore(db_path=":memory:")
+    fact_id = store.insert_fact("user", "preference", "Dark mode")
+    assert store.get_fact_by_id(fact_id)["object"] == "Dark mode"
+    assert store.stats()["facts"] == 1
+    assert store.get_recent_facts_projection() == [(fact_id, "user", "preference", "Dark mode")]
+
+    # Each in-memory store is its own database.
+    assert MemoryStore(db_path=":memory:").stats()["facts"] == 0
+
+
+def test_memory_store_reuses_connection():
+    with tempfile.TemporaryDirectory() as tmp:
+        store = MemoryStore(db_path=os.path.join(tmp, "mem.db"))
+        # Same connection (and statement cache) for every call.
+        assert store._connect() is store._connect()
+
+        ids = [store.add_event("s1", "user_msg", f"message {i}") for i in range(1000)]
+        assert None not in ids
+
+        # Closing drops the connection; the next call reopens the file.
+        store.close()
+        assert store.stats()["events"] == 1000
+        store.close()
+
+
+def test_memory_store_pragmas():
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = MemoryStore(db_path=os.path.join(tmp, "mem.db"))._connect()
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        assert conn.execute("PRAGMA mmap_size").fetchone()[0] == 0
+
+
+def test_memory_store_flush():
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "mem.db")
+        store = MemoryStore(db_path=db_path)
+        store.add_event("s1", "user_msg", "hello")
+        store.flush()
+        assert os.path.getsize(db_path + "-wal") == 0
+
+        with sqlite3.connect(db_path) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM events").fetchone()[0] == 1
+
+        MemoryStore(db_path=":memory:").flush()
+
+
+def test_memory_store_fts_search():
+    store = MemoryStore(db_path=":memory:")
+    fact_id = store.upsert_fact("user", "preferred_name", "Commander")
+    store.insert_fact("user", "note", "Likes dark mode")
+
+    # Case-insensitive substring, as with the old LIKE scan
+    assert [r["id"] for r in store.search_facts("mmand")] == [fact_id]
+    assert [r["id"] for r in store.search_facts("COMMANDER")] == [fact_id]
+    assert len(store.search_facts("dark mode")) == 1
+    assert len(store.search_facts("ke")) == 1  # below trigram length: LIKE path
+
+    # Updates and soft deletes are reflected
+    store.upsert_fact("user", "preferred_name", "Captain")
+    assert store.search_facts("Commander") == []
+    assert store.search_facts("Captain")
+    store.mark_fact_deleted(fact_id)
+    assert store.search_facts("Captain") == []
+
+
+def test_memory_store_fts_backfill():
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "mem.db")
+        store = MemoryStore(db_path=db_path)
+        store.insert_fact("user", "note", "Prefers tea")
+        store.close()
+
+        # A DB from before the index existed: drop it, reopen, search again.
+        with sqlite3.connect(db_path) as conn:
+            conn.executescript(
+                "DROP TRIGGER facts_fts_ai; DROP TRIGGER facts_fts_ad; "
+                "DROP TRIGGER facts_fts_au; DROP TABLE facts_fts;"
+            )
+        assert MemoryStore(db_path=db_path).search_facts("tea")
 
 
 if __name__ == "__main__":
     test_memory_store_basic()
+    test_memory_store_bulk_events()
+    test_memory_store_bulk_facts()
+    test_memory_store_schema_migration()
+    test_memory_store_in_memory()
+    test_memory_store_reuses_connection()
+    test_memory_store_pragmas()
+    test_memory_store_flush()
+    test_memory_store_fts_search()
+    test_memory_store_fts_backfill()
     print("ok")
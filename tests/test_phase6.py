@@ -8,46 +8,72 @@ Tests all 5 new modules:
   6.4 Context Sensor
   6.5 Tone Adapter
   + Engine integration with all modules
+
+Run it as a script for the full report; under pytest each module is its
+own test (tone cases are parametrized).
 """
 
-import sys, os, time
+import sys, os, time, io, tempfile
 sys.path.insert(0, os.getcwd())
 
-GREEN = "\033[92m"
-RED = "\033[91m"
-BLUE = "\033[94m"
-RESET = "\033[0m"
+import pytest
+
+from _color import BLUE, GREEN, RED, RESET
+
+from core.pattern_learner import PatternLearner
+from memory.db import memory_client
+from core.goal_manager import GoalManager
+from core.reflection import ReflectionEngine
+from core.context_sensor import ContextSensor
+from core.tone_adapter import tone_adapter
+
 results = {}
 
+# Report lines are collected per section and written to stdout in one go
+# when the next section starts (or at the end), instead of one write per line.
+_buf = io.StringIO()
+
+def _emit(text):
+    _buf.write(text)
+    _buf.write("\n")
+
+def _flush():
+    sys.stdout.write(_buf.getvalue())
+    sys.stdout.flush()
+    _buf.seek(0)
+    _buf.truncate(0)
+
+# (name, passed) for each check logged since the last section() call.
+_section_results = []
+
 def log_test(name, passed, detail=""):
     results[name] = passed
+    _section_results.append((name, passed))
     icon = f"{GREEN}✅{RESET}" if passed else f"{RED}❌{RESET}"
-    print(f"  {icon} {name}" + (f" — {detail}" if detail else ""))
+    _emit(f"  {icon} {name}" + (f" — {detail}" if detail else ""))
 
 def section(title):
-    print(f"\n{BLUE}{'─'*60}{RESET}")
-    print(f"{BLUE}  {title}{RESET}")
-    print(f"{BLUE}{'─'*60}{RESET}")
+    _flush()
+    _section_results.clear()
+    _emit(f"\n{BLUE}{'─'*60}{RESET}")
+    _emit(f"{BLUE}  {title}{RESET}")
+    _emit(f"{BLUE}{'─'*60}{RESET}")
 
 
-def run_tests():
+def _check_pattern_learner():
     # ══════════════════════════════════════════════════════════════════
     # 6.1 PATTERN LEARNER
     # ══════════════════════════════════════════════════════════════════
     section("6.1 Pattern Learner")
     try:
-        from core.pattern_learner import PatternLearner
-        from memory.db import memory_client
-        import uuid
-
         pl = PatternLearner(profile_path="memory/user_profile.md")
         
-        # Seed some test events
-        sid = f"pattern-test-{uuid.uuid4()}"
-        for _ in range(3):
-            memory_client.log_event(sid, "user_msg", "play some music please")
-        for _ in range(2):
-            memory_client.log_event(sid, "user_msg", "search for Python docs")
+        # Seed some test events (one transaction for the whole batch)
+        sid = f"pattern-test-{os.urandom(8).hex()}"
+        memory_client.bulk_log_events(
+            [(sid, "user_msg", "play some music please", None)] * 3
+            + [(sid, "user_msg", "search for Python docs", None)] * 2
+        )
         
         # Run learner
         patterns = pl.learn()
@@ -60,141 +86,142 @@ def run_tests():
     except Exception as e:
         log_test("Pattern Learner", False, str(e))
 
+
+def _check_goal_manager():
     # ══════════════════════════════════════════════════════════════════
     # 6.2 GOAL MANAGER
     # ══════════════════════════════════════════════════════════════════
     section("6.2 Goal Manager")
     try:
-        from core.goal_manager import GoalManager
-        import tempfile
+        # Use a temp dir to avoid polluting real goals
+        with tempfile.TemporaryDirectory() as tmpdir:
+            goals_file = os.path.join(tmpdir, "goals.json")
+            gm = GoalManager(goals_file=goals_file)
         
-        # Use temp file to avoid polluting real goals
-        tmp = tempfile.mktemp(suffix=".json")
-        gm = GoalManager(goals_file=tmp)
+            # Create
+            goal = gm.create_goal("Ship ARKA V3", ["Write tests", "Fix bugs", "Deploy"])
+            log_test("Goal create", goal.id is not None, f"ID: {goal.id}, Steps: {len(goal.steps)}")
         
-        # Create
-        goal = gm.create_goal("Ship ARKA V3", ["Write tests", "Fix bugs", "Deploy"])
-        log_test("Goal create", goal.id is not None, f"ID: {goal.id}, Steps: {len(goal.steps)}")
+            # List active
+            active = gm.get_active_goals()
+            log_test("Goal list active", len(active) == 1, f"{len(active)} active goal(s)")
         
-        # List active
-        active = gm.get_active_goals()
-        log_test("Goal list active", len(active) == 1, f"{len(active)} active goal(s)")
+            # Advance
+            msg = gm.advance_goal(goal.id)
+            log_test("Goal advance", "1/3" in msg, msg)
         
-        # Advance
-        msg = gm.advance_goal(goal.id)
-        log_test("Goal advance", "1/3" in msg, msg)
+            # Check next step
+            log_test("Goal next step", goal.next_step == "Fix bugs", f"Next: {goal.next_step}")
         
-        # Check next step
-        log_test("Goal next step", goal.next_step == "Fix bugs", f"Next: {goal.next_step}")
+            # Complete
+            gm.complete_goal(goal.id)
+            log_test("Goal complete", goal.status == "completed", f"Status: {goal.status}")
         
-        # Complete
-        gm.complete_goal(goal.id)
-        log_test("Goal complete", goal.status == "completed", f"Status: {goal.status}")
-        
-        # Prompt injection
-        gm2 = GoalManager(goals_file=tmp)
-        gm2.create_goal("Test goal", ["Step A"])
-        prompt = gm2.format_for_prompt()
-        log_test("Goal prompt injection", "ACTIVE GOALS" in prompt, f"Prompt length: {len(prompt)}")
-        
-        # Cleanup
-        os.remove(tmp)
+            # Prompt injection
+            gm2 = GoalManager(goals_file=goals_file)
+            gm2.create_goal("Test goal", ["Step A"])
+            prompt = gm2.format_for_prompt()
+            log_test("Goal prompt injection", "ACTIVE GOALS" in prompt, f"Prompt length: {len(prompt)}")
     except Exception as e:
         log_test("Goal Manager", False, str(e))
 
+
+def _check_reflection():
     # ══════════════════════════════════════════════════════════════════
     # 6.3 REFLECTION ENGINE
     # ══════════════════════════════════════════════════════════════════
     section("6.3 Reflection Engine")
     try:
-        from core.reflection import ReflectionEngine
-        import tempfile
-        
-        tmp = tempfile.mktemp(suffix=".md")
-        os.makedirs(os.path.dirname(tmp) if os.path.dirname(tmp) else ".", exist_ok=True)
-        re_ = ReflectionEngine(learnings_path=tmp)
-        
-        # File exists
-        log_test("Learnings file created", os.path.exists(tmp))
-        
-        # Add learning
-        result = re_.add_learning("web_search works better with quoted phrases", "high")
-        log_test("Add learning", "Learned" in result, result)
-        
-        # Dedup
-        result2 = re_.add_learning("web_search works better with quoted phrases", "high")
-        log_test("Learning dedup", "Already known" in result2, result2)
-        
-        # Reflect on events
-        fake_events = [
-            {"type": "agent_error", "content": "ModuleNotFoundError: xyz"},
-            {"type": "agent_result", "content": "Success"},
-            {"type": "user_msg", "content": "I want dark mode for everything"},
-        ]
-        new_learnings = re_.reflect_on_events(fake_events)
-        log_test("Reflect on events", len(new_learnings) > 0, f"Extracted: {new_learnings}")
-        
-        os.remove(tmp)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            learnings = os.path.join(tmpdir, "learnings.md")
+            re_ = ReflectionEngine(learnings_path=learnings)
+        
+            # File exists
+            log_test("Learnings file created", os.path.exists(learnings))
+        
+            # Add learning
+            result = re_.add_learning("web_search works better with quoted phrases", "high")
+            log_test("Add learning", "Learned" in result, result)
+        
+            # Dedup
+            result2 = re_.add_learning("web_search works better with quoted phrases", "high")
+            log_test("Learning dedup", "Already known" in result2, result2)
+        
+            # Reflect on events
+            fake_events = [
+                {"type": "agent_error", "content": "ModuleNotFoundError: xyz"},
+                {"type": "agent_result", "content": "Success"},
+                {"type": "user_msg", "content": "I want dark mode for everything"},
+            ]
+            new_learnings = re_.reflect_on_events(fake_events)
+            log_test("Reflect on events", len(new_learnings) > 0, f"Extracted: {new_learnings}")
     except Exception as e:
         log_test("Reflection Engine", False, str(e))
 
+
+def _check_context_sensor():
     # ══════════════════════════════════════════════════════════════════
     # 6.4 CONTEXT SENSOR
     # ══════════════════════════════════════════════════════════════════
     section("6.4 Context Sensor")
     try:
-        from core.context_sensor import ContextSensor
-        
         cs = ContextSensor()
         ctx = cs.get_context()
         log_test("Context detection", "frontmost_app" in ctx, f"App: {ctx.get('frontmost_app')}, Window: {ctx.get('window_title')}")
         
+        calls = []
+        cs._run_osascript = lambda script: calls.append(script) or "unknown"
+        cs.get_context()
+        log_test("Context cached within TTL", not calls, f"{len(calls)} osascript call(s) on re-read")
+
         prompt = cs.format_for_prompt()
         has_content = len(prompt) > 0 or ctx["frontmost_app"] == "unknown"
         log_test("Context prompt format", has_content, f"Prompt: {prompt[:60]}..." if prompt else "Empty (unknown context)")
     except Exception as e:
         log_test("Context Sensor", False, str(e))
 
+
+# (check name, message, any of these words expected in the directive)
+TONE_CASES = [
+    ("Tone: urgent", "FIX THIS NOW!!!", ("concise", "rush")),
+    ("Tone: frustrated", "Why doesn't this work? It's broken again!", ("frustrated", "fix")),
+    ("Tone: casual", "Hey, what's up?", ("warm", "casual", "friendly")),
+    # Detailed/polite
+    ("Tone: detailed",
+     "Could you please explain in detail how the MCP bridge handles async to sync conversion?",
+     ("thorough", "detailed", "structured")),
+    # Terse (no question mark, just short)
+    ("Tone: terse", "ok", ("energy", "concise")),
+]
+
+
+def _check_tone(name, message, expected):
+    directive = tone_adapter.detect_tone(message)
+    log_test(name, any(word in directive.lower() for word in expected), directive.strip()[:60])
+
+
+def _check_tone_adapter():
     # ══════════════════════════════════════════════════════════════════
     # 6.5 TONE ADAPTER
     # ══════════════════════════════════════════════════════════════════
     section("6.5 Tone Adapter")
     try:
-        from core.tone_adapter import ToneAdapter
-        
-        ta = ToneAdapter()
-        
-        # Urgent
-        t1 = ta.detect_tone("FIX THIS NOW!!!")
-        log_test("Tone: urgent", "concise" in t1.lower() or "rush" in t1.lower(), t1.strip()[:60])
-        
-        # Frustrated
-        t2 = ta.detect_tone("Why doesn't this work? It's broken again!")
-        log_test("Tone: frustrated", "frustrated" in t2.lower() or "fix" in t2.lower(), t2.strip()[:60])
-        
-        # Casual
-        t3 = ta.detect_tone("Hey, what's up?")
-        log_test("Tone: casual", "warm" in t3.lower() or "casual" in t3.lower() or "friendly" in t3.lower(), t3.strip()[:60])
-        
-        # Detailed/polite
-        t4 = ta.detect_tone("Could you please explain in detail how the MCP bridge handles async to sync conversion?")
-        log_test("Tone: detailed", "thorough" in t4.lower() or "detailed" in t4.lower() or "structured" in t4.lower(), t4.strip()[:60])
-        
-        # Terse (no question mark, just short)
-        t5 = ta.detect_tone("ok")
-        log_test("Tone: terse", "energy" in t5.lower() or "concise" in t5.lower(), t5.strip()[:60])
+        for case in TONE_CASES:
+            _check_tone(*case)
     except Exception as e:
         log_test("Tone Adapter", False, str(e))
 
+
+def _check_engine():
     # ══════════════════════════════════════════════════════════════════
     # ENGINE INTEGRATION
     # ══════════════════════════════════════════════════════════════════
     section("ENGINE INTEGRATION (Phase 6)")
     try:
-        from core.engine import ArkaEngine
-        engine = ArkaEngine()
+        from _support import shared_engine
+        engine = shared_engine()
         
-        tool_names = [t.name for t in engine.tools.values()]
+        tool_names = engine.tool_names
         
         # Check new tools registered
         phase6_tools = ["set_goal", "list_goals", "advance_goal", "complete_goal"]
@@ -219,6 +246,55 @@ def run_tests():
     except Exception as e:
         log_test("Engine integration", False, str(e))
 
+
+SECTIONS = [
+    _check_pattern_learner, _check_goal_manager, _check_reflection,
+    _check_context_sensor, _check_tone_adapter, _check_engine,
+]
+
+
+# ─── pytest entry points: one test per section, so runners such as
+# pytest-xdist can spread them across workers ───────────────────────────
+
+def _assert_section(check, *args):
+    _section_results.clear()
+    try:
+        check(*args)
+    finally:
+        _flush()
+    failed = [name for name, passed in _section_results if not passed]
+    assert not failed, f"Failed: {failed}"
+
+
+def test_pattern_learner():
+    _assert_section(_check_pattern_learner)
+
+
+def test_goal_manager():
+    _assert_section(_check_goal_manager)
+
+
+def test_reflection():
+    _assert_section(_check_reflection)
+
+
+def test_context_sensor():
+    _assert_section(_check_context_sensor)
+
+
+@pytest.mark.parametrize("name,message,expected", TONE_CASES)
+def test_tone(name, message, expected):
+    _assert_section(_check_tone, name, message, expected)
+
+
+def test_engine_integration():
+    _assert_section(_check_engine)
+
+
+def run_tests():
+    for check in SECTIONS:
+        check()
+
     # ══════════════════════════════════════════════════════════════════
     # SUMMARY
     # ══════════════════════════════════════════════════════════════════
@@ -228,14 +304,15 @@ def run_tests():
     
     for name, ok in results.items():
         icon = f"{GREEN}✅{RESET}" if ok else f"{RED}❌{RESET}"
-        print(f"  {icon} {name}")
+        _emit(f"  {icon} {name}")
     
-    print(f"\n{BLUE}{'═'*60}{RESET}")
+    _emit(f"\n{BLUE}{'═'*60}{RESET}")
     if passed == total:
-        print(f"  {GREEN}🎉 ALL {total}/{total} PHASE 6 TESTS PASSED!{RESET}")
+        _emit(f"  {GREEN}🎉 ALL {total}/{total} PHASE 6 TESTS PASSED!{RESET}")
     else:
-        print(f"  {RED}⚠️  {passed}/{total} PASSED, {total-passed} FAILED{RESET}")
-    print(f"{BLUE}{'═'*60}{RESET}")
+        _emit(f"  {RED}⚠️  {passed}/{total} PASSED, {total-passed} FAILED{RESET}")
+    _emit(f"{BLUE}{'═'*60}{RESET}")
+    _flush()
     
     if passed < total:
         sys.exit(1)
@@ -7,6 +7,9 @@ Validates:
   2. Chrome Tools (all 11 tools registered, correct error handling)
   3. Extension files (manifest, background, content)
   4. Engine Integration (34 total tools)
+
+Run it as a script for the full report; under pytest each section is its
+own test.
 """
 
 import sys
@@ -14,26 +17,55 @@ import os
 import json
 import time
 import threading
+from concurrent.futures import ThreadPoolExecutor
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 results = []
 
+# Per-thread report buffer for sections run by _run_buffered(); unset means
+# print straight to stdout.
+_report = threading.local()
+
+
+def _emit(text):
+    lines = getattr(_report, "lines", None)
+    if lines is None:
+        print(text)
+    else:
+        lines.append(text)
+
 
 def section(title):
-    print(f"\n{'═' * 60}")
-    print(f"  {title}")
-    print(f"{'═' * 60}")
+    _emit(f"\n{'═' * 60}\n  {title}\n{'═' * 60}")
 
 
 def log_test(name, passed, detail=""):
     icon = "✅" if passed else "❌"
-    print(f"  {icon} {name}" + (f" — {detail}" if detail else ""))
-    results.append((name, passed))
+    _emit(f"  {icon} {name}" + (f" — {detail}" if detail else ""))
+    getattr(_report, "results", results).append((name, passed))
 
 
-def run_tests():
-    
+def _run_buffered(check):
+    """Run a section with its output and results captured; returns (lines, results)."""
+    _report.lines, _report.results = [], []
+    try:
+        check()
+        return _report.lines, _report.results
+    finally:
+        del _report.lines, _report.results
+
+
+def _dir_names(path):
+    """Entry names in `path`, or an empty set if it doesn't exist."""
+    try:
+        with os.scandir(path) as it:
+            return {entry.name for entry in it}
+    except FileNotFoundError:
+        return set()
+
+
+def _check_bridge():
     # ══════════════════════════════════════════════════════════════════
     # 1. BROWSER BRIDGE
     # ══════════════════════════════════════════════════════════════════
@@ -52,8 +84,7 @@ def run_tests():
                  f"connected={bridge.is_connected}")
 
         # Test start (server should listen)
-        bridge.start()
-        time.sleep(0.5)  # Wait for server thread
+        bridge.start()  # returns once the server has bound (or failed)
         log_test("Server started", 
                  bridge._thread is not None and bridge._thread.is_alive(),
                  "Background thread running")
@@ -64,6 +95,13 @@ def run_tests():
                  result["status"] == "error",
                  result.get("error", "")[:60])
 
+        # Waiting without an extension times out instead of hanging
+        t0 = time.perf_counter()
+        waited = bridge.wait_for_connection(0.2)
+        log_test("Wait for connection times out",
+                 not waited and time.perf_counter() - t0 < 1,
+                 f"connected={waited}")
+
         # Test auth flow
         bridge._auth_waiting = True
         bridge._auth_url = "https://accounts.google.com"
@@ -85,23 +123,45 @@ def run_tests():
                  f"keys: {list(status.keys())}")
 
         # Stop
-        bridge.stop()
-        time.sleep(0.3)
-        log_test("Bridge stopped", True)
+        bridge.stop()  # joins the server thread
+        log_test("Bridge stopped", bridge._thread is None)
+
+        # Read cache: repeated reads share one round trip, writes invalidate
+        cached = BrowserBridge(port=7779)
+        cached.connected, cached.extension_ws = True, object()
+        sent = []
+        cached._run_requests = lambda cmds, timeout: [sent.append(a) or {"status": "ok", "text": a} for a, _ in cmds]
+        cached.send_command("get_text", {"selector": "body"})
+        cached.send_command("get_text", {"selector": "body"})
+        log_test("Repeated read served from cache", sent == ["get_text"], f"sent={sent}")
+        cached.send_command("click", {"selector": "a"})
+        cached.send_command("get_text", {"selector": "body"})
+        log_test("Write clears read cache", sent == ["get_text", "click", "get_text"], f"sent={sent}")
+
+        # Screenshots are kept as decoded bytes and handed out by id
+        shot_id, size = cached.keep_screenshot("data:image/png;base64,iVBORw0KGgo=")
+        data = cached.screenshot_bytes(shot_id)
+        log_test("Screenshot kept by id",
+                 data is not None and bytes(data) == b"\x89PNG\r\n\x1a\n" and size == 8,
+                 f"id={shot_id} size={size}")
 
     except Exception as e:
         log_test("Browser Bridge", False, str(e))
 
+
+def _check_chrome_tools():
     # ══════════════════════════════════════════════════════════════════
     # 2. CHROME TOOLS
     # ══════════════════════════════════════════════════════════════════
     section("CHROME TOOLS")
 
     try:
+        from core.browser_bridge import NOT_CONNECTED_ERROR
         from tools.chrome_tools import (
             chrome_navigate, chrome_click, chrome_type, chrome_scroll,
             chrome_screenshot, chrome_get_dom, chrome_get_text,
-            chrome_list_tabs, chrome_new_tab, chrome_switch_tab, chrome_continue
+            chrome_list_tabs, chrome_new_tab, chrome_switch_tab, chrome_continue,
+            chrome_batch,
         )
 
         tool_list = [
@@ -120,28 +180,38 @@ def run_tests():
         # Test tools return error when bridge disconnected
         result = chrome_navigate("test.com")
         log_test("Navigate without bridge → error",
-                 "not connected" in result.lower() or "error" in result.lower(),
+                 NOT_CONNECTED_ERROR in result,
                  result[:60])
 
         result = chrome_click("#btn")
         log_test("Click without bridge → error",
-                 "not connected" in result.lower() or "error" in result.lower(),
+                 NOT_CONNECTED_ERROR in result,
                  result[:60])
 
         result = chrome_list_tabs()
         log_test("List tabs without bridge → error",
-                 "not connected" in result.lower() or "error" in result.lower(),
+                 NOT_CONNECTED_ERROR in result,
+                 result[:60])
+
+        result = chrome_batch([{"action": "get_text"}, {"action": "list_tabs"}])
+        log_test("Batch without bridge → error per command",
+                 result.count(NOT_CONNECTED_ERROR) == 2,
                  result[:60])
 
     except Exception as e:
         log_test("Chrome Tools import", False, str(e))
 
+
+def _check_extension_files():
     # ══════════════════════════════════════════════════════════════════
     # 3. EXTENSION FILES
     # ══════════════════════════════════════════════════════════════════
     section("EXTENSION FILES")
 
     ext_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "extension")
+    # One directory read each instead of a stat() per expected file.
+    ext_files = _dir_names(ext_dir)
+    icon_files = _dir_names(os.path.join(ext_dir, "icons"))
 
     # Manifest
     manifest_path = os.path.join(ext_dir, "manifest.json")
@@ -164,8 +234,8 @@ def run_tests():
 
     # Background.js
     bg_path = os.path.join(ext_dir, "background.js")
-    log_test("background.js exists", os.path.exists(bg_path))
-    if os.path.exists(bg_path):
+    log_test("background.js exists", "background.js" in ext_files)
+    if "background.js" in ext_files:
         with open(bg_path) as f:
             bg_content = f.read()
         log_test("Has WebSocket connect", "WebSocket" in bg_content)
@@ -174,8 +244,8 @@ def run_tests():
 
     # Content.js
     cs_path = os.path.join(ext_dir, "content.js")
-    log_test("content.js exists", os.path.exists(cs_path))
-    if os.path.exists(cs_path):
+    log_test("content.js exists", "content.js" in ext_files)
+    if "content.js" in ext_files:
         with open(cs_path) as f:
             cs_content = f.read()
         log_test("Has click handler", "handleClick" in cs_content)
@@ -184,23 +254,24 @@ def run_tests():
 
     # Icons
     for size in [16, 48, 128]:
-        icon_path = os.path.join(ext_dir, "icons", f"icon{size}.png")
-        log_test(f"icon{size}.png exists", os.path.exists(icon_path))
+        log_test(f"icon{size}.png exists", f"icon{size}.png" in icon_files)
 
     # Popup
-    log_test("popup.html exists", os.path.exists(os.path.join(ext_dir, "popup.html")))
-    log_test("popup.js exists", os.path.exists(os.path.join(ext_dir, "popup.js")))
+    log_test("popup.html exists", "popup.html" in ext_files)
+    log_test("popup.js exists", "popup.js" in ext_files)
+
 
+def _check_engine():
     # ══════════════════════════════════════════════════════════════════
     # 4. ENGINE INTEGRATION
     # ══════════════════════════════════════════════════════════════════
     section("ENGINE INTEGRATION (Phase 7)")
 
     try:
-        from core.engine import ArkaEngine
-        engine = ArkaEngine()
+        from _support import shared_engine
+        engine = shared_engine()
         
-        tool_names = [t.name for t in engine.tools.values()]
+        tool_names = engine.tool_names
 
         # Check chrome tools registered
         chrome_tool_names = [
@@ -219,6 +290,45 @@ def run_tests():
     except Exception as e:
         log_test("Engine integration", False, str(e))
 
+
+SECTIONS = [_check_bridge, _check_chrome_tools, _check_extension_files, _check_engine]
+
+
+# ─── pytest entry points: one test per section, so runners such as
+# pytest-xdist can spread them across workers ───────────────────────────
+
+def _assert_section(check):
+    lines, section_results = _run_buffered(check)
+    sys.stdout.write("\n".join(lines) + "\n")
+    failed = [name for name, passed in section_results if not passed]
+    assert not failed, f"Failed: {failed}"
+
+
+def test_browser_bridge():
+    _assert_section(_check_bridge)
+
+
+def test_chrome_tools():
+    _assert_section(_check_chrome_tools)
+
+
+def test_extension_files():
+    _assert_section(_check_extension_files)
+
+
+def test_engine_integration():
+    _assert_section(_check_engine)
+
+
+def run_tests():
+    # Sections are independent (the bridge test uses its own port), so run
+    # them concurrently and print each one's buffered report in order.
+    with ThreadPoolExecutor(max_workers=len(SECTIONS)) as ex:
+        reports = list(ex.map(_run_buffered, SECTIONS))
+    for lines, section_results in reports:
+        sys.stdout.write("\n".join(lines) + "\n")
+        results.extend(section_results)
+
     # ══════════════════════════════════════════════════════════════════
     # SUMMARY
     # ══════════════════════════════════════════════════════════════════
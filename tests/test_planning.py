@@ -2,7 +2,9 @@ from core.engine import ArkaEngine
 from core.modes.planning import PlanningMode
 from tools.dev import read_file
 import os
+import pytest
 
+@pytest.mark.slow
 def test_planning_mode():
     print("🧪 Testing Phase 3: Planning Mode...")
     
@@ -0,0 +1,96 @@
+import builtins
+import importlib
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import tools.todo
+
+
+@pytest.fixture
+def todo(tmp_path, monkeypatch):
+    """tools.todo re-imported against a throwaway HOME (~/.arka/todos.json)."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    yield importlib.reload(tools.todo)
+    # Point the module (and its `manager`) back at the real HOME
+    monkeypatch.undo()
+    importlib.reload(tools.todo)
+
+
+def test_todo_replay_matches_memory(todo):
+    m = todo.TodoManager()
+    for i in range(6):
+        m.add(f"task {i}")
+    m.complete(1)
+    m.complete(4)
+
+    # Both a log-only replay and one after compaction rebuild the same list
+    assert todo.TodoManager().todos == m.todos
+    m._compact()
+    assert todo.TodoManager().todos == m.todos
+    for i in range(30):  # past COMPACT_FACTOR x len(todos): compacts on append
+        m.add(f"more {i}")
+    m.complete(20)
+    assert todo.TodoManager().todos == m.todos
+    assert sum(t["done"] for t in m.todos) == 3
+
+
+def test_todo_torn_final_line(todo):
+    m = todo.TodoManager()
+    m.add("first")
+    m.add("second")
+    with open(todo.TODO_LOG, "ab") as f:
+        f.write(b'{"op": "add", "idx": 2, "ta')  # crash mid-append
+
+    reloaded = todo.TodoManager()
+    assert reloaded.todos == m.todos
+    # The partial line is gone, so the next append starts on a clean line
+    reloaded.add("third")
+    assert [t["task"] for t in todo.TodoManager().todos] == ["first", "second", "third"]
+
+
+def test_todo_crash_between_replace_and_truncate(todo, monkeypatch):
+    m = todo.TodoManager()
+    m.add("first")
+    m.add("second")
+    m.complete(0)
+
+    real_open = builtins.open
+
+    def crash_on_truncate(path, mode="r", *args, **kwargs):
+        if path == todo.TODO_LOG and mode == "wb":
+            raise RuntimeError("crash before truncating the log")
+        return real_open(path, mode, *args, **kwargs)
+
+    monkeypatch.setattr(todo, "open", crash_on_truncate, raising=False)
+    with pytest.raises(RuntimeError):
+        m._compact()
+    monkeypatch.delattr(todo, "open")
+
+    # Snapshot holds every task and the stale log is still there: replaying
+    # it on top must not add anything twice
+    assert os.path.getsize(todo.TODO_LOG) > 0
+    assert todo.TodoManager().todos == m.todos
+
+
+def test_todo_corrupt_snapshot_keeps_log(todo):
+    m = todo.TodoManager()
+    m.add("first")
+    m.add("second")
+    m._compact()
+    m.add("third")
+    with open(todo.TODO_LOG, "ab") as f:
+        f.write(b'{"op": "do')  # torn line too
+    with open(todo.TODO_FILE, "wb") as f:
+        f.write(b"[{not json")
+
+    assert todo.TodoManager().todos == []
+    # Nothing was compacted over: both files are kept aside intact
+    with open(todo.TODO_FILE + ".corrupt", "rb") as f:
+        assert f.read() == b"[{not json"
+    with open(todo.TODO_LOG + ".corrupt", "rb") as f:
+        assert b'"third"' in f.read()
+    assert not os.path.exists(todo.TODO_LOG)
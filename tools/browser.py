@@ -1,15 +1,236 @@
 from smolagents import tool
-from playwright.sync_api import sync_playwright
+from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
 import structlog
+import httpx
+import atexit
+import queue
+import threading
 import time
 import os
 import platform
 import glob
+import importlib.util
 import re
-import urllib.request
+
+try:
+    # Optional C HTML parser for the HTTP fallback; regexes are used without it.
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
 
 logger = structlog.get_logger()
 
+# Upper bound on waiting for the network to go quiet after DOMContentLoaded.
+NETWORK_IDLE_TIMEOUT_MS = 5000
+
+# Upper bound on one visit_page job in the pool: launch, the 30s goto, the
+# network-idle wait and the page read. A visit past this is abandoned and
+# the HTTP fallback runs instead.
+VISIT_TIMEOUT_S = 45
+
+# Characters of page text returned by visit_page.
+PREVIEW_CHARS = 2000
+
+_READ_PAGE_JS = """(limit) => [
+    document.title,
+    document.body ? document.body.innerText.slice(0, limit) : "",
+]"""
+
+_TITLE_RE = re.compile(r"<title>(.*?)</title>", re.IGNORECASE | re.DOTALL)
+_TAG_RE = re.compile(r"<[^>]+>")
+_SPACE_RE = re.compile(r"\s+")
+
+# After a failed launch, visits go straight to the HTTP fallback for this
+# long instead of retrying every launch attempt on every call.
+LAUNCH_RETRY_S = 60
+
+# Resource types visit_page never reads. Stylesheets still load because
+# innerText depends on which elements CSS hides.
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+
+
+def _block_unused(route):
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        route.abort()
+    else:
+        route.continue_()
+
+
+def _find_chrome_testing_executable():
+    base = os.path.expanduser("~/Library/Caches/ms-playwright")
+    pattern = os.path.join(base, "chromium-*/chrome-mac-*/Google Chrome for Testing.app/Contents/MacOS/Google Chrome for Testing")
+    matches = glob.glob(pattern)
+    return matches[0] if matches else None
+
+
+def _launch_browser(p):
+    """Launch Chromium, falling back to a local Chrome for Testing build."""
+    # Ensure correct Playwright platform on Apple Silicon
+    if platform.machine() == "arm64" and not os.getenv("PLAYWRIGHT_HOST_PLATFORM_OVERRIDE"):
+        os.environ["PLAYWRIGHT_HOST_PLATFORM_OVERRIDE"] = "mac-arm64"
+
+    last_error = None
+    chrome_testing = _find_chrome_testing_executable()
+    launch_attempts = [
+        {"headless": True, "args": ["--no-sandbox"]},
+    ]
+    if chrome_testing:
+        # Headless only: the pooled browser lives as long as the process, so
+        # a headed fallback would leave a visible window open all session.
+        launch_attempts.append({"headless": True, "executable_path": chrome_testing, "args": ["--no-sandbox"]})
+
+    for attempt in launch_attempts:
+        try:
+            return p.chromium.launch(**attempt)
+        except Exception as e:
+            last_error = e
+    raise RuntimeError(str(last_error))
+
+
+class _BrowserPool:
+    """
+    Keeps one Chromium process alive across visit_page calls.
+
+    Launching the browser dominates a visit, so it is started on first use
+    and reused; each visit gets its own BrowserContext for isolation.
+    Playwright's sync API is bound to the thread that started it, so a
+    daemon worker thread owns the browser and callers hand it jobs. A job
+    that overruns its timeout abandons that worker (it shuts its browser
+    down once the stuck call returns) and later jobs go to a fresh one.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._thread = None
+        self._jobs = None
+        self._launch_error = None
+        self._launch_failed_at = 0.0
+
+    def run(self, job, timeout: float = None):
+        """Run `job(browser)` on the worker thread and return its result."""
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._start()
+            jobs = self._jobs
+        future = Future()
+        jobs.put((job, future))
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            self._abandon(jobs)
+            raise
+
+    def close(self, timeout: float = 5):
+        """Close the browser and stop the worker, if one is running."""
+        with self._lock:
+            thread, jobs = self._thread, self._jobs
+        if thread is None or not thread.is_alive():
+            return
+        jobs.put((None, None))
+        thread.join(timeout=timeout)
+
+    def _start(self):
+        self._jobs = queue.Queue()
+        self._thread = threading.Thread(
+            target=self._worker, args=(self._jobs,), name="Browser-Pool", daemon=True
+        )
+        self._thread.start()
+
+    def _abandon(self, jobs):
+        """Replace the worker reading `jobs`, moving its queued jobs to the new one."""
+        with self._lock:
+            if self._jobs is not jobs:
+                return  # another caller already replaced it
+            logger.warning("browser_pool_restart")
+            self._start()
+            while True:
+                try:
+                    item = jobs.get_nowait()
+                except queue.Empty:
+                    break
+                self._jobs.put(item)
+            jobs.put((None, None))
+
+    def _worker(self, jobs):
+        # Playwright objects stay local to the thread that created them.
+        state = {"pw": None, "browser": None}
+        while True:
+            job, future = jobs.get()
+            if job is None:
+                self._shutdown(state)
+                return
+            try:
+                future.set_result(job(self._ensure_browser(state)))
+            except BaseException as e:
+                future.set_exception(e)
+
+    def _ensure_browser(self, state):
+        browser = state["browser"]
+        if browser is None or not browser.is_connected():
+            if self._launch_error and time.monotonic() - self._launch_failed_at < LAUNCH_RETRY_S:
+                raise RuntimeError(self._launch_error)
+            try:
+                if state["pw"] is None:
+                    state["pw"] = sync_playwright().start()
+                state["browser"] = _launch_browser(state["pw"])
+            except Exception as e:
+                self._launch_error = str(e)
+                self._launch_failed_at = time.monotonic()
+                raise
+            self._launch_error = None
+        return state["browser"]
+
+    @staticmethod
+    def _shutdown(state):
+        try:
+            if state["browser"] is not None:
+                state["browser"].close()
+            if state["pw"] is not None:
+                state["pw"].stop()
+        except Exception as e:
+            logger.debug("browser_pool_shutdown_failed", error=str(e))
+        state["browser"] = None
+        state["pw"] = None
+
+
+_pool = _BrowserPool()
+atexit.register(_pool.close)
+
+def _html_preview(html: str):
+    """(title, whitespace-collapsed text) of an HTML document."""
+    if LexborHTMLParser is not None:
+        tree = LexborHTMLParser(html)
+        title_node = tree.css_first("title")
+        title = title_node.text(strip=True) if title_node else "Unknown"
+        tree.strip_tags(["script", "style"])
+        text = tree.body.text(separator=" ") if tree.body else ""
+        return title, " ".join(text.split())
+
+    title_match = _TITLE_RE.search(html)
+    title = title_match.group(1).strip() if title_match else "Unknown"
+    text = _SPACE_RE.sub(" ", _TAG_RE.sub(" ", html)).strip()
+    return title, text
+
+
+_http_client = None
+_http_lock = threading.Lock()
+
+
+def _http():
+    """Shared keep-alive client for the HTTP fallback (HTTP/2 when h2 is installed)."""
+    global _http_client
+    with _http_lock:
+        if _http_client is None:
+            _http_client = httpx.Client(
+                http2=importlib.util.find_spec("h2") is not None,
+                follow_redirects=True,
+                timeout=15,
+            )
+            atexit.register(_http_client.close)
+        return _http_client
+
+
 @tool
 def visit_page(url: str) -> str:
     """
@@ -18,65 +239,38 @@ def visit_page(url: str) -> str:
     Args:
         url: The URL to visit.
     """
-    try:
-        # Ensure correct Playwright platform on Apple Silicon
-        if platform.machine() == "arm64" and not os.getenv("PLAYWRIGHT_HOST_PLATFORM_OVERRIDE"):
-            os.environ["PLAYWRIGHT_HOST_PLATFORM_OVERRIDE"] = "mac-arm64"
-
-        def _find_chrome_testing_executable():
-            base = os.path.expanduser("~/Library/Caches/ms-playwright")
-            pattern = os.path.join(base, "chromium-*/chrome-mac-*/Google Chrome for Testing.app/Contents/MacOS/Google Chrome for Testing")
-            matches = glob.glob(pattern)
-            return matches[0] if matches else None
-
-        with sync_playwright() as p:
-            # Launch browser with fallbacks
-            browser = None
-            last_error = None
-
-            chrome_testing = _find_chrome_testing_executable()
-            launch_attempts = [
-                {"headless": True, "args": ["--no-sandbox"]},
-            ]
-            if chrome_testing:
-                launch_attempts.append({"headless": True, "executable_path": chrome_testing, "args": ["--no-sandbox"]})
-                launch_attempts.append({"headless": False, "executable_path": chrome_testing, "args": ["--no-sandbox"]})
-
-            for attempt in launch_attempts:
-                try:
-                    browser = p.chromium.launch(**attempt)
-                    break
-                except Exception as e:
-                    last_error = e
-                    continue
-
-            if not browser:
-                raise RuntimeError(str(last_error))
+    def _visit(browser):
+        context = browser.new_context()
+        try:
+            context.route("**/*", _block_unused)
+            page = context.new_page()
 
-            page = browser.new_page()
-            
             logger.info("browser_visit", url=url)
-            page.goto(url, timeout=30000)
-            
-            # Wait for content
-            time.sleep(2) 
-            
-            title = page.title()
-            content = page.inner_text("body")
-            
-            browser.close()
-            
-            return f"Title: {title}\n\nContent Preview:\n{content[:2000]}..."
-            
+            page.goto(url, timeout=30000, wait_until="domcontentloaded")
+
+            # Wait for content: return once the network settles, but never
+            # block on pages that keep polling.
+            try:
+                page.wait_for_load_state("networkidle", timeout=NETWORK_IDLE_TIMEOUT_MS)
+            except PlaywrightTimeoutError:
+                pass
+
+            # Title and preview in one round trip, trimmed in the page so a
+            # huge body never crosses the driver pipe.
+            title, content = page.evaluate(_READ_PAGE_JS, PREVIEW_CHARS)
+        finally:
+            context.close()
+
+        return f"Title: {title}\n\nContent Preview:\n{content}..."
+
+    try:
+        return _pool.run(_visit, timeout=VISIT_TIMEOUT_S)
     except Exception as e:
         # Fallback to simple HTTP fetch if Playwright fails
         try:
-            with urllib.request.urlopen(url, timeout=15) as resp:
-                html = resp.read().decode("utf-8", errors="ignore")
-            title_match = re.search(r"<title>(.*?)</title>", html, re.IGNORECASE | re.DOTALL)
-            title = title_match.group(1).strip() if title_match else "Unknown"
-            text_preview = re.sub(r"<[^>]+>", " ", html)
-            text_preview = re.sub(r"\s+", " ", text_preview).strip()
-            return f"Title: {title}\n\nContent Preview:\n{text_preview[:2000]}..."
+            resp = _http().get(url)
+            resp.raise_for_status()
+            title, text_preview = _html_preview(resp.text)
+            return f"Title: {title}\n\nContent Preview:\n{text_preview[:PREVIEW_CHARS]}..."
         except Exception:
             return f"Browser Error: {str(e)}"
@@ -8,6 +8,11 @@ via the Browser Bridge WebSocket extension.
 from smolagents import tool
 import structlog
 import json
+
+try:
+    import orjson
+except ImportError:  # optional: json is used without it
+    orjson = None
 from core.session_context import session_context
 
 logger = structlog.get_logger()
@@ -25,6 +30,50 @@ def _truncate(text: str, limit: int) -> str:
     return text[:limit] + "…"
 
 
+def _dump_leaf(val) -> str:
+    """Indented JSON for a value _iter_json doesn't walk into."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(val, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:  # e.g. integers beyond 64 bits
+            pass
+    return json.dumps(val, indent=2)
+
+
+def _iter_json(val, depth: int = 0):
+    """Yield the indent=2 JSON text of `val` in small chunks, outermost first."""
+    pad = "\n" + "  " * (depth + 1)
+    if isinstance(val, list) and val:
+        yield "["
+        for i, item in enumerate(val):
+            yield ("," if i else "") + pad
+            yield from _iter_json(item, depth + 1)
+        yield "\n" + "  " * depth + "]"
+    elif isinstance(val, dict) and val and all(isinstance(k, str) for k in val):
+        yield "{"
+        for i, (key, item) in enumerate(val.items()):
+            yield ("," if i else "") + pad + _dump_leaf(key) + ": "
+            yield from _iter_json(item, depth + 1)
+        yield "\n" + "  " * depth + "}"
+    else:
+        yield _dump_leaf(val).replace("\n", "\n" + "  " * depth)
+
+
+def _dumps_truncated(val, limit: int) -> str:
+    """
+    Indented JSON for `val`, cut to `limit` characters.
+    Serialization stops once the limit is passed, so a huge DOM or element
+    list costs O(limit) rather than a full dump that is mostly thrown away.
+    """
+    parts, size = [], 0
+    for chunk in _iter_json(val):
+        parts.append(chunk)
+        size += len(chunk)
+        if size > limit:
+            break
+    return _truncate("".join(parts), limit)
+
+
 def _format_result(result: dict, max_string: int = 400, max_json: int = 2000) -> str:
     """Format a bridge result for the agent."""
     if not result:
@@ -46,9 +95,7 @@ def _format_result(result: dict, max_string: int = 400, max_json: int = 2000) ->
         if isinstance(val, str) and len(val) > max_string:
             val = val[:max_string] + "…"
         elif isinstance(val, (dict, list)):
-            dumped = json.dumps(val, indent=2)
-            dumped = _truncate(dumped, max_json)
-            val = dumped
+            val = _dumps_truncated(val, max_json)
         parts.append(f"{key}: {val}")
     
     return "\n".join(parts) if parts else f"✅ {status}"
@@ -79,8 +126,7 @@ def chrome_status() -> str:
     Return the Chrome bridge connection status.
     Useful before attempting DOM-based actions.
     """
-    status = _bridge().status()
-    return json.dumps(status, indent=2)
+    return _bridge().status_json()
 
 
 @tool
@@ -91,16 +137,11 @@ def chrome_wait_for_connection(timeout_s: int = 10, poll_interval_s: float = 0.5
     
     Args:
         timeout_s: Max seconds to wait.
-        poll_interval_s: Seconds between checks.
+        poll_interval_s: Ignored; the wait returns as soon as the bridge connects.
     """
-    import time
-    start = time.time()
-    while time.time() - start < timeout_s:
-        if _bridge().is_connected:
-            return "✅ Chrome bridge connected."
-        time.sleep(poll_interval_s)
-    status = _bridge().status()
-    return f"❌ Chrome bridge not connected after {timeout_s}s. Status: {json.dumps(status)}"
+    if _bridge().wait_for_connection(timeout_s):
+        return "✅ Chrome bridge connected."
+    return f"❌ Chrome bridge not connected after {timeout_s}s. Status: {_bridge().status_json()}"
 
 
 # ═══════════════════════════════════════════════════════════════════════
@@ -195,6 +236,21 @@ def chrome_wait_for_selector(selector: str, timeout_ms: int = 5000) -> str:
     return _format_result(result)
 
 
+@tool
+def chrome_wait_any(selectors: list, timeout_ms: int = 5000) -> str:
+    """
+    Wait until any of several selectors appears in the DOM; the result names
+    the selector that matched. Use it when a page has layout variants.
+
+    Args:
+        selectors: CSS selectors to wait for, in order of preference.
+        timeout_ms: Max time to wait in milliseconds.
+    """
+    params = {"selectors": list(selectors), "timeout_ms": timeout_ms}
+    result = _bridge().send_command("wait_for_selector", params, timeout=max(1, (timeout_ms // 1000) + 2))
+    return _format_result(result)
+
+
 @tool
 def chrome_type(text: str, selector: str = None, clear: bool = True) -> str:
     """
@@ -235,16 +291,36 @@ def chrome_scroll(direction: str = "down", amount: int = 500) -> str:
 def chrome_screenshot() -> str:
     """
     Take a screenshot of the visible area in the active Chrome tab.
-    Returns the screenshot as a base64 data URL.
+    Returns a screenshot id; pass it to chrome_save_screenshot to write the PNG.
     """
     result = _bridge().send_command("screenshot")
     if result.get("status") == "ok" and result.get("screenshot"):
-        # Return a short confirmation + the data URL (agent can use it)
-        data_url = result["screenshot"]
-        return f"📸 Screenshot captured ({len(data_url)} bytes). Data URL available."
+        # The PNG stays on the bridge; only its id goes back to the agent.
+        shot_id, size = _bridge().keep_screenshot(result.pop("screenshot"))
+        return f"📸 Screenshot captured id={shot_id} ({size} bytes). Use chrome_save_screenshot to save it."
     return _format_result(result)
 
 
+@tool
+def chrome_save_screenshot(screenshot_id: str, path: str) -> str:
+    """
+    Save a screenshot taken by chrome_screenshot as a PNG file.
+
+    Args:
+        screenshot_id: The id returned by chrome_screenshot.
+        path: Where to write the PNG file.
+    """
+    data = _bridge().screenshot_bytes(screenshot_id)
+    if data is None:
+        return f"❌ No screenshot with id {screenshot_id} (only the last few are kept)."
+    try:
+        with open(path, "wb") as f:
+            f.write(data)
+    except OSError as e:
+        return f"❌ Could not save screenshot: {e}"
+    return f"✅ Saved screenshot {screenshot_id} to {path} ({len(data)} bytes)."
+
+
 @tool
 def chrome_get_dom(selector: str = None, max_depth: int = 3) -> str:
     """
@@ -267,7 +343,7 @@ def chrome_get_dom(selector: str = None, max_depth: int = 3) -> str:
             "url": result.get("url"),
             "dom": result.get("dom"),
         }
-        return _truncate(json.dumps(payload, indent=2), 12000)
+        return _dumps_truncated(payload, 12000)
     return _format_result(result)
 
 
@@ -327,7 +403,7 @@ def chrome_get_elements(selector: str, max_results: int = 20) -> str:
     params = {"selector": selector, "max_results": max_results}
     result = _bridge().send_command("get_elements", params)
     if result.get("status") == "ok":
-        return _truncate(json.dumps(result, indent=2), 12000)
+        return _dumps_truncated(result, 12000)
     return _format_result(result)
 
 
@@ -383,6 +459,32 @@ def chrome_switch_tab(tab_id: int) -> str:
     return _format_result(result)
 
 
+# ═══════════════════════════════════════════════════════════════════════
+# BATCH
+# ═══════════════════════════════════════════════════════════════════════
+
+@tool
+def chrome_batch(commands: list) -> str:
+    """
+    Run several INDEPENDENT browser commands at once and return all results.
+    The commands run concurrently in the extension, so never batch steps that
+    depend on each other (e.g. navigate then read the new page).
+    
+    Args:
+        commands: List of {"action": ..., "params": {...}} dicts, e.g.
+                  [{"action": "get_text", "params": {"selector": "h1"}}, {"action": "list_tabs"}].
+    """
+    try:
+        pairs = [(c["action"], c.get("params")) for c in commands]
+    except (KeyError, TypeError, AttributeError):
+        return '❌ Browser Error: each command must be a dict with an "action" key.'
+    results = _bridge().send_commands(pairs)
+    return "\n\n".join(
+        f"[{i}] {action}:\n{_format_result(result)}"
+        for i, ((action, _), result) in enumerate(zip(pairs, results))
+    )
+
+
 # ═══════════════════════════════════════════════════════════════════════
 # AUTH FLOW
 # ═══════════════════════════════════════════════════════════════════════
@@ -1,9 +1,81 @@
 from smolagents import tool
 import os
+import sys
 import ast
-import networkx as nx
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from typing import List, Dict
 
+# Mermaid-safe node ids: path separators, dots, colons and dashes become "_".
+_ID_TABLE = str.maketrans({"/": "_", ".": "_", ":": "_", "-": "_"})
+
+# Directories never worth descending into.
+_SKIP_DIRS = frozenset({"venv", ".venv", ".git", "node_modules", "__pycache__", "build", "dist"})
+
+# Parsing runs at roughly 2-3 MB of source a second, while each spawned
+# worker costs 1-2.5s to start (more when it re-imports main.py), so the pool
+# only pays off on trees well past this much source.
+PARALLEL_MIN_BYTES = 16 * 1024 * 1024
+PARALLEL_MAX_WORKERS = 4
+
+
+def _iter_py(directory: str):
+    """Yield .py files under `directory`, files before subdirectories, as os.walk did."""
+    try:
+        entries = list(os.scandir(directory))
+    except OSError:
+        return  # Unreadable directory; os.walk skipped these too
+    subdirs = []
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            if entry.name not in _SKIP_DIRS:
+                subdirs.append(entry.path)
+        elif entry.name.endswith(".py"):
+            yield entry.path
+    for sub in subdirs:
+        yield from _iter_py(sub)
+
+
+def _parse(path: str):
+    """(kind, name) for each class/function in one file, or None if it doesn't parse."""
+    try:
+        with open(path, "rb") as f:
+            tree = ast.parse(f.read(), filename=path)
+    except Exception:
+        return None  # Ignore parse errors
+
+    defs = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ClassDef):
+            defs.append(("class", node.name))
+        elif isinstance(node, ast.FunctionDef):
+            # Top level or inside a class
+            defs.append(("function", node.name))
+    return defs
+
+
+def _total_size(paths: List[str]) -> int:
+    total = 0
+    for path in paths:
+        try:
+            total += os.path.getsize(path)
+        except OSError:
+            pass
+    return total
+
+
+def _parse_all(paths: List[str]) -> list:
+    # Parsing is CPU-bound, so very large trees are spread over processes.
+    workers = min(PARALLEL_MAX_WORKERS, os.cpu_count() or 1)
+    if workers > 1 and _total_size(paths) >= PARALLEL_MIN_BYTES:
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as ex:
+                return list(ex.map(_parse, paths, chunksize=16))
+        except (OSError, BrokenProcessPool):
+            pass  # No usable pool here; parse in-process
+    return [_parse(path) for path in paths]
+
+
 @tool
 def generate_graph(directory: str = ".") -> str:
     """
@@ -13,56 +85,36 @@ def generate_graph(directory: str = ".") -> str:
     Args:
         directory: Root directory to scan. Defaults to current directory.
     """
-    g = nx.DiGraph()
-    
-    for root, _, files in os.walk(directory):
-        for file in files:
-            if file.endswith(".py") and "venv" not in root and ".git" not in root:
-                path = os.path.join(root, file)
-                rel_path = os.path.relpath(path, directory)
-                
-                try:
-                    with open(path, "r") as f:
-                        tree = ast.parse(f.read())
-                        
-                    # Add File Node
-                    g.add_node(rel_path, type="file")
-                    
-                    for node in ast.walk(tree):
-                        if isinstance(node, ast.ClassDef):
-                            # Add Class Node
-                            class_name = f"{rel_path}::{node.name}"
-                            g.add_node(class_name, type="class")
-                            g.add_edge(rel_path, class_name)
-                            
-                        elif isinstance(node, ast.FunctionDef):
-                            # Add Function Node (if top level or inside class)
-                            func_name = f"{rel_path}::{node.name}"
-                            g.add_node(func_name, type="function")
-                            g.add_edge(rel_path, func_name)
-                            
-                        elif isinstance(node, ast.Import) or isinstance(node, ast.ImportFrom):
-                            # Minimal dependency tracking (naive)
-                            pass 
-
-                except Exception:
-                    pass # Ignore parse errors
+    paths = list(_iter_py(directory))
+
+    # Node id -> label, and edges; dicts keep first-seen order and drop repeats.
+    nodes: Dict[str, str] = {}
+    edges: Dict[tuple, None] = {}
+
+    for path, defs in zip(paths, _parse_all(paths)):
+        if defs is None:
+            continue
+        rel_path = os.path.relpath(path, directory)
+
+        # Add File Node
+        file_id = sys.intern(rel_path.translate(_ID_TABLE))
+        nodes.setdefault(file_id, rel_path)
+
+        for _kind, name in defs:
+            # Add Class / Function Node
+            # Identifiers never contain /.:- so only the path part needs
+            # sanitizing, and that was done once per file above.
+            node_id = f"{file_id}__{name}"
+            nodes.setdefault(node_id, name)
+            edges[(file_id, node_id)] = None
 
     # Export to Mermaid
     mermaid = ["graph TD"]
-    for node in g.nodes:
-        # Sanitize ID
-        safe_id = node.replace("/", "_").replace(".", "_").replace(":", "_").replace("-", "_")
-        label = node.split("::")[-1]
-        mermaid.append(f"    {safe_id}[\"{label}\"]")
-        
-    for u, v in g.edges:
-        u_safe = u.replace("/", "_").replace(".", "_").replace(":", "_").replace("-", "_")
-        v_safe = v.replace("/", "_").replace(".", "_").replace(":", "_").replace("-", "_")
-        mermaid.append(f"    {u_safe} --> {v_safe}")
-        
+    mermaid.extend(f"    {node_id}[\"{label}\"]" for node_id, label in nodes.items())
+    mermaid.extend(f"    {u} --> {v}" for u, v in edges)
+
     output_path = os.path.abspath("codebase_graph.mermaid")
     with open(output_path, "w") as f:
         f.write("\n".join(mermaid))
-        
-    return f"Graph generated with {len(g.nodes)} nodes and {len(g.edges)} edges. Saved to {output_path}."
+
+    return f"Graph generated with {len(nodes)} nodes and {len(edges)} edges. Saved to {output_path}."
@@ -1,8 +1,51 @@
 from smolagents import tool
 import os
+import functools
 import glob
+import mmap
+import shutil
 from typing import List, Optional
 
+# Files larger than this are numbered from an mmap rather than one read().
+MMAP_MIN_BYTES = 1_000_000
+
+# Lines of output returned by grep.
+GREP_MAX_LINES = 200
+
+# Characters of PDF text extracted before read_file stops reading pages.
+PDF_MAX_CHARS = 200_000
+
+@functools.lru_cache(maxsize=8)
+def _pdf_text(path: str, mtime: float) -> str:
+    """Extracted PDF text; keyed on mtime so an edited file is re-read."""
+    import pypdf
+    reader = pypdf.PdfReader(path)
+    parts, total = [], 0
+    for page in reader.pages:
+        text = page.extract_text() or ""
+        parts.append(text)
+        total += len(text)
+        if total >= PDF_MAX_CHARS and len(parts) < len(reader.pages):
+            parts.append(f"… [truncated after {len(parts)} of {len(reader.pages)} pages]")
+            break
+    return "\n".join(parts)
+
+def _mapped_lines(m: mmap.mmap):
+    """Yield the lines of a mapped file; CRLF endings are left for rstrip()."""
+    start, end = 0, len(m)
+    while start < end:
+        stop = m.find(b"\n", start)
+        if stop == -1:
+            stop = end
+        yield m[start:stop]
+        start = stop + 1
+
+def _number_lines(lines) -> str:
+    buf = bytearray()
+    for i, line in enumerate(lines, 1):
+        buf += b"%4d | %s\n" % (i, line.rstrip())
+    return buf[:-1].decode("utf-8", errors="replace")
+
 @tool
 def read_file(path: str, line_numbers: bool = True) -> str:
     """
@@ -18,21 +61,19 @@ def read_file(path: str, line_numbers: bool = True) -> str:
     try:
         # Handle PDF
         if path.strip().lower().endswith(".pdf"):
-            import pypdf
-            reader = pypdf.PdfReader(path)
-            text = []
-            for page in reader.pages:
-                text.append(page.extract_text())
-            return "\n".join(text)
+            return _pdf_text(path, os.path.getmtime(path))
 
         # Handle Text
-        with open(path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-            
-        if line_numbers:
-            return "\n".join([f"{i+1:4d} | {line.rstrip()}" for i, line in enumerate(lines)])
-        else:
-            return "".join(lines)
+        if not line_numbers:
+            with open(path, 'r', encoding='utf-8') as f:
+                return f.read()
+
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size > MMAP_MIN_BYTES:
+                # Walk a mapping of the file instead of holding a copy of it.
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                    return _number_lines(_mapped_lines(m))
+            return _number_lines(f.read().splitlines())
     except Exception as e:
         return f"Error reading file: {str(e)}"
 
@@ -64,13 +105,18 @@ def grep(pattern: str, path: str = ".") -> str:
         pattern: The text to search for.
         path: The directory or file path to search in (default: current dir).
     """
-    # We use grep via subprocess for speed and robustness
+    # ripgrep when available (parallel, skips .gitignore'd files), else grep.
+    # Arguments go in a list, so the pattern never passes through a shell.
     import subprocess
-    cmd = f"grep -rn '{pattern}' '{path}' | head -n 200" # Limit results
+    if shutil.which("rg"):
+        cmd = ["rg", "--line-number", "--no-heading", "--max-count", str(GREP_MAX_LINES), "-e", pattern, path]
+    else:
+        cmd = ["grep", "-rn", "--max-count", str(GREP_MAX_LINES), "-e", pattern, path]
     try:
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-        if not result.stdout:
+        result = subprocess.run(cmd, capture_output=True, text=True, errors="replace", timeout=30)
+        lines = result.stdout.splitlines()[:GREP_MAX_LINES] # Limit results
+        if not lines:
             return "No matches found."
-        return result.stdout
+        return "\n".join(lines) + "\n"
     except Exception as e:
         return f"Error running grep: {str(e)}"
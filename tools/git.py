@@ -1,4 +1,5 @@
 from smolagents import tool
+import shlex
 import subprocess
 from datetime import datetime
 
@@ -12,10 +13,11 @@ def git_commit(message: str) -> str:
         message: The commit message describing the checkpoint.
     """
     try:
-        subprocess.run("git add .", shell=True, check=True)
+        # One shell for both steps; the message is quoted so it can't break out.
         # Use --allow-empty in case nothing changed but we want a checkpoint mark
-        cmd = f'git commit -m "[ARKA CHECKPOINT] {message}" --allow-empty'
-        subprocess.run(cmd, shell=True, check=True, capture_output=True)
+        msg = shlex.quote(f"[ARKA CHECKPOINT] {message}")
+        script = f"git add . && git commit -m {msg} --allow-empty"
+        subprocess.run(["/bin/sh", "-c", script], check=True, capture_output=True)
         return "✅ Checkpoint saved."
     except subprocess.CalledProcessError as e:
         return f"Error creating checkpoint: {str(e)}"
@@ -30,21 +32,34 @@ def git_reset_hard(commits_back: int = 1) -> str:
         commits_back: Number of commits to rewind (default 1).
     """
     try:
-        cmd = f"git reset --hard HEAD~{commits_back}"
-        subprocess.run(cmd, shell=True, check=True, capture_output=True)
+        commits_back = int(commits_back)
+        subprocess.run(
+            ["git", "reset", "--hard", f"HEAD~{commits_back}"],
+            check=True, capture_output=True,
+        )
         return f"✅ Reverted last {commits_back} checkpoint(s)."
-    except subprocess.CalledProcessError as e:
+    except (subprocess.CalledProcessError, ValueError) as e:
         return f"Error resetting git: {str(e)}"
 
 @tool
-def git_status() -> str:
+def git_status(include_untracked: bool = True) -> str:
     """
     Returns the current git status (changed files).
+    Pass include_untracked=False for a quick "any tracked changes?" check
+    before risky edits; skipping the untracked-file walk is much faster on
+    large trees.
+
+    Args:
+        include_untracked: Also list untracked files (default True).
     """
+    cmd = ["git", "--no-optional-locks", "status", "--no-ahead-behind", "--short"]
+    if not include_untracked:
+        cmd.append("--untracked-files=no")
     try:
-        result = subprocess.run("git status --short", shell=True, capture_output=True, text=True)
+        # Bytes: only the final output is decoded.
+        result = subprocess.run(cmd, capture_output=True)
         if not result.stdout.strip():
             return "No changes (Clean working tree)."
-        return result.stdout
+        return result.stdout.decode("utf-8", errors="replace")
     except Exception as e:
         return str(e)
@@ -1,9 +1,10 @@
 from smolagents import tool
 import subprocess
+import threading
 import structlog
 
 import structlog
-from tools.vision import get_screen_coordinates
+from tools.vision import get_screen_coordinates_multi
 import time
 from core.session_context import session_context
 
@@ -14,8 +15,38 @@ except Exception as e:
     pyautogui = None  # type: ignore
     _pyautogui_error = str(e)
 
+try:
+    # PyObjC (installed with pyautogui on macOS) runs AppleScript in-process,
+    # saving an osascript spawn per call.
+    from Foundation import NSAppleScript  # type: ignore
+except Exception:
+    NSAppleScript = None
+
 logger = structlog.get_logger()
 
+def _osascript(script: str):
+    """Run AppleScript; returns (ok, stdout, stderr) like `osascript -e`."""
+    # NSAppleScript is main-thread-only; tools called from the heartbeat,
+    # voice or UI threads spawn osascript instead.
+    if NSAppleScript is not None and threading.current_thread() is threading.main_thread():
+        result, error = NSAppleScript.alloc().initWithSource_(script).executeAndReturnError_(None)
+        if error is not None:
+            return False, "", str(error.get("NSAppleScriptErrorMessage", error))
+        text = result.stringValue() if result is not None else None
+        return True, text or "", ""
+
+    res = subprocess.run(["osascript", "-e", script], capture_output=True, text=True, check=False)
+    return res.returncode == 0, res.stdout, res.stderr
+
+# music_control action -> Music.app AppleScript command.
+MUSIC_COMMANDS = {
+    'play': 'play',
+    'pause': 'pause',
+    'next': 'next track',
+    'prev': 'previous track'
+}
+_INVALID_MUSIC_ACTION = f"Invalid action. Use: {list(MUSIC_COMMANDS.keys())}"
+
 def _mark_music_context():
     session_context.update_app("Apple Music")
 
@@ -31,14 +62,9 @@ def music_control(action: str, song_name: str = None) -> str:
                    Do not pick a random song based on the input as a mood/genre.
                    Example: If input is "play breakup party", song_name MUST be "Breakup Party".
     """
-    cmd_map = {
-        'play': 'play',
-        'pause': 'pause',
-        'next': 'next track',
-        'prev': 'previous track'
-    }
-    if action not in cmd_map:
-        return f"Invalid action. Use: {list(cmd_map.keys())}"
+    command = MUSIC_COMMANDS.get(action)
+    if command is None:
+        return _INVALID_MUSIC_ACTION
     
     try:
         if action == 'play' and song_name:
@@ -56,9 +82,9 @@ def music_control(action: str, song_name: str = None) -> str:
                     end try
                 end tell
                 '''
-                res = subprocess.run(["osascript", "-e", script], capture_output=True, text=True, check=False)
-                output = res.stdout.strip()
-                return "Song not found" not in output, output, res.stderr
+                _, output, err = _osascript(script)
+                output = output.strip()
+                return "Song not found" not in output, output, err
 
             # 1. Try exact match (e.g. "Punkrocker" or "Navior song")
             found, out, err = try_play(song_name)
@@ -75,15 +101,21 @@ def music_control(action: str, song_name: str = None) -> str:
             # 3. Fallback: Try playing via Global Search URL (V1-style)
             try:
                 search_script = f'open location "music://music.apple.com/search?term={search_name}"'
-                subprocess.run(["osascript", "-e", search_script], check=True)
+                ok, _, err = _osascript(search_script)
+                if not ok:
+                    raise RuntimeError(err.strip())
                 
                 # Visual Verification & Click (God Mode)
                 time.sleep(4) 
                 
                 try:
                     # Strategy A: Play Button (Triangle)
+                    # Strategy B: Double Click the Artwork (if play button hidden)
+                    # Both are on the same screen, so one vision request locates both.
                     target_desc = f"The play button (triangle icon) overlaid on the artwork for the song '{search_name}'"
-                    coords = get_screen_coordinates(target_desc)
+                    target_desc_b = f"The album artwork for the song '{search_name}'"
+                    located = get_screen_coordinates_multi([target_desc, target_desc_b])
+                    coords = located[target_desc]
                     
                     if pyautogui is None:
                         return f"Vision click unavailable (pyautogui error: {_pyautogui_error})"
@@ -94,10 +126,9 @@ def music_control(action: str, song_name: str = None) -> str:
                         _mark_music_context()
                         return f"Playing song '{search_name}' (Global Search via Vision Click)."
                     
-                    # Strategy B: Double Click the Artwork (if play button hidden)
+                    # Strategy B
                     logger.warning("vision_fallback_retry", reason="play_button_not_found", target=target_desc)
-                    target_desc_b = f"The album artwork for the song '{search_name}'"
-                    coords_b = get_screen_coordinates(target_desc_b)
+                    coords_b = located[target_desc_b]
                     
                     if pyautogui is None:
                         return f"Vision click unavailable (pyautogui error: {_pyautogui_error})"
@@ -119,10 +150,10 @@ def music_control(action: str, song_name: str = None) -> str:
                 return f"Music Error: Song '{song_name}' not found locally (even after fuzzy search) and fallback failed: {e2}"
 
         else:
-            script = f'tell application "Music" to {cmd_map[action]}'
-            res = subprocess.run(["osascript", "-e", script], capture_output=True, text=True, check=False)
-            if res.returncode != 0:
-                return f"Music Error: {res.stderr}"
+            script = f'tell application "Music" to {command}'
+            ok, _, err = _osascript(script)
+            if not ok:
+                return f"Music Error: {err}"
             _mark_music_context()
             return f"Music: {action}"
             
@@ -140,7 +171,9 @@ def set_volume(level: int) -> str:
         return "Level must be 0-100"
     
     try:
-        subprocess.run(["osascript", "-e", f"set volume output volume {level}"], check=True)
+        ok, _, err = _osascript(f"set volume output volume {level}")
+        if not ok:
+            return f"Volume Error: {err.strip()}"
         return f"Volume set to {level}%"
     except Exception as e:
         return f"Volume Error: {str(e)}"
@@ -11,6 +11,9 @@ from smolagents import tool
 from core.mcp_client import mcp_bridge
 import json
 
+# (mcp_bridge.tools_version, formatted listing) of the last list_mcp_tools call.
+_listing_cache = (-1, "")
+
 
 @tool
 def list_mcp_tools() -> str:
@@ -20,14 +23,22 @@ def list_mcp_tools() -> str:
     
     Returns a formatted list of tool names and descriptions.
     """
+    global _listing_cache
+    version, listing = _listing_cache
+    if version == mcp_bridge.tools_version:
+        return listing
+
+    version = mcp_bridge.tools_version
     tools = mcp_bridge.list_tools()
     if not tools:
-        return "No MCP servers connected. No external tools available."
-    
-    lines = [f"📡 MCP Tools Available ({len(tools)} total):"]
-    for t in tools:
-        lines.append(f"  • {t['name']} ({t['server']}): {t['description']}")
-    return "\n".join(lines)
+        listing = "No MCP servers connected. No external tools available."
+    else:
+        lines = [f"📡 MCP Tools Available ({len(tools)} total):"]
+        for t in tools:
+            lines.append(f"  • {t['name']} ({t['server']}): {t['description']}")
+        listing = "\n".join(lines)
+    _listing_cache = (version, listing)
+    return listing
 
 
 @tool
@@ -1,10 +1,28 @@
+import io
 import os
 import json
+import functools
 
 from smolagents import tool
 from core.memory import MemoryManager
 from memory.store import memory_store
 
+try:
+    import ijson  # optional: streams large imports
+except ImportError:
+    ijson = None
+
+# Imports above this size are streamed with ijson (when installed) rather
+# than loaded whole; each batch is one transaction.
+IMPORT_STREAM_MIN_BYTES = 1_000_000
+IMPORT_BATCH_SIZE = 1000
+
+
+@functools.lru_cache(maxsize=1)
+def _memory_manager() -> MemoryManager:
+    """One manager for all remember_fact calls, so its profile cache is reused."""
+    return MemoryManager()
+
 
 @tool
 def remember_fact(fact: str) -> str:
@@ -15,9 +33,7 @@ def remember_fact(fact: str) -> str:
     Args:
         fact: The fact to remember (e.g., "User prefers Python over JS").
     """
-    memory = MemoryManager()
-    result = memory.append_fact(fact)
-    return result
+    return _memory_manager().append_fact(fact)
 
 
 @tool
@@ -32,10 +48,11 @@ def memory_search(query: str, limit: int = 5) -> str:
     results = memory_store.search_facts(query, limit=limit)
     if not results:
         return "No matching memories found."
-    lines = ["Memory matches:"]
+    buf = io.StringIO()
+    buf.write("Memory matches:")
     for r in results:
-        lines.append(f"- {r.get('id')}: {r.get('subject')}.{r.get('predicate')} = {r.get('object')}")
-    return "\n".join(lines)
+        buf.write(f"\n- {r['id']}: {r['subject']}.{r['predicate']} = {r['object']}")
+    return buf.getvalue()
 
 
 @tool
@@ -46,13 +63,14 @@ def memory_list(limit: int = 20) -> str:
     Args:
         limit: Maximum number of facts.
     """
-    results = memory_store.get_recent_facts(limit=limit)
+    results = memory_store.get_recent_facts_projection(limit=limit)
     if not results:
         return "No memories found."
-    lines = ["Recent memories:"]
-    for r in results:
-        lines.append(f"- {r.get('id')}: {r.get('subject')}.{r.get('predicate')} = {r.get('object')}")
-    return "\n".join(lines)
+    buf = io.StringIO()
+    buf.write("Recent memories:")
+    for fact_id, subject, predicate, obj in results:
+        buf.write(f"\n- {fact_id}: {subject}.{predicate} = {obj}")
+    return buf.getvalue()
 
 
 @tool
@@ -84,6 +102,33 @@ def memory_show(fact_id: int) -> str:
     return "\n".join(lines)
 
 
+def _is_fact(item) -> bool:
+    return isinstance(item, dict) and all(
+        isinstance(item.get(k), str) for k in ("subject", "predicate", "object")
+    )
+
+
+def _starts_with_array(f) -> bool:
+    ch = f.read(1)
+    while ch and ch.isspace():
+        ch = f.read(1)
+    f.seek(0)
+    return ch == b"["
+
+
+def _import_facts(items, counts: list) -> None:
+    """Insert fact dicts IMPORT_BATCH_SIZE at a time; counts is [imported, seen]."""
+    batch = []
+    for item in items:
+        counts[1] += 1
+        if _is_fact(item):
+            batch.append(item)
+        if len(batch) >= IMPORT_BATCH_SIZE:
+            counts[0] += memory_store.insert_facts_bulk(batch, ttl_days=None)
+            batch = []
+    counts[0] += memory_store.insert_facts_bulk(batch, ttl_days=None)
+
+
 @tool
 def memory_import(path: str) -> str:
     """
@@ -95,6 +140,19 @@ def memory_import(path: str) -> str:
     path = path.replace("~", os.path.expanduser("~"))
     if not os.path.exists(path):
         return f"File not found: {path}"
+
+    if ijson is not None and os.path.getsize(path) > IMPORT_STREAM_MIN_BYTES:
+        # Large export: parse and insert batch by batch in flat memory.
+        counts = [0, 0]
+        try:
+            with open(path, "rb") as f:
+                if not _starts_with_array(f):
+                    return "Import expects a JSON array of fact objects."
+                _import_facts(ijson.items(f, "item", use_float=True), counts)
+        except Exception as e:
+            return f"Failed to read JSON: {e}. Imported {counts[0]} facts before the error."
+        return f"Imported {counts[0]} facts. Skipped {counts[1] - counts[0]}."
+
     try:
         with open(path, "r") as f:
             data = json.load(f)
@@ -102,36 +160,9 @@ def memory_import(path: str) -> str:
         return f"Failed to read JSON: {e}"
     if not isinstance(data, list):
         return "Import expects a JSON array of fact objects."
-    imported = 0
-    skipped = 0
-    for item in data:
-        if not isinstance(item, dict):
-            skipped += 1
-            continue
-        subject = item.get("subject")
-        predicate = item.get("predicate")
-        obj = item.get("object")
-        if not (subject and predicate and obj):
-            skipped += 1
-            continue
-        confidence = float(item.get("confidence", 0.6))
-        metadata = item.get("metadata") if isinstance(item.get("metadata"), dict) else None
-        fact_id = memory_store.insert_fact(
-            subject=subject,
-            predicate=predicate,
-            obj=obj,
-            confidence=confidence,
-            source_event_id=item.get("source_event_id"),
-            ttl_days=None,
-            metadata=metadata,
-        )
-        if fact_id:
-            imported += 1
-            if item.get("locked"):
-                memory_store.mark_fact_locked(int(fact_id), locked=True)
-        else:
-            skipped += 1
-    return f"Imported {imported} facts. Skipped {skipped}."
+    counts = [0, 0]
+    _import_facts(data, counts)
+    return f"Imported {counts[0]} facts. Skipped {counts[1] - counts[0]}."
 
 
 @tool
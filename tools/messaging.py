@@ -1,38 +1,118 @@
 
 from smolagents import tool
-from tools.system import open_app, system_type, system_hotkey, system_press
+from tools.system import open_app, system_type, system_hotkey, system_press, system_chord, system_click_at, system_key_burst
+from tools.vision import (
+    get_screen_coordinates,
+    _current_fingerprint,
+    _wait_screen_change,
+)
+from tools.chrome_tools import (
+    _bridge,
+    chrome_wait_for_connection,
+    chrome_navigate,
+    chrome_verify_text,
+)
 from core.session_context import session_context
+from core.context_sensor import ContextSensor
+from core.vision_client import vision_client
 import time
+import random
+import threading
 import structlog
 import re
 
+try:
+    import pyautogui  # type: ignore
+    _pyautogui_error = None
+except Exception as e:
+    pyautogui = None  # type: ignore
+    _pyautogui_error = str(e)
+
 logger = structlog.get_logger()
 
+# Uncached reader for the launch check below.
+_desktop = ContextSensor(ttl=0)
+
+
+def _poll(condition, timeout: float = 1.5, interval: float = 0.05) -> bool:
+    """Return True as soon as condition() is truthy, False after timeout."""
+    deadline = time.monotonic() + timeout
+    while True:
+        if condition():
+            return True
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(interval)
+
+
+# Contact separators: comma, " and ", "&", ";"
+_CONTACT_SPLIT_RE = re.compile(r"\s*(?:,| and | & |;)\s*", re.IGNORECASE)
+
 
 def _split_contacts(raw: str) -> list[str]:
     if not raw:
         return []
-    # Split on common separators: comma, " and ", "&", ";"
-    parts = re.split(r"\s*(?:,| and | & |;)\s*", raw.strip(), flags=re.IGNORECASE)
+    # Single contact (the usual case): nothing to split on.
+    if "," not in raw and ";" not in raw and "&" not in raw and " and " not in raw.lower():
+        return [raw.strip()]
+    parts = _CONTACT_SPLIT_RE.split(raw.strip())
     cleaned = [p.strip() for p in parts if p.strip()]
     # If split didn't change, return original
     return cleaned if cleaned else [raw.strip()]
 
 
+# Header-verification retries back off exponentially (with jitter) and give
+# up once the whole loop has run this long.
+VERIFY_BACKOFF_BASE_S = 0.2
+VERIFY_BACKOFF_CAP_S = 1.5
+VERIFY_BACKOFF_JITTER_S = 0.1
+VERIFY_DEADLINE_S = 6.0
+
+# Select-all then delete, posted as one chord.
+CLEAR_FIELD_CHORD = [
+    ("cmd", "down"), ("a", "down"), ("a", "up"),
+    ("backspace", "down"), ("backspace", "up"), ("cmd", "up"),
+]
+
+
+# WhatsApp Web selectors, most specific first. The extension tries them in
+# order in-page, so each list costs one round trip rather than one per entry.
+WA_SEARCH_SELECTORS = [
+    "div[contenteditable='true'][data-tab='3']",
+    "div[contenteditable='true'][role='textbox'][data-tab]",
+    "div[contenteditable='true'][aria-label='Search input textbox']",
+    "div[contenteditable='true'][aria-label='Search or start new chat']",
+]
+WA_RESULT_SELECTORS = [
+    "div[role='listitem']",
+    "div[role='gridcell']",
+    "div[aria-label][role='button']",
+]
+WA_HEADER_SELECTORS = [
+    "header span[title]",
+    "header [data-testid='conversation-info-header-chat-title']",
+    "header [role='button'] span[title]",
+    "header h1, header h2, header h3",
+]
+WA_COMPOSER_SELECTORS = [
+    "div[contenteditable='true'][data-tab='10']",
+    "div[contenteditable='true'][role='textbox'][data-tab='10']",
+    "div[contenteditable='true'][role='textbox']",
+]
+
+
+def _chrome_sequence(steps: list, timeout: int = 30) -> dict:
+    """Run dependent Chrome steps inside the extension in one round trip."""
+    return _bridge().send_command("sequence", {"steps": steps}, timeout=timeout)
+
+
 def _verify_chat_header(contact_name: str) -> bool:
-    from tools.chrome_tools import chrome_get_text
-
-    header_selectors = [
-        "header span[title]",
-        "header [data-testid='conversation-info-header-chat-title']",
-        "header [role='button'] span[title]",
-        "header h1, header h2, header h3",
-    ]
-    for sel in header_selectors:
-        text = chrome_get_text(sel, max_length=2000)
-        if contact_name.lower() in text.lower():
-            return True
-    return False
+    # Independent reads: one batch instead of a call per selector.
+    results = _bridge().send_commands(
+        [("get_text", {"selector": sel, "max_length": 2000}) for sel in WA_HEADER_SELECTORS]
+    )
+    name = contact_name.lower()
+    return any(r.get("status") == "ok" and name in (r.get("text") or "").lower() for r in results)
 
 @tool
 def send_whatsapp_message(contact_name: str, message: str) -> str:
@@ -48,19 +128,21 @@ def send_whatsapp_message(contact_name: str, message: str) -> str:
         contact_name: The name of the contact.
         message: The text message to send.
     """
-    from tools.vision import get_screen_coordinates
-    import pyautogui
-
     # Respect explicit browser requests
     if session_context.last_task:
         lower = session_context.last_task.lower()
         if "browser" in lower or "whatsapp.com" in lower or "web" in lower:
             return "User requested WhatsApp in browser. Use send_whatsapp_web_message instead."
+    if pyautogui is None:
+        return f"Error: pyautogui unavailable ({_pyautogui_error})"
     
     try:
-        # 1. Open App
+        # 1. Open App. The launch takes seconds, so the vision connection is
+        # opened meanwhile rather than on the first lookup.
+        threading.Thread(target=vision_client.warmup, name="Vision-Warmup", daemon=True).start()
         open_app("WhatsApp")
-        time.sleep(2) 
+        # Continue once it is frontmost; the old fixed 2s is the ceiling.
+        _poll(lambda: _desktop.get_context()["frontmost_app"] == "WhatsApp", timeout=2.0, interval=0.1)
         
         # 2. Search for Contact
         # Reset Search State
@@ -70,13 +152,16 @@ def send_whatsapp_message(contact_name: str, message: str) -> str:
         system_hotkey(["command", "f"])
         time.sleep(0.5)
         
-        # Robust Clear: Brute force backspace (safer than Cmd+A which can fail)
-        pyautogui.press("backspace", presses=20, interval=0.02)
+        # Clear: Cmd+A + Backspace, then a burst of backspaces in case Cmd+A
+        # didn't take (the old 20ms spacing cost ~400ms per send).
+        system_chord(CLEAR_FIELD_CHORD)
+        system_key_burst("backspace", 20)
         time.sleep(0.2)
         
-        # Type Name
+        # Type Name, then give the result list until it redraws (at most
+        # the old fixed 1.5s)
         system_type(contact_name)
-        time.sleep(1.5) 
+        _wait_screen_change(_current_fingerprint(), timeout=1.5)
         
         # 3. Hybrid Selection & Verification Loop
         max_retries = 2
@@ -89,17 +174,21 @@ def send_whatsapp_message(contact_name: str, message: str) -> str:
         
         if "Error" not in coords:
             x, y = map(int, coords.split(","))
-            pyautogui.moveTo(x, y, duration=0.3)
-            pyautogui.click()
-            time.sleep(1.0)
+            before = _current_fingerprint()
+            clicked = system_click_at(x, y)
+            if clicked.startswith("Click Error"):
+                return f"WhatsApp {clicked}"
+            _wait_screen_change(before, timeout=1.0)
         else:
             # Fallback to key nav (starting at top)
             system_press("down")
             time.sleep(0.2)
+            before = _current_fingerprint()
             system_press("enter")
-            time.sleep(0.8)
+            _wait_screen_change(before, timeout=0.8)
 
         # Verification Loop
+        started = time.monotonic()
         for attempt in range(max_retries):
             # Broader Verify: Look for name at the top
             verify_target = f"The name '{contact_name}' appearing in the top header area of the chat window"
@@ -109,8 +198,14 @@ def send_whatsapp_message(contact_name: str, message: str) -> str:
                 chat_verified = True
                 break
             else:
-                logger.warning("verify_failed", attempt=attempt, target=verify_target)
+                elapsed = time.monotonic() - started
+                delay = min(VERIFY_BACKOFF_BASE_S * 2 ** attempt, VERIFY_BACKOFF_CAP_S)
+                delay += random.uniform(0, VERIFY_BACKOFF_JITTER_S)
+                logger.warning("verify_failed", attempt=attempt, target=verify_target, delay=round(delay, 3), elapsed=round(elapsed, 3))
+                if attempt == max_retries - 1 or elapsed + delay > VERIFY_DEADLINE_S:
+                    break
                 print(f"DEBUG: Attempt {attempt+1} failed. Could not find '{contact_name}' in header. Repositioning...")
+                time.sleep(delay)
                 
                 # Retry strategy: Focus Search -> Down Arrow -> Enter
                 system_hotkey(["command", "f"])
@@ -122,8 +217,9 @@ def send_whatsapp_message(contact_name: str, message: str) -> str:
                     system_press("down")
                     time.sleep(0.1)
                 
+                before = _current_fingerprint()
                 system_press("enter")
-                time.sleep(1.0)
+                _wait_screen_change(before, timeout=1.0)
         
         if not chat_verified:
             # Final attempt: Just check if we see the name ANYWHERE in the right side?
@@ -134,11 +230,8 @@ def send_whatsapp_message(contact_name: str, message: str) -> str:
         # Only reached if chat_verified is True
         
         # Ensure focus is on message bar (usually is, but good to ensure)
-        # Clear Message Bar first (Cmd+A -> Backspace)
-        system_hotkey(["command", "a"])
-        time.sleep(0.1)
-        system_press("backspace")
-        time.sleep(0.1)
+        # Clear Message Bar first (Cmd+A -> Backspace, one chord)
+        system_chord(CLEAR_FIELD_CHORD)
         
         system_type(message)
         time.sleep(0.5)
@@ -161,16 +254,6 @@ def send_whatsapp_web_message(contact_name: str, message: str) -> str:
         contact_name: The name of the contact.
         message: The text message to send.
     """
-    from tools.chrome_tools import (
-        chrome_wait_for_connection,
-        chrome_navigate,
-        chrome_wait_for_selector,
-        chrome_click,
-        chrome_type,
-        chrome_press_key,
-        chrome_verify_text,
-    )
-
     # 1. Ensure Chrome bridge ready
     status = chrome_wait_for_connection()
     if "❌" in status:
@@ -184,83 +267,57 @@ def send_whatsapp_web_message(contact_name: str, message: str) -> str:
             "then run `chrome_continue()` and re-issue the request."
         )
 
-    # 3. Wait for search box
-    search_selectors = [
-        "div[contenteditable='true'][data-tab='3']",
-        "div[contenteditable='true'][role='textbox'][data-tab]",
-        "div[contenteditable='true'][aria-label='Search input textbox']",
-        "div[contenteditable='true'][aria-label='Search or start new chat']",
-    ]
-    search_selector = None
-    for sel in search_selectors:
-        res = chrome_wait_for_selector(sel, timeout_ms=15000)
-        if res.startswith("✅") or "selector" in res or "ok" in res.lower():
-            search_selector = sel
-            break
-    if not search_selector:
-        return "Could not find WhatsApp Web search box. Ensure you are logged in."
-
-    # 4. Split contacts if multiple
+    # 3. Split contacts if multiple
     contacts = _split_contacts(contact_name)
     if not contacts:
         return "No contacts provided."
 
     results = []
     for name in contacts:
-        # Focus search box and search contact
-        chrome_click(search_selector)
-        chrome_type(name, selector=search_selector, clear=True)
-        time.sleep(0.8)
-
-        # Click first search result
-        result_selectors = [
-            "div[role='listitem']",
-            "div[role='gridcell']",
-            "div[aria-label][role='button']",
-        ]
-        clicked = False
-        for sel in result_selectors:
-            res = chrome_click(sel, index=0)
-            if "❌" not in res:
-                clicked = True
-                break
-        if not clicked:
+        # Wait for the search box (any known variant), search the contact,
+        # click the first result and wait for the chat's composer, all in one
+        # round trip. Each in-page probe returns at once when its target is
+        # already there.
+        picked = _chrome_sequence([
+            {"action": "wait_for_selector", "params": {"selectors": WA_SEARCH_SELECTORS, "timeout_ms": 15000}},
+            {"action": "click", "params": {"selectors": WA_SEARCH_SELECTORS}},
+            {"action": "type", "params": {"text": name, "selectors": WA_SEARCH_SELECTORS, "clear": True}},
+            {"action": "delay", "params": {"ms": 800}},
+            {"action": "click", "params": {"selectors": WA_RESULT_SELECTORS, "index": 0}},
+            {"action": "wait_for_selector", "params": {"selectors": WA_COMPOSER_SELECTORS, "timeout_ms": 10000}},
+        ])
+        failed_step = picked.get("failed_step")
+        if failed_step == 0:
+            results.append("Could not find WhatsApp Web search box. Ensure you are logged in.")
+            break
+        if failed_step == 5:
+            results.append(f"❌ Could not find composer for '{name}'")
+            continue
+        if picked.get("status") != "ok":
             results.append(f"❌ Could not select '{name}'")
             continue
 
-        # Optional verification of chat header
-        if not _verify_chat_header(name):
+        # Optional verification of chat header (it can render a beat after
+        # the composer)
+        if not _poll(lambda: _verify_chat_header(name)):
             results.append(f"❌ Could not verify chat header for '{name}'")
             continue
 
-        # Find composer and send message
-        composer_selectors = [
-            "div[contenteditable='true'][data-tab='10']",
-            "div[contenteditable='true'][role='textbox'][data-tab='10']",
-            "div[contenteditable='true'][role='textbox']",
-        ]
-        composer = None
-        for sel in composer_selectors:
-            res = chrome_wait_for_selector(sel, timeout_ms=10000)
-            if res.startswith("✅") or "selector" in res or "ok" in res.lower():
-                composer = sel
-                break
-        if not composer:
-            results.append(f"❌ Could not find composer for '{name}'")
+        # Composer is already present: send in one more round trip
+        sent = _chrome_sequence([
+            {"action": "click", "params": {"selectors": WA_COMPOSER_SELECTORS}},
+            {"action": "type", "params": {"text": message, "selectors": WA_COMPOSER_SELECTORS, "clear": True}},
+            {"action": "press_key", "params": {"key": "Enter", "selectors": WA_COMPOSER_SELECTORS}},
+        ])
+        if sent.get("status") != "ok":
+            results.append(f"❌ Could not send to '{name}': {sent.get('error', 'unknown error')}")
             continue
 
-        chrome_click(composer)
-        chrome_type(message, selector=composer, clear=True)
-        chrome_press_key("Enter", selector=composer)
-
         verify = chrome_verify_text(message)
         if "❌" in verify:
             results.append(f"⚠️ Sent to '{name}' but not verified")
         else:
             results.append(f"✅ Sent to '{name}' (verified)")
 
-        # Small pause before next contact
-        time.sleep(0.6)
-
     session_context.update_app("WhatsApp Web")
     return "\n".join(results)
@@ -1,9 +1,48 @@
 from smolagents import tool
 from duckduckgo_search import DDGS
+import threading
 import structlog
 
 logger = structlog.get_logger()
 
+# Per-result caps on what goes back into the model's context.
+TITLE_MAX_CHARS = 200
+BODY_MAX_CHARS = 400
+
+_FMT = "[{0}] {1}\n{2}\n{3}\n".format
+
+# One DDGS session for all searches, so its connection pool (and TLS
+# sessions) carry over between calls.
+_ddgs = None
+_ddgs_lock = threading.Lock()
+
+
+def _get_ddgs() -> DDGS:
+    global _ddgs
+    if _ddgs is None:
+        with _ddgs_lock:
+            if _ddgs is None:
+                _ddgs = DDGS()
+    return _ddgs
+
+
+def _search(query: str, max_results: int) -> str:
+    """Formatted results for one search on the shared session."""
+    global _ddgs
+    try:
+        results = _get_ddgs().text(query, max_results=max_results)
+    except Exception:
+        _ddgs = None  # start the next search on a fresh session
+        raise
+    if not results:
+        return "No results found."
+
+    return "\n".join(
+        _FMT(i, res["title"][:TITLE_MAX_CHARS], res["href"], res["body"][:BODY_MAX_CHARS])
+        for i, res in enumerate(results, 1)
+    )
+
+
 @tool
 def web_search(query: str, max_results: int = 5) -> str:
     """
@@ -15,16 +54,6 @@ def web_search(query: str, max_results: int = 5) -> str:
     """
     try:
         logger.info("web_search", query=query)
-        results = DDGS().text(query, max_results=max_results)
-        
-        if not results:
-            return "No results found."
-            
-        formatted = []
-        for i, res in enumerate(results):
-            formatted.append(f"[{i+1}] {res['title']}\n{res['href']}\n{res['body']}\n")
-            
-        return "\n".join(formatted)
-        
+        return _search(query, max_results)
     except Exception as e:
         return f"Search Error: {str(e)}"
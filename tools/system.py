@@ -1,10 +1,15 @@
 from smolagents import tool
-from tools.vision import get_screen_coordinates
+from tools.vision import get_screen_coordinates, invalidate_vision_cache
 import subprocess
 import structlog
 import time
+import os
+import re
+from types import MappingProxyType
 from core.session_context import session_context
 
+logger = structlog.get_logger()
+
 try:
     import pyautogui  # type: ignore
     _pyautogui_error = None
@@ -12,11 +17,117 @@ except Exception as e:
     pyautogui = None  # type: ignore
     _pyautogui_error = str(e)
 
-logger = structlog.get_logger()
+try:
+    # PyObjC (installed with pyautogui on macOS): post keystrokes directly.
+    import Quartz  # type: ignore
+except Exception:
+    Quartz = None
 
 # Safety Pre-check
 if pyautogui is not None:
     pyautogui.FAILSAFE = True
+    # Callers sleep explicitly where the UI needs time; no blanket 0.1s
+    # pause after every pyautogui call.
+    pyautogui.PAUSE = 0
+
+# open_app: app name -> (pid, monotonic time pgrep found it). A live cached
+# pid inside the TTL skips pgrep.
+APP_PID_TTL_S = 30
+_app_pid_cache: dict = {}
+
+# Seconds between typed characters; pyautogui's fixed 50ms made a 100-char
+# message take over 5s.
+TYPE_INTERVAL = float(os.getenv("ARKA_TYPE_INTERVAL", "0.008"))
+
+# Clicks are posted straight at the target. ARKA_CLICK_HUMANIZE=1 restores
+# the visible pyautogui glide (e.g. for demos), which also leaves time to
+# abort by moving the mouse to a corner.
+CLICK_HUMANIZE = os.getenv("ARKA_CLICK_HUMANIZE", "0") == "1"
+
+# Characters a unicode-string event doesn't deliver as a key press.
+_KEYCODES = {"\n": 36, "\r": 36, "\t": 48}
+
+# macOS virtual keycodes, for posting key events without pyautogui. Keys not
+# listed here, and names that aren't lowercase (pyautogui reads "A" as
+# shift+a), still go through pyautogui. "delete" is forward delete, as in
+# pyautogui.
+KEYCODE_MAP = MappingProxyType({
+    "a": 0, "s": 1, "d": 2, "f": 3, "h": 4, "g": 5, "z": 6, "x": 7, "c": 8, "v": 9,
+    "b": 11, "q": 12, "w": 13, "e": 14, "r": 15, "y": 16, "t": 17, "o": 31, "u": 32,
+    "i": 34, "p": 35, "l": 37, "j": 38, "k": 40, "n": 45, "m": 46,
+    "1": 18, "2": 19, "3": 20, "4": 21, "5": 23, "6": 22, "7": 26, "8": 28, "9": 25, "0": 29,
+    "-": 27, "=": 24, "[": 33, "]": 30, ";": 41, "'": 39, ",": 43, ".": 47, "/": 44,
+    "\\": 42, "`": 50,
+    "enter": 36, "return": 36, "tab": 48, "space": 49, "backspace": 51, "esc": 53,
+    "del": 117, "delete": 117, "home": 115, "end": 119, "pageup": 116, "pagedown": 121,
+    "left": 123, "right": 124, "down": 125, "up": 126,
+    "f1": 122, "f2": 120, "f3": 99, "f4": 118, "f5": 96, "f6": 97, "f7": 98, "f8": 100,
+    "f9": 101, "f10": 109, "f11": 103, "f12": 111,
+    "command": 55, "shift": 56, "capslock": 57, "option": 58, "ctrl": 59,
+})
+KEY_ALIASES = MappingProxyType({
+    "cmd": "command", "alt": "option", "control": "ctrl", "escape": "esc",
+})
+# Modifier -> Quartz event-flag mask name; held modifiers flag every event.
+_MODIFIER_FLAGS = {
+    "command": "kCGEventFlagMaskCommand",
+    "shift": "kCGEventFlagMaskShift",
+    "option": "kCGEventFlagMaskAlternate",
+    "ctrl": "kCGEventFlagMaskControl",
+}
+
+# Every Quartz event below is posted on kCGHIDEventTap, so clicks and
+# keystrokes from different helpers reach the system in the order sent.
+def _click(x: int, y: int, double: bool = False, glide: float = 0.2) -> None:
+    """Left-click at (x, y): native mouse events, or a pyautogui move + click."""
+    if not CLICK_HUMANIZE and Quartz is not None:
+        point = (x, y)
+        button = Quartz.kCGMouseButtonLeft
+        Quartz.CGEventPost(
+            Quartz.kCGHIDEventTap,
+            Quartz.CGEventCreateMouseEvent(None, Quartz.kCGEventMouseMoved, point, button),
+        )
+        for click_state in ((1, 2) if double else (1,)):
+            for kind in (Quartz.kCGEventLeftMouseDown, Quartz.kCGEventLeftMouseUp):
+                event = Quartz.CGEventCreateMouseEvent(None, kind, point, button)
+                Quartz.CGEventSetIntegerValueField(event, Quartz.kCGMouseEventClickState, click_state)
+                Quartz.CGEventPost(Quartz.kCGHIDEventTap, event)
+        return
+    if pyautogui is None:
+        raise RuntimeError(f"pyautogui unavailable ({_pyautogui_error})")
+    pyautogui.moveTo(x, y, duration=glide)
+    if double:
+        pyautogui.doubleClick()
+    else:
+        pyautogui.click()
+
+
+def _key_name(key: str) -> str:
+    return KEY_ALIASES.get(key, key)
+
+
+def _post_keys(steps: list) -> None:
+    """Post (key name, is_down) events via Quartz, flagging held modifiers."""
+    held = 0
+    for key, down in steps:
+        mask = getattr(Quartz, _MODIFIER_FLAGS[key]) if key in _MODIFIER_FLAGS else 0
+        held = held | mask if down else held & ~mask
+        event = Quartz.CGEventCreateKeyboardEvent(None, KEYCODE_MAP[key], down)
+        Quartz.CGEventSetFlags(event, held)
+        Quartz.CGEventPost(Quartz.kCGHIDEventTap, event)
+
+
+def _post_text(text: str, interval: float) -> None:
+    """Type text as CGEvent keystrokes, one down/up pair per character."""
+    for ch in text:
+        keycode = _KEYCODES.get(ch)
+        for down in (True, False):
+            event = Quartz.CGEventCreateKeyboardEvent(None, keycode or 0, down)
+            if keycode is None:
+                Quartz.CGEventKeyboardSetUnicodeString(event, len(ch.encode("utf-16-le")) // 2, ch)
+            Quartz.CGEventPost(Quartz.kCGHIDEventTap, event)
+        if interval:
+            time.sleep(interval)
 
 @tool
 def system_click(element_description: str) -> str:
@@ -37,11 +148,8 @@ def system_click(element_description: str) -> str:
         x, y = map(int, coords_str.split(","))
         
         # 2. Click
-        if pyautogui is None:
-            return f"Click Error: pyautogui unavailable ({_pyautogui_error})"
-        # Move smooth to look natural and give user time to abort (Move mouse to corner)
-        pyautogui.moveTo(x, y, duration=0.5) 
-        pyautogui.click()
+        _click(x, y, glide=0.5)
+        invalidate_vision_cache()
         
         return f"Clicked on {element_description} at ({x}, {y})"
     except Exception as e:
@@ -56,9 +164,13 @@ def system_type(text: str) -> str:
         text: The text to type.
     """
     try:
-        if pyautogui is None:
+        if Quartz is not None:
+            _post_text(text, TYPE_INTERVAL)
+        elif pyautogui is None:
             return f"Type Error: pyautogui unavailable ({_pyautogui_error})"
-        pyautogui.write(text, interval=0.05) # Slower typing to prevent skipped keys
+        else:
+            pyautogui.write(text, interval=0.05) # Slower typing to prevent skipped keys
+        invalidate_vision_cache()
         return f"Typed: {text}"
     except Exception as e:
         return f"Type Error: {str(e)}"
@@ -74,17 +186,38 @@ def system_click_at(x: int, y: int, double: bool = False) -> str:
         double: Whether to double-click.
     """
     try:
-        if pyautogui is None:
-            return f"Click Error: pyautogui unavailable ({_pyautogui_error})"
-        pyautogui.moveTo(x, y, duration=0.2)
-        if double:
-            pyautogui.doubleClick()
-        else:
-            pyautogui.click()
+        _click(x, y, double=double)
+        invalidate_vision_cache()
         return f"Clicked at ({x}, {y})"
     except Exception as e:
         return f"Click Error: {str(e)}"
 
+def _app_running(app_name: str) -> bool:
+    """Whether a process for app_name is running, memoizing the pid pgrep finds."""
+    cached = _app_pid_cache.get(app_name)
+    if cached and time.monotonic() - cached[1] < APP_PID_TTL_S:
+        try:
+            os.kill(cached[0], 0)
+            return True
+        except PermissionError:
+            return True  # alive, just not ours to signal
+        except OSError:
+            pass
+    _app_pid_cache.pop(app_name, None)
+
+    # Fuzzy match: the name without an "Apple "/"Google " prefix (e.g.
+    # "Apple Music" -> "Music") is a substring of the full name, so one pgrep
+    # on it covers both.
+    simple_name = app_name.replace("Apple ", "").replace("Google ", "").strip()
+    verify = subprocess.run(["pgrep", "-f", re.escape(simple_name)], capture_output=True)
+    if verify.returncode != 0:
+        return False
+    pids = verify.stdout.split()
+    if pids:
+        _app_pid_cache[app_name] = (int(pids[0]), time.monotonic())
+    return True
+
+
 @tool
 def open_app(app_name: str, url: str = None) -> str:
     """
@@ -104,14 +237,8 @@ def open_app(app_name: str, url: str = None) -> str:
         time.sleep(2)
         
         # Verify app is actually running
-        # Fuzzy match: try pgrep -f first check exact, then loosen
-        verify = subprocess.run(["pgrep", "-f", app_name], capture_output=True)
-        if verify.returncode != 0:
-            # Try simpler name (e.g. "Apple Music" -> "Music")
-            simple_name = app_name.replace("Apple ", "").replace("Google ", "").strip()
-            verify_simple = subprocess.run(["pgrep", "-f", simple_name], capture_output=True)
-            if verify_simple.returncode != 0:
-                return f"Error: Command sent, but '{app_name}' process not found running."
+        if not _app_running(app_name):
+            return f"Error: Command sent, but '{app_name}' process not found running."
             
         session_context.update_app(app_name)
         if url:
@@ -130,6 +257,45 @@ def open_app(app_name: str, url: str = None) -> str:
     except Exception as e:
         return f"System Error: {str(e)}"
 
+def system_chord(keys_sequence: list) -> str:
+    """
+    Posts a sequence of (key, "down" | "up") events in one go, e.g.
+    [("cmd", "down"), ("a", "down"), ("a", "up"), ("cmd", "up")].
+    """
+    try:
+        steps = [(_key_name(key), state == "down") for key, state in keys_sequence]
+        if Quartz is not None:
+            _post_keys(steps)
+        elif pyautogui is None:
+            return f"Chord Error: pyautogui unavailable ({_pyautogui_error})"
+        else:
+            for key, down in steps:
+                (pyautogui.keyDown if down else pyautogui.keyUp)(key)
+        invalidate_vision_cache()
+        return f"Pressed chord: {' '.join(f'{k}:{s}' for k, s in keys_sequence)}"
+    except Exception as e:
+        return f"Chord Error: {str(e)}"
+
+
+def system_key_burst(key: str, count: int) -> str:
+    """Press `key` `count` times back to back, with no pause between presses."""
+    try:
+        key = _key_name(key)
+        if Quartz is not None and key in KEYCODE_MAP:
+            keycode = KEYCODE_MAP[key]
+            for _ in range(count):
+                for down in (True, False):
+                    Quartz.CGEventPost(Quartz.kCGHIDEventTap, Quartz.CGEventCreateKeyboardEvent(None, keycode, down))
+        elif pyautogui is None:
+            return f"Key Error: pyautogui unavailable ({_pyautogui_error})"
+        else:
+            pyautogui.press(key, presses=count, interval=0)
+        invalidate_vision_cache()
+        return f"Pressed key: {key} x{count}"
+    except Exception as e:
+        return f"Key Error: {str(e)}"
+
+
 @tool
 def system_hotkey(keys: list[str]) -> str:
     """
@@ -139,7 +305,12 @@ def system_hotkey(keys: list[str]) -> str:
         keys: List of keys to press together.
     """
     try:
-        pyautogui.hotkey(*keys)
+        names = [_key_name(k) for k in keys]
+        if Quartz is not None and all(n in KEYCODE_MAP for n in names):
+            _post_keys([(n, True) for n in names] + [(n, False) for n in reversed(names)])
+        else:
+            pyautogui.hotkey(*keys)
+        invalidate_vision_cache()
         return f"Pressed hotkey: {'+'.join(keys)}"
     except Exception as e:
         return f"Hotkey Error: {str(e)}"
@@ -153,7 +324,12 @@ def system_press(key: str) -> str:
         key: The key to press.
     """
     try:
-        pyautogui.press(key)
+        name = _key_name(key)
+        if Quartz is not None and name in KEYCODE_MAP:
+            _post_keys([(name, True), (name, False)])
+        else:
+            pyautogui.press(key)
+        invalidate_vision_cache()
         return f"Pressed key: {key}"
     except Exception as e:
         return f"Key Error: {str(e)}"
@@ -1,49 +1,140 @@
+import os
+import signal
 import subprocess
 import shlex
+import threading
+from collections import deque
 from smolagents import tool
 from typing import Optional
 
 TRUNCATION_LIMIT = 2000
 TRUNCATION_MESSAGE = "\n... [Output truncated. Total lines: {total}. Use 'read_last_lines' or 'grep' to see more.]"
 
+# Head + Tail Strategy: lines kept from each end of truncated output.
+HEAD_LINES = 1500
+TAIL_LINES = 500
+
+COMMAND_TIMEOUT_S = 300
+
+
+class _StreamCapture:
+    """
+    Reads a pipe line by line, keeping only its first HEAD_LINES and last
+    TAIL_LINES lines (all of them with keep_all), so memory stays bounded
+    however much a command prints.
+    """
+
+    def __init__(self, keep_all: bool = False):
+        self.head = []
+        self.tail = deque(maxlen=None if keep_all else TAIL_LINES)
+        self.total = 0
+        # A background grandchild (`cmd &`) can keep the pipe open, and the
+        # reader running, after run_terminal has stopped waiting.
+        self._lock = threading.Lock()
+
+    def drain(self, stream) -> None:
+        for line in stream:
+            with self._lock:
+                self.total += 1
+                if len(self.head) < HEAD_LINES:
+                    self.head.append(line)
+                else:
+                    self.tail.append(line)
+        stream.close()
+
+    def snapshot(self) -> tuple:
+        """(lines, total) as of now, consistent with each other."""
+        with self._lock:
+            return self.head + list(self.tail), self.total
+
+
+def _kill_tree(pid: int) -> None:
+    """SIGKILL `pid` and every process descended from it."""
+    tree, frontier = [pid], [pid]
+    while frontier:
+        found = subprocess.run(
+            ["pgrep", "-P", ",".join(map(str, frontier))], capture_output=True, text=True
+        ).stdout.split()
+        frontier = [int(child) for child in found]
+        tree.extend(frontier)
+    for member in tree:
+        try:
+            os.kill(member, signal.SIGKILL)
+        except OSError:
+            pass  # already gone
+
+
 @tool
 def run_terminal(command: str, read_all: bool = False) -> str:
     """
     Executes a command in the terminal and returns the output.
-    
+
     Args:
         command: The shell command to execute.
         read_all: If True, ignores the 2000-line limit (Use with caution!).
     """
     try:
-        # We use a large timeout to allow builds, but not infinite
-        result = subprocess.run(
+        proc = subprocess.Popen(
             command,
             shell=True,
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
             text=True,
-            timeout=300 # 5 minutes max per command
+            errors="replace",
         )
-        
+        out, err = _StreamCapture(read_all), _StreamCapture(read_all)
+        readers = [
+            threading.Thread(target=capture.drain, args=(stream,), daemon=True)
+            for capture, stream in ((out, proc.stdout), (err, proc.stderr))
+        ]
+        for reader in readers:
+            reader.start()
+
+        # We use a large timeout to allow builds, but not infinite
+        try:
+            proc.wait(timeout=COMMAND_TIMEOUT_S)
+        except BaseException:
+            # Timeout or Ctrl+C: kill the shell and its children, so none are
+            # left running or holding the pipes. The command stays in ARKA's
+            # session and process group, so /dev/tty prompts (sudo, ssh, git)
+            # still reach the user.
+            _kill_tree(proc.pid)
+            proc.wait()
+            raise
+        finally:
+            for reader in readers:
+                reader.join(timeout=5)
+
+        out_lines, out_total = out.snapshot()
+        err_lines, err_total = err.snapshot()
+
         # Combine stdout and stderr
-        output = result.stdout
-        if result.stderr:
-            output += f"\n[STDERR]\n{result.stderr}"
-            
-        # Truncation Logic
-        lines = output.splitlines()
-        total_lines = len(lines)
-        
-        if not read_all and total_lines > TRUNCATION_LIMIT:
-            # Head + Tail Strategy: Keep first 1500 and last 500
-            head = lines[:1500]
-            tail = lines[-500:]
-            truncated_output = "\n".join(head)
-            truncated_output += TRUNCATION_MESSAGE.format(total=total_lines)
-            truncated_output += "\n" + "\n".join(tail)
-            return truncated_output
-            
-        return output
+        total_lines = out_total
+        # "\n[STDERR]\n" after stdout opens an empty line unless stdout ends
+        # mid-line.
+        stderr_gap = not out_lines or out_lines[-1].endswith("\n")
+        if err_total:
+            total_lines += err_total + 1
+            if stderr_gap:
+                total_lines += 1
+
+        if read_all or total_lines <= TRUNCATION_LIMIT:
+            output = "".join(out_lines)
+            if err_total:
+                output += "\n[STDERR]\n" + "".join(err_lines)
+            return output
+
+        # Truncation Logic: the same head/tail over stdout, marker, stderr
+        lines = [line.rstrip("\n") for line in out_lines]
+        if err_total:
+            if stderr_gap:
+                lines.append("")
+            lines.append("[STDERR]")
+            lines.extend(line.rstrip("\n") for line in err_lines)
+        truncated_output = "\n".join(lines[:HEAD_LINES])
+        truncated_output += TRUNCATION_MESSAGE.format(total=total_lines)
+        truncated_output += "\n" + "\n".join(lines[-TAIL_LINES:])
+        return truncated_output
 
     except subprocess.TimeoutExpired:
         return "Error: Command timed out after 300 seconds."
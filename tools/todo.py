@@ -3,59 +3,137 @@ import json
 import os
 from typing import List, Dict
 import structlog
-from rich.console import Console
-from rich.table import Table
+
+try:
+    import orjson
+except ImportError:  # optional: json is used without it
+    orjson = None
 
 logger = structlog.get_logger()
 TODO_FILE = os.path.expanduser("~/.arka/todos.json")
 
+# Mutations are appended to this log (one JSON op per line) instead of
+# rewriting TODO_FILE; the snapshot is rewritten, atomically, only once the
+# log outgrows COMPACT_FACTOR x the task count.
+TODO_LOG = TODO_FILE + ".log"
+COMPACT_FACTOR = 4
+
+# list_tasks also prints a Rich table to the console when set.
+RICH_DEBUG = os.getenv("ARKA_RICH_DEBUG", "0") == "1"
+
+
+def _dumps(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def _loads(data):
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
 class TodoManager:
+    __slots__ = ("todos", "_log_len")
+
     def __init__(self):
         self.todos: List[Dict] = []
+        self._log_len = 0
         self._load()
 
     def _load(self):
+        self.todos = []
+        self._log_len = 0
         if os.path.exists(TODO_FILE):
              try:
-                 with open(TODO_FILE, 'r') as f:
-                     self.todos = json.load(f)
-             except:
+                 with open(TODO_FILE, 'rb') as f:
+                     self.todos = _loads(f.read())
+             except Exception as e:
+                 # The log only makes sense on top of this snapshot, and a
+                 # replay or compaction over an empty list would drop its
+                 # entries. Keep both aside for recovery and start empty.
+                 logger.warning("todo_snapshot_unreadable", error=str(e), moved_to=TODO_FILE + ".corrupt")
                  self.todos = []
-    
-    def _save(self):
+                 os.replace(TODO_FILE, TODO_FILE + ".corrupt")
+                 if os.path.exists(TODO_LOG):
+                     os.replace(TODO_LOG, TODO_LOG + ".corrupt")
+        if os.path.exists(TODO_LOG):
+            torn = False
+            with open(TODO_LOG, 'rb') as f:
+                for line in f:
+                    try:
+                        self._apply(_loads(line))
+                    except Exception:
+                        torn = True  # partial line from a crash mid-append
+                        continue
+                    self._log_len += 1
+            if torn:
+                # Rewrite now so later appends don't land on the partial line.
+                self._compact()
+
+    def _apply(self, op: Dict):
+        # Replays are idempotent: an add carries the index it was given, so a
+        # log that survived a compaction doesn't add its tasks twice.
+        if op["op"] == "add" and op["idx"] == len(self.todos):
+            self.todos.append({"task": op["task"], "done": False})
+        elif op["op"] == "done" and 0 <= op["idx"] < len(self.todos):
+            self.todos[op["idx"]]['done'] = True
+
+    def _append(self, op: Dict):
         os.makedirs(os.path.dirname(TODO_FILE), exist_ok=True)
-        with open(TODO_FILE, 'w') as f:
-            json.dump(self.todos, f)
+        with open(TODO_LOG, 'ab') as f:
+            f.write(_dumps(op) + b"\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self._log_len += 1
+        if self._log_len > COMPACT_FACTOR * len(self.todos):
+            self._compact()
+
+    def _compact(self):
+        """Write the full list to TODO_FILE atomically, then start a fresh log."""
+        tmp = TODO_FILE + ".tmp"
+        with open(tmp, 'wb') as f:
+            f.write(_dumps(self.todos))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, TODO_FILE)
+        open(TODO_LOG, 'wb').close()
+        self._log_len = 0
 
     def add(self, task: str):
-        self.todos.append({"task": task, "done": False})
-        self._save()
+        op = {"op": "add", "idx": len(self.todos), "task": task}
+        self._apply(op)
+        self._append(op)
         return f"Added task: {task}"
 
     def list_tasks(self) -> str:
         if not self.todos:
             return "No tasks."
         
-        # Use Rich for pretty printing to console, but return text for LLM
-        table = Table(title="Current Tasks")
-        table.add_column("Status", style="cyan", no_wrap=True)
-        table.add_column("Task", style="white")
-
-        text_output = []
-        for i, t in enumerate(self.todos):
-            status = "✅" if t['done'] else "[ ]"
-            table.add_row(status, f"{i}. {t['task']}")
-            text_output.append(f"{i}. [{status}] {t['task']}")
-        
-        console = Console()
-        console.print(table)
-        
+        text_output = [f"{i}. [{'✅' if t['done'] else '[ ]'}] {t['task']}" for i, t in enumerate(self.todos)]
+
+        if RICH_DEBUG:
+            # Rich table on the console for debugging; the LLM gets the text
+            from rich.console import Console
+            from rich.table import Table
+
+            table = Table(title="Current Tasks")
+            table.add_column("Status", style="cyan", no_wrap=True)
+            table.add_column("Task", style="white")
+            for i, t in enumerate(self.todos):
+                table.add_row("✅" if t['done'] else "[ ]", f"{i}. {t['task']}")
+            Console().print(table)
+
         return "\n".join(text_output)
 
+    def contains(self, needle: str) -> bool:
+        """True if any task's text contains `needle` (in-memory, no disk read)."""
+        return any(needle in t.get("task", "") for t in self.todos)
+
     def complete(self, index: int):
         if 0 <= index < len(self.todos):
-            self.todos[index]['done'] = True
-            self._save()
+            op = {"op": "done", "idx": index}
+            self._apply(op)
+            self._append(op)
             return f"Marked task {index} as done."
         return "Invalid task index."
 
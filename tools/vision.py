@@ -1,10 +1,138 @@
 from smolagents import tool
 from core.vision_client import vision_client
 import subprocess
+import hashlib
 import os
 import time
 
+try:
+    # PyObjC (installed with pyautogui on macOS): capture and JPEG-encode in
+    # process instead of spawning screencapture and going through a file.
+    import Quartz  # type: ignore
+    from Foundation import NSMutableData  # type: ignore
+except Exception:
+    Quartz = None
+
+# screencapture fallback target when Quartz is unavailable.
 SCREENSHOT_PATH = "/tmp/arka_vision_screenshot.jpg"
+JPEG_QUALITY = 0.7
+# Longest side of the image sent to the vision model. Retina captures are
+# downscaled to this before encoding; coordinates are mapped back.
+VISION_MAX_DIM = 1280
+
+# get_screen_coordinates answers keyed on (description, screen fingerprint):
+# asking again about an unchanged screen skips the vision request. Entries
+# expire after VISION_CACHE_TTL_S, and the input tools in tools.system clear
+# the cache whenever they act on the screen.
+VISION_CACHE_TTL_S = 2.0
+VISION_CACHE_MAX = 64
+_vision_cache: dict = {}
+
+# Back-to-back vision tools within this window share one screenshot.
+CAPTURE_TTL_S = 0.5
+_last_capture = None  # (monotonic time, jpeg bytes, scale)
+
+
+def invalidate_vision_cache() -> None:
+    """Forget cached coordinates and screenshot; call after anything that changes the screen."""
+    global _last_capture
+    _vision_cache.clear()
+    _last_capture = None
+
+
+def _screen_fingerprint(jpeg: bytes) -> tuple:
+    """(blake2b digest, size) of a screenshot; equal means an unchanged screen."""
+    return hashlib.blake2b(jpeg, digest_size=8).digest(), len(jpeg)
+
+
+def _capture(ttl_s: float = CAPTURE_TTL_S) -> tuple:
+    """
+    (screenshot JPEG, scale), reusing the last capture if it is younger than
+    ttl_s. `scale` is image size / screen size; see _unscale.
+    """
+    global _last_capture
+    now = time.monotonic()
+    if _last_capture is not None and now - _last_capture[0] < ttl_s:
+        return _last_capture[1:]
+    jpeg, scale = _capture_screen_jpeg()
+    _last_capture = (now, jpeg, scale)
+    return jpeg, scale
+
+
+def _unscale(value, scale: float) -> int:
+    """Map a coordinate in the (downscaled) screenshot back to full size."""
+    return int(round(float(value) / scale))
+
+
+def _current_fingerprint() -> tuple:
+    """Fingerprint of a fresh screenshot (which later vision calls then reuse)."""
+    return _screen_fingerprint(_capture(ttl_s=0)[0])
+
+
+def _wait_screen_change(prev_fp: tuple, timeout: float = 1.5, interval: float = 0.08) -> bool:
+    """
+    Poll until the screen differs from prev_fp and then settles (two equal
+    frames in a row), so the capture later vision calls reuse isn't a
+    half-drawn one. False if it never changed within timeout.
+    """
+    global _last_capture
+    deadline = time.monotonic() + timeout
+    last = prev_fp
+    while time.monotonic() < deadline:
+        time.sleep(interval)
+        fp = _current_fingerprint()
+        if fp == last and fp != prev_fp:
+            return True
+        last = fp
+    if last == prev_fp:
+        return False
+    # Changed but still moving: make the next lookup take a new screenshot.
+    _last_capture = None
+    return True
+
+
+def _downscale(image):
+    """(image, scale) with the longest side at most VISION_MAX_DIM."""
+    width, height = Quartz.CGImageGetWidth(image), Quartz.CGImageGetHeight(image)
+    if max(width, height) <= VISION_MAX_DIM:
+        return image, 1.0
+    scale = VISION_MAX_DIM / max(width, height)
+    w, h = max(1, round(width * scale)), max(1, round(height * scale))
+    ctx = Quartz.CGBitmapContextCreate(
+        None, w, h, 8, 0, Quartz.CGColorSpaceCreateDeviceRGB(), Quartz.kCGImageAlphaNoneSkipLast
+    )
+    if ctx is None:
+        return image, 1.0
+    Quartz.CGContextSetInterpolationQuality(ctx, Quartz.kCGInterpolationMedium)
+    Quartz.CGContextDrawImage(ctx, Quartz.CGRectMake(0, 0, w, h), image)
+    return Quartz.CGBitmapContextCreateImage(ctx), w / width
+
+
+def _capture_screen_jpeg() -> tuple:
+    """
+    (JPEG, scale) of the main display, the image `screencapture -x` takes,
+    downscaled for the vision model when Quartz is available.
+    """
+    if Quartz is not None:
+        image = Quartz.CGDisplayCreateImage(Quartz.CGMainDisplayID())
+        if image is not None:
+            image, scale = _downscale(image)
+            data = NSMutableData.data()
+            dest = Quartz.CGImageDestinationCreateWithData(data, "public.jpeg", 1, None)
+            if dest is not None:
+                Quartz.CGImageDestinationAddImage(
+                    dest, image, {Quartz.kCGImageDestinationLossyCompressionQuality: JPEG_QUALITY}
+                )
+                if Quartz.CGImageDestinationFinalize(dest):
+                    return bytes(data), scale
+
+    # -x: no sound, -t jpg: format
+    if os.path.exists(SCREENSHOT_PATH):
+        os.remove(SCREENSHOT_PATH)
+    subprocess.run(["screencapture", "-x", "-t", "jpg", SCREENSHOT_PATH], check=True)
+    with open(SCREENSHOT_PATH, "rb") as f:
+        return f.read(), 1.0
+
 
 @tool
 def get_screen_coordinates(description: str) -> str:
@@ -16,22 +144,45 @@ def get_screen_coordinates(description: str) -> str:
         description: Text description of what to find (e.g. "The Play button", "Chrome Icon").
     """
     # 1. Capture Screenshot
-    # We use 'screencapture' (native macOS) as it's faster than pyautogui for full screen
-    # -x: no sound, -t jpg: format
-    if os.path.exists(SCREENSHOT_PATH):
-        os.remove(SCREENSHOT_PATH)
-        
-    cmd = f"screencapture -x -t jpg {SCREENSHOT_PATH}"
-    subprocess.run(cmd, shell=True, check=True)
-    
-    # 2. Ask Vision Client
+    screenshot, scale = _capture()
+
+    # 2. Reuse the answer if this screen was already asked about
+    key = (description, _screen_fingerprint(screenshot))
+    now = time.monotonic()
+    hit = _vision_cache.get(key)
+    if hit is not None and now - hit[0] < VISION_CACHE_TTL_S:
+        return hit[1]
+
+    # 3. Ask Vision Client
     try:
-        x, y = vision_client.get_coordinates(SCREENSHOT_PATH, description)
-        return f"{x},{y}"
+        x, y = vision_client.get_coordinates(screenshot, description)
+        coords = f"{_unscale(x, scale)},{_unscale(y, scale)}"
+        if len(_vision_cache) >= VISION_CACHE_MAX:
+            _vision_cache.clear()
+        _vision_cache[key] = (now, coords)
+        return coords
     except Exception as e:
         return f"Error locating element: {str(e)}"
 
 
+def get_screen_coordinates_multi(descriptions: list[str]) -> dict:
+    """
+    One screenshot and one vision request for several elements on the same
+    screen. Returns {description: "x,y" or an "Error ..." string}, in the
+    format get_screen_coordinates uses.
+    """
+    screenshot, scale = _capture()
+
+    try:
+        found = vision_client.get_coordinates_multi(screenshot, descriptions)
+    except Exception as e:
+        return {d: f"Error locating element: {str(e)}" for d in descriptions}
+    return {
+        d: f"{_unscale(xy[0], scale)},{_unscale(xy[1], scale)}" if xy else f"Error locating element: '{d}' not found"
+        for d, xy in found.items()
+    }
+
+
 @tool
 def find_text_on_screen(query: str, region_hint: str = "top section") -> str:
     """
@@ -41,21 +192,17 @@ def find_text_on_screen(query: str, region_hint: str = "top section") -> str:
         query: The text to find (e.g. song name).
         region_hint: A hint like "top section", "left side", or "full screen".
     """
-    if os.path.exists(SCREENSHOT_PATH):
-        os.remove(SCREENSHOT_PATH)
-
-    cmd = f"screencapture -x -t jpg {SCREENSHOT_PATH}"
-    subprocess.run(cmd, shell=True, check=True)
+    screenshot, scale = _capture()
 
     try:
-        result = vision_client.find_text(SCREENSHOT_PATH, query, region_hint=region_hint)
+        result = vision_client.find_text(screenshot, query, region_hint=region_hint)
         if not result.get("found"):
             return "NOT_FOUND"
         text = result.get("text", "")
         x = result.get("x")
         y = result.get("y")
         if x is not None and y is not None:
-            return f"FOUND: {text} at {x},{y}"
+            return f"FOUND: {text} at {_unscale(x, scale)},{_unscale(y, scale)}"
         return f"FOUND: {text}"
     except Exception as e:
         return f"Error finding text: {str(e)}"
@@ -70,22 +217,19 @@ def find_and_click_text_on_screen(query: str, region_hint: str = "top section")
         query: The text to find (e.g. song name).
         region_hint: A hint like "top section", "left side", or "full screen".
     """
-    if os.path.exists(SCREENSHOT_PATH):
-        os.remove(SCREENSHOT_PATH)
-
-    cmd = f"screencapture -x -t jpg {SCREENSHOT_PATH}"
-    subprocess.run(cmd, shell=True, check=True)
+    screenshot, scale = _capture()
 
     try:
         from tools.system import system_click_at
-        result = vision_client.find_text(SCREENSHOT_PATH, query, region_hint=region_hint)
+        result = vision_client.find_text(screenshot, query, region_hint=region_hint)
         if not result.get("found"):
             return "NOT_FOUND"
         x = result.get("x")
         y = result.get("y")
         if x is None or y is None:
             return "FOUND_BUT_NO_COORDS"
-        click_res = system_click_at(int(x), int(y))
+        x, y = _unscale(x, scale), _unscale(y, scale)
+        click_res = system_click_at(x, y)
         return f"CLICKED: {result.get('text', query)} at {x},{y} | {click_res}"
     except Exception as e:
         return f"Error finding/clicking text: {str(e)}"